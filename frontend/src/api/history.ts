@@ -23,6 +23,55 @@ export interface DDLQueryHistoryResponse {
   reg_user_id: number;
 }
 
+// 통합 히스토리 타임라인 (history_type으로 항목 유형 구분, id는 유형 안에서만 고유)
+interface HistoryTimelineItemBase {
+  id: number;
+  question_preview: string;
+  success: boolean;
+  reg_date: string;
+  end_date: string | null;
+  duration: number | null;
+}
+
+export interface DatabaseQueryTimelineItem extends HistoryTimelineItemBase {
+  history_type: 'database';
+  connection_id: string;
+}
+
+export interface DDLQueryTimelineItem extends HistoryTimelineItemBase {
+  history_type: 'ddl';
+  session_id: string;
+}
+
+export type HistoryTimelineItem = DatabaseQueryTimelineItem | DDLQueryTimelineItem;
+
+// 다음 페이지는 응답의 next_cursor를 cursor로 전달, 전체 개수는 getHistoryCount로 조회
+export interface HistoryTimelineRequest {
+  limit?: number;
+  cursor?: string | null;
+  history_type?: HistoryTimelineItem['history_type'];
+}
+
+export interface HistoryTimelineResponse {
+  items: HistoryTimelineItem[];
+  next_cursor: string | null;
+  has_more: boolean;
+  limit: number;
+}
+
+export interface HistoryCountRequest {
+  connection_id?: string;
+  ddl_session_id?: string;
+  start_date?: string;
+  end_date?: string;
+}
+
+export interface HistoryCountResponse {
+  total_count: number;
+  database_query_count: number;
+  ddl_query_count: number;
+}
+
 export interface DatabaseQueryHistoryCreateRequest {
   connection_id: string;
   question: string;
@@ -80,6 +129,16 @@ class HistoryApi {
   async deleteDDLQueryHistory(id: number) {
     return client.delete<DDLQueryHistoryResponse>(`/history/ddl-query/${id}`);
   }
+
+  // 통합 히스토리 타임라인 (데이터베이스 + DDL 최신순)
+  async getHistoryTimeline(params: HistoryTimelineRequest = {}) {
+    return client.post<HistoryTimelineResponse>('/history/database-query/all/timeline', params);
+  }
+
+  // 통합 히스토리 유형별 개수
+  async getHistoryCount(params: HistoryCountRequest = {}) {
+    return client.post<HistoryCountResponse>('/history/database-query/all/count', params);
+  }
 }
 
 export default new HistoryApi(); 
\ No newline at end of file
@@ -9,7 +9,9 @@ const queryStream = (params: any, onChunk: any, onDone: any, onError: any) => {
         method: 'POST',
         headers: {
             'Content-Type': 'application/json',
-            'Authorization': `Bearer ${localStorage.getItem('accessToken')}`
+            'Authorization': `Bearer ${localStorage.getItem('accessToken')}`,
+            // 게이트웨이가 본문을 파싱하지 않고 세션을 식별할 수 있도록 헤더로도 전달
+            ...(params?.ddl_session_id ? { 'X-Session-Id': params.ddl_session_id } : {})
         },
         credentials: 'include',
         body: JSON.stringify(params)
@@ -22,15 +24,29 @@ const queryStream = (params: any, onChunk: any, onDone: any, onError: any) => {
             const reader = response.body.getReader()
             const decoder = new TextDecoder()
             let result = ''
+            let buffer = ''
+            // SSE 이벤트는 빈 줄로 구분되고, 여러 data: 줄은 줄바꿈으로 이어 붙인다
+            const emitEvent = (event: string) => {
+                const dataLines = event
+                    .split('\n')
+                    .filter(line => line.startsWith('data:'))
+                    .map(line => line.slice(5).replace(/^ /, ''))
+                if (dataLines.length === 0) return
+                const chunk = dataLines.join('\n')
+                result += chunk
+                if (onChunk) onChunk(chunk)
+            }
             function read() {
             reader.read().then(({ done, value }) => {
                 if (done) {
+                if (buffer.trim()) emitEvent(buffer)
                 if (onDone) onDone(result)
                 return
                 }
-                const chunk = decoder.decode(value, { stream: true }).replace(/^data: /, '')
-                result += chunk
-                if (onChunk) onChunk(chunk)
+                buffer += decoder.decode(value, { stream: true }).replace(/\r\n/g, '\n')
+                const events = buffer.split('\n\n')
+                buffer = events.pop() ?? ''
+                events.forEach(emitEvent)
                 read()
             }).catch(err => {
                 if (onError) onError(err)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+로그인 폭주(login storm) 중 auth_service /me 지연 시간 측정 스크립트
+
+auth_service 라우터를 그대로 올린 앱에 /me 요청을 일정한 동시성으로 계속 보내면서,
+중간에 bcrypt 검증이 필요한 /login 요청을 한꺼번에 몰아 넣습니다.
+비밀번호 검증 방식별로 평상시와 폭주 중의 /me p50/p99를 비교합니다.
+- inline: 이벤트 루프에서 바로 bcrypt 검증 (이전 방식)
+- thread / process: PasswordExecutor의 스레드 풀 / 프로세스 풀
+DB 조회(사용자/세션)는 고정값을 반환하도록 대체하므로 bcrypt 비용만 드러납니다.
+워커 수는 CPU 코어 수보다 적게 두어야 이벤트 루프가 쓸 코어가 남습니다.
+
+사용법:
+    python scripts/benchmark/login_storm.py --logins 100 --workers 4 --me-concurrency 8
+    # 1코어 환경
+    python scripts/benchmark/login_storm.py --logins 20 --workers 1 --me-concurrency 4 --me-interval 0.1
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+SERVICES_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "services")
+sys.path[:0] = [SERVICES_ROOT, os.path.join(SERVICES_ROOT, "auth_service", "app")]
+for name, value in (("DB_USERNAME", "bench"), ("DB_PASSWORD", "bench"), ("DB_HOST", "localhost"), ("DB_PORT", "3306"), ("DB_NAME", "bench")):
+    os.environ.setdefault(name, value)
+
+import httpx
+from fastapi import FastAPI
+
+import api.auth_router as auth_router
+import core.security as security
+import services.auth_service as auth_service
+from core.password_executor import PasswordExecutor, hash_password_sync, verify_password_sync
+from schemas.user import UserModel
+
+logging.disable(logging.CRITICAL)
+
+EMAIL = "bench@queryme.io"
+PASSWORD = "bench-password"
+USER = UserModel(id=1, email=EMAIL, role="user", is_active=True)
+
+
+def install_stubs(hashed_password: str):
+    """사용자/세션 조회를 고정값으로 대체"""
+    async def authenticate_user(email: str):
+        return SimpleNamespace(id=1, email=email, role="user", is_active=True, hashed_password=hashed_password)
+
+    async def create_session(user_id: int) -> str:
+        return str(uuid.uuid4())
+
+    async def get_user_session_ids(user_id: int) -> list[str]:
+        return []
+
+    async def get_session_user(session_id: str):
+        return USER, datetime.now() + timedelta(hours=1)
+
+    auth_service.authenticate_user = authenticate_user
+    auth_router.create_session = create_session
+    auth_router.get_user_session_ids = get_user_session_ids
+    security.get_session_user_cached = get_session_user
+
+
+def use_verifier(mode: str, workers: int, max_pending: int):
+    """auth_service가 사용할 비밀번호 검증 함수를 모드별로 교체하고 executor를 반환"""
+    if mode == "inline":
+        async def verify_password(plain, hashed):
+            return verify_password_sync(plain, hashed)
+        auth_service.verify_password = verify_password
+        return None
+
+    executor = PasswordExecutor(kind=mode, workers=workers, max_pending=max_pending)
+    auth_service.verify_password = executor.verify
+    return executor
+
+
+async def probe_me(client: httpx.AsyncClient, stop: asyncio.Event, samples: list, interval: float):
+    """
+    interval 간격의 고정 일정으로 /me를 보내는 클라이언트
+    이벤트 루프가 막혀 요청을 제때 보내지 못한 시간도 지연에 포함되도록 예정 시각부터 잽니다.
+    """
+    scheduled = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+        response = await client.get("/me", cookies={"session_id": "bench"})
+        response.raise_for_status()
+        samples.append((time.perf_counter() - scheduled) * 1000)
+        scheduled += interval
+
+
+async def login(client: httpx.AsyncClient) -> int:
+    response = await client.post("/login", json={"email": EMAIL, "password": PASSWORD})
+    return response.status_code
+
+
+def summarize(samples: list) -> tuple[float, float]:
+    if len(samples) < 2:
+        return (samples[0], samples[0]) if samples else (0.0, 0.0)
+    quantiles = statistics.quantiles(samples, n=100)
+    return statistics.median(samples), quantiles[98]
+
+
+async def run_mode(app: FastAPI, mode: str, args) -> dict:
+    executor = use_verifier(mode, args.workers, args.max_pending)
+    if executor is not None:
+        await executor.start()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://auth") as client:
+        # 평상시 /me 지연 시간
+        stop = asyncio.Event()
+        baseline: list = []
+        probes = [asyncio.create_task(probe_me(client, stop, baseline, args.me_interval)) for _ in range(args.me_concurrency)]
+        await asyncio.sleep(args.baseline_seconds)
+        stop.set()
+        await asyncio.gather(*probes)
+
+        # 로그인 폭주 중 /me 지연 시간
+        stop = asyncio.Event()
+        storm: list = []
+        probes = [asyncio.create_task(probe_me(client, stop, storm, args.me_interval)) for _ in range(args.me_concurrency)]
+        started = time.perf_counter()
+        codes = await asyncio.gather(*(login(client) for _ in range(args.logins)))
+        storm_seconds = time.perf_counter() - started
+        stop.set()
+        await asyncio.gather(*probes)
+
+    stats = executor.stats() if executor is not None else None
+    if executor is not None:
+        await executor.close()
+    return {
+        "baseline": summarize(baseline),
+        "storm": summarize(storm),
+        "me_requests": len(storm),
+        "logins_ok": sum(1 for code in codes if code == 200),
+        "logins_per_sec": len(codes) / storm_seconds,
+        "queue_p99": stats["queue_ms"]["p99"] if stats else None,
+    }
+
+
+async def main(args):
+    install_stubs(hash_password_sync(PASSWORD))
+    app = FastAPI()
+    app.include_router(auth_router.router)
+
+    print(f"logins={args.logins}, workers={args.workers}, /me concurrency={args.me_concurrency}")
+    print(
+        f"{'mode':<10}{'base p50':>10}{'base p99':>10}{'storm p50':>11}{'storm p99':>11}"
+        f"{'/me reqs':>10}{'login ok':>10}{'login/s':>9}{'queue p99':>11}"
+    )
+    for mode in args.modes:
+        result = await run_mode(app, mode, args)
+        queue_p99 = f"{result['queue_p99']:.1f}" if result["queue_p99"] is not None else "-"
+        print(
+            f"{mode:<10}{result['baseline'][0]:>10.2f}{result['baseline'][1]:>10.2f}"
+            f"{result['storm'][0]:>11.2f}{result['storm'][1]:>11.2f}{result['me_requests']:>10}"
+            f"{result['logins_ok']:>10}{result['logins_per_sec']:>9.1f}{queue_p99:>11}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=100, help="한꺼번에 보낼 로그인 요청 수")
+    parser.add_argument("--workers", type=int, default=4, help="PasswordExecutor 워커 수")
+    parser.add_argument("--max-pending", type=int, default=1000, help="PasswordExecutor 대기 상한")
+    parser.add_argument("--me-concurrency", type=int, default=8, help="동시에 /me를 보내는 클라이언트 수")
+    parser.add_argument("--me-interval", type=float, default=0.05, help="클라이언트별 /me 요청 간격(초)")
+    parser.add_argument("--baseline-seconds", type=float, default=2.0)
+    parser.add_argument("--modes", nargs="+", default=["inline", "thread", "process"], choices=["inline", "thread", "process"])
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Gateway AuthMiddleware / 공통 Tracer 미들웨어의 요청당 오버헤드 측정 스크립트
+
+BaseHTTPMiddleware 기반 이전 구현과 순수 ASGI 구현을 같은 Starlette 앱에 붙여
+ASGI 호출을 직접 반복 실행합니다. 네트워크/서버 비용 없이 미들웨어 비용만 비교합니다.
+/auth/me 조회는 고정된 사용자 정보를 반환하도록 대체합니다.
+
+사용법:
+    cd services
+    python ../scripts/benchmark/middleware_overhead.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+
+SERVICES_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "services")
+sys.path[:0] = [SERVICES_ROOT, os.path.join(SERVICES_ROOT, "gateway", "app")]
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from common.core.middleware.tracer import Tracer
+from core.middleware.auth import AuthMiddleware
+
+# 미들웨어 디버그 로그 출력 비용이 측정에 섞이지 않도록 비활성화
+logging.disable(logging.CRITICAL)
+
+USER_INFO = {"code": 200, "errMsg": "success", "data": {"id": 1, "email": "bench@queryme.io", "role": "user", "is_active": True}}
+STREAM_CHUNKS = 50
+
+
+class LegacyTracer(BaseHTTPMiddleware):
+    """이전 BaseHTTPMiddleware 기반 Tracer"""
+
+    async def dispatch(self, request: Request, call_next):
+        span_id = request.headers.get("x-span-id")
+        new_span_id = str(uuid.uuid4())
+        updated_headers = []
+        for name_bytes, value_bytes in request.scope["headers"]:
+            name = name_bytes.decode("utf-8").lower()
+            if name == "x-span-id":
+                updated_headers.append((b"x-span-id", new_span_id.encode("utf-8")))
+            elif name == "x-parent-span-id":
+                if span_id:
+                    updated_headers.append((b"x-parent-span-id", span_id.encode("utf-8")))
+            else:
+                updated_headers.append((name_bytes, value_bytes))
+        request.scope["headers"] = updated_headers
+        return await call_next(request)
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    """이전 BaseHTTPMiddleware 기반 AuthMiddleware (사용자 조회는 고정값)"""
+
+    async def dispatch(self, request: Request, call_next):
+        user_info_json = json.dumps(USER_INFO, ensure_ascii=False)
+        request.headers.__dict__["_list"].append((b"x-user-info", user_info_json.encode("utf-8")))
+        return await call_next(request)
+
+
+class StubAuthMiddleware(AuthMiddleware):
+    """순수 ASGI AuthMiddleware (사용자 조회는 고정값)"""
+
+    async def _get_user_info(self, request):
+        return USER_INFO
+
+
+async def plain(request: Request):
+    return PlainTextResponse("ok")
+
+
+async def stream(request: Request):
+    async def generate():
+        for i in range(STREAM_CHUNKS):
+            yield f"data: chunk-{i}\n\n"
+    return StreamingResponse(generate(), media_type="text/event-stream")
+
+
+def build_app(middlewares) -> Starlette:
+    app = Starlette(routes=[Route("/plain", plain), Route("/stream", stream)])
+    for middleware in middlewares:
+        app.add_middleware(middleware)
+    return app
+
+
+def make_scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"gateway"),
+            (b"cookie", b"session_id=bench"),
+            (b"x-span-id", b"parent-span"),
+        ],
+        "client": ("127.0.0.1", 10000),
+        "server": ("127.0.0.1", 8080),
+    }
+
+
+async def call(app, path: str) -> int:
+    """ASGI 앱을 한 번 호출하고 전달된 body 메시지 수를 반환"""
+    body_messages = 0
+
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # 응답이 끝날 때까지 연결 유지
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal body_messages
+        if message["type"] == "http.response.body" and message.get("body"):
+            body_messages += 1
+
+    await app(make_scope(path), receive, send)
+    return body_messages
+
+
+async def measure(app, path: str, requests: int) -> tuple[float, int]:
+    for _ in range(min(500, requests)):
+        await call(app, path)
+    started = time.perf_counter()
+    body_messages = 0
+    for _ in range(requests):
+        body_messages = await call(app, path)
+    return (time.perf_counter() - started) / requests * 1_000_000, body_messages
+
+
+async def main(requests: int):
+    variants = {
+        "none": [],
+        "legacy (BaseHTTPMiddleware)": [LegacyTracer, LegacyAuthMiddleware],
+        "asgi": [Tracer, StubAuthMiddleware],
+    }
+    print(f"requests per case: {requests}")
+    print(f"{'variant':<30}{'path':<10}{'us/req':>10}{'overhead':>12}{'body msgs':>12}")
+    baseline = {}
+    for name, middlewares in variants.items():
+        app = build_app(middlewares)
+        for path in ("/plain", "/stream"):
+            per_request, body_messages = await measure(app, path, requests)
+            baseline.setdefault(path, per_request)
+            overhead = per_request - baseline[path]
+            print(f"{name:<30}{path:<10}{per_request:>10.1f}{overhead:>12.1f}{body_messages:>12}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=10000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
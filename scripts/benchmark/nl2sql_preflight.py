@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+NL2SQL 첫 토큰 도달 시간(TTFT) 비교 스크립트 - 사전 작업 순차 실행 vs 동시 실행
+
+connection/ddl_session/history 서비스 호출, 스키마 조회, Gemini 첫 토큰을 지정한 지연 시간으로 대체하고
+이전 구현(모든 사전 작업을 순서대로 대기)과 현재 nl2sql_service의 TTFT를 비교합니다.
+
+사용법:
+    python scripts/benchmark/nl2sql_preflight.py --rtt 20 --schema 80 --llm 300 --requests 20
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+SERVICES_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "services")
+sys.path[:0] = [SERVICES_ROOT, os.path.join(SERVICES_ROOT, "nl2sql_service", "app")]
+for name in ("GOOGLE_GEMINI_API_KEY", "CONNECTION_SERVICE_URL", "DDL_SESSION_SERVICE_URL", "HISTORY_SERVICE_URL"):
+    os.environ.setdefault(name, "http://stub")
+
+from icecream import ic
+
+from schemas.request import NL2SQLRequest
+from services import nl2sql_service as service
+from utils.answer_cache import answer_cache
+from utils.write_behind import write_behind_queue
+
+logging.disable(logging.CRITICAL)
+ic.disable()
+
+LATENCY = {"rtt": 0.02, "schema": 0.08, "llm": 0.3}
+
+
+async def rtt():
+    await asyncio.sleep(LATENCY["rtt"])
+
+
+class StubDDLSessionClient:
+    def __init__(self, *args):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def get_session(self, session_id):
+        await rtt()
+        return {"data": None}
+
+    async def create_session(self, title, session_id):
+        await rtt()
+        return {"data": {"id": session_id}}
+
+    async def update_session_title(self, session_id, title):
+        await rtt()
+        return {"data": {"id": session_id}}
+
+
+class StubHistoryClient(StubDDLSessionClient):
+    async def create_database_query_history(self, **kwargs):
+        await rtt()
+        return {"data": {"id": 1}}
+
+    async def create_ddl_query_history(self, **kwargs):
+        await rtt()
+        return {"data": {"id": 1}}
+
+    async def bulk_database_query_history(self, creates=None, updates=None):
+        await rtt()
+        return {"data": {"results": [
+            {"operation": "update", "index": index, "id": update["id"], "success": True}
+            for index, update in enumerate(updates or [])
+        ]}}
+
+    async def bulk_ddl_query_history(self, creates=None, updates=None):
+        return await self.bulk_database_query_history(creates, updates)
+
+
+class StubSnapshot:
+    schema_info = {"orders": [{'field': 'id', 'type': 'int', 'null': 'NO', 'key': 'PRI', 'default': None, 'extra': ''}]}
+    schema_text = "CREATE TABLE orders (id int NOT NULL PRIMARY KEY);"
+    index = None
+
+
+async def stub_get_connection_info(**kwargs):
+    await rtt()
+    return {"data": {"id": kwargs["connection_id"]}}
+
+
+async def stub_get_database_schema(connection_info, refresh=False):
+    await asyncio.sleep(LATENCY["schema"])
+    return StubSnapshot()
+
+
+async def stub_stream_gemini(prompt):
+    await asyncio.sleep(LATENCY["llm"])
+    for i in range(5):
+        yield f"SELECT {i}"
+
+
+def install_stubs():
+    service.DDLSessionClient = StubDDLSessionClient
+    service.HistoryClient = StubHistoryClient
+    service.get_connection_info = stub_get_connection_info
+    service.get_database_schema = stub_get_database_schema
+    service.get_prompt_schema = lambda snapshot, request: snapshot.schema_text
+    service.stream_gemini = stub_stream_gemini
+
+
+async def legacy_ttft(request: NL2SQLRequest) -> float:
+    """이전 구현: 모든 사전 작업을 순서대로 기다린 뒤 LLM 호출"""
+    started = time.perf_counter()
+    if request.connection_id:
+        await stub_get_connection_info(connection_id=request.connection_id)
+        await stub_get_database_schema(None)
+        await StubHistoryClient().create_database_query_history()
+    else:
+        client = StubDDLSessionClient()
+        session = await client.get_session(request.ddl_session_id)
+        if not session["data"]:
+            await client.create_session("새로운 DDL 세션", request.ddl_session_id)
+        await StubHistoryClient().create_ddl_query_history()
+    async for _ in stub_stream_gemini(""):
+        return time.perf_counter() - started
+
+
+async def current_ttft(request: NL2SQLRequest) -> float:
+    started = time.perf_counter()
+    response = await service.nl2sql_service(request, user_id=1, trace_info={"x-trace-id": "bench"})
+    body = response.body_iterator
+    await body.__anext__()
+    ttft = time.perf_counter() - started
+    # 스트림 끝까지 소비 (결과 저장은 write-behind 큐에서 처리)
+    async for _ in body:
+        pass
+    # 끝난 생성이 병합 레지스트리에서 정리되도록 한 번 양보 (다음 요청이 합류하지 않게)
+    await asyncio.sleep(0)
+    return ttft
+
+
+async def main(requests: int):
+    install_stubs()
+    answer_cache.max_entries = 0
+    cases = {
+        "database": NL2SQLRequest(query="q", connection_id="1"),
+        "ddl": NL2SQLRequest(query="q", use_ddl=True, ddl_schema="CREATE TABLE t (id int);", ddl_session_id="s"),
+    }
+    print(f"rtt={LATENCY['rtt'] * 1000:.0f}ms schema={LATENCY['schema'] * 1000:.0f}ms llm_first_token={LATENCY['llm'] * 1000:.0f}ms")
+    print(f"{'mode':<10}{'sequential ms':>16}{'concurrent ms':>16}")
+    for mode, request in cases.items():
+        legacy = [await legacy_ttft(request) for _ in range(requests)]
+        current = [await current_ttft(request) for _ in range(requests)]
+        print(f"{mode:<10}{sum(legacy) / requests * 1000:>16.1f}{sum(current) / requests * 1000:>16.1f}")
+    await write_behind_queue.close()
+    print(f"write-behind: {write_behind_queue.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rtt", type=float, default=20, help="서비스 호출 1회 지연 (ms)")
+    parser.add_argument("--schema", type=float, default=80, help="스키마 조회 지연 (ms)")
+    parser.add_argument("--llm", type=float, default=300, help="LLM 첫 토큰 지연 (ms)")
+    parser.add_argument("--requests", type=int, default=10)
+    args = parser.parse_args()
+    LATENCY.update(rtt=args.rtt / 1000, schema=args.schema / 1000, llm=args.llm / 1000)
+    asyncio.run(main(args.requests))
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+프롬프트 스키마 축소(schema pruning) 효과 측정 스크립트
+
+테이블 수를 늘린 가상 스키마에 대해 전체 스키마 프롬프트와 축소된 프롬프트의
+크기(근사 토큰 수), 인덱스 생성/축소 시간을 비교합니다.
+--gemini 옵션을 주면 GOOGLE_GEMINI_API_KEY로 실제 스트리밍 호출을 보내 첫 토큰 도달 시간(TTFT)도 측정합니다.
+
+사용법:
+    python scripts/benchmark/schema_pruning.py --tables 10 100 1000 5000
+    GOOGLE_GEMINI_API_KEY=... python scripts/benchmark/schema_pruning.py --tables 100 1000 --gemini
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+
+SERVICES_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "services")
+sys.path[:0] = [SERVICES_ROOT, os.path.join(SERVICES_ROOT, "nl2sql_service", "app")]
+
+from utils.nl2sql_utils import format_schema_info, get_nl2sql_prompt
+from utils.schema_pruning import SchemaIndex, prune_schema, estimate_tokens
+
+logging.disable(logging.CRITICAL)
+
+GEMINI_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:streamGenerateContent?alt=sse"
+QUESTION = "Show the total order amount per customer for last month"
+DOMAINS = ["inventory", "shipment", "invoice", "employee", "payroll", "campaign", "ticket", "supplier", "warehouse", "audit"]
+COLUMN_WORDS = ["status", "code", "label", "memo", "score", "level", "region", "channel", "priority", "version"]
+
+
+def build_schema(tables: int, seed: int = 42) -> dict:
+    """customers/orders 테이블과 관련 없는 테이블들로 구성된 가상 스키마"""
+    rng = random.Random(seed)
+    schema = {
+        "customers": [
+            {'field': 'id', 'type': 'int(11)', 'null': 'NO', 'key': 'PRI', 'default': None, 'extra': 'auto_increment'},
+            {'field': 'customer_name', 'type': 'varchar(100)', 'null': 'NO', 'key': '', 'default': None, 'extra': ''},
+            {'field': 'email', 'type': 'varchar(255)', 'null': 'YES', 'key': 'UNI', 'default': None, 'extra': ''},
+        ],
+        "orders": [
+            {'field': 'id', 'type': 'int(11)', 'null': 'NO', 'key': 'PRI', 'default': None, 'extra': 'auto_increment'},
+            {'field': 'customer_id', 'type': 'int(11)', 'null': 'NO', 'key': 'MUL', 'default': None, 'extra': '', 'references': 'customers.id'},
+            {'field': 'amount', 'type': 'decimal(12,2)', 'null': 'NO', 'key': '', 'default': '0.00', 'extra': ''},
+            {'field': 'ordered_at', 'type': 'datetime', 'null': 'NO', 'key': '', 'default': 'current_timestamp()', 'extra': ''},
+        ],
+    }
+    for i in range(max(0, tables - len(schema))):
+        domain = rng.choice(DOMAINS)
+        columns = [{'field': 'id', 'type': 'int(11)', 'null': 'NO', 'key': 'PRI', 'default': None, 'extra': 'auto_increment'}]
+        for word in rng.sample(COLUMN_WORDS, rng.randint(4, 9)):
+            columns.append({'field': f'{domain}_{word}', 'type': 'varchar(50)', 'null': 'YES', 'key': '', 'default': None, 'extra': ''})
+        schema[f"{domain}_{i:05d}"] = columns
+    return schema
+
+
+async def measure_ttft(prompt: str) -> float:
+    import aiohttp
+
+    headers = {"x-goog-api-key": os.environ["GOOGLE_GEMINI_API_KEY"], "Content-Type": "application/json"}
+    data = {"contents": [{"parts": [{"text": prompt}]}]}
+    async with aiohttp.ClientSession() as session:
+        started = time.perf_counter()
+        async with session.post(GEMINI_URL, headers=headers, json=data) as response:
+            async for line in response.content:
+                if line.startswith(b"data: "):
+                    return time.perf_counter() - started
+    return float("nan")
+
+
+async def main(table_counts: list[int], token_budget: int, gemini: bool):
+    print(f"token budget: {token_budget}, question: {QUESTION!r}")
+    header = f"{'tables':>8}{'full tokens':>14}{'pruned tokens':>15}{'index ms':>10}{'prune ms':>10}"
+    if gemini:
+        header += f"{'full ttft ms':>14}{'pruned ttft ms':>16}"
+    print(header)
+
+    for tables in table_counts:
+        schema = build_schema(tables)
+        schema_text = format_schema_info(schema)
+
+        started = time.perf_counter()
+        index = SchemaIndex(schema)
+        index_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        pruned = prune_schema(schema, QUESTION, token_budget, index=index, schema_text=schema_text)
+        prune_ms = (time.perf_counter() - started) * 1000
+
+        full_prompt = get_nl2sql_prompt(schema_text, QUESTION)
+        pruned_prompt = get_nl2sql_prompt(pruned, QUESTION)
+        line = (
+            f"{tables:>8}{estimate_tokens(full_prompt):>14}{estimate_tokens(pruned_prompt):>15}"
+            f"{index_ms:>10.1f}{prune_ms:>10.2f}"
+        )
+        if gemini:
+            full_ttft = await measure_ttft(full_prompt)
+            pruned_ttft = await measure_ttft(pruned_prompt)
+            line += f"{full_ttft * 1000:>14.0f}{pruned_ttft * 1000:>16.0f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--budget", type=int, default=8000)
+    parser.add_argument("--gemini", action="store_true", help="Gemini API로 TTFT 측정 (GOOGLE_GEMINI_API_KEY 필요)")
+    args = parser.parse_args()
+    asyncio.run(main(args.tables, args.budget, args.gemini))
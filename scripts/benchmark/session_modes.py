@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Gateway 세션 방식(db / signed)별 인증 처리량 비교 스크립트
+
+Gateway AuthMiddleware를 붙인 Starlette 앱을 ASGI로 직접 호출해 요청당 인증 비용을 비교합니다.
+- db: 요청마다 auth_service /me 호출 (gateway 캐시 비활성화)
+- db + cache: gateway 프로세스 캐시(auth_cache) 사용
+- signed: 서명된 세션 토큰을 gateway에서 로컬 검증 + 로그아웃 거부 목록 조회
+db 방식은 실행 중인 auth_service(SESSION_MODE=db)가 필요하며, --auth-url을 주지 않으면 건너뜁니다.
+거부 목록은 CACHE_BACKEND 설정(기본 memory)을 따르며, --redis-url을 주면 Redis를 사용합니다.
+
+사용법:
+    # signed만 측정
+    python scripts/benchmark/session_modes.py --seconds 5
+    # auth_service(localhost:8081)와 Redis를 함께 측정
+    python scripts/benchmark/session_modes.py --auth-url http://localhost:8081 \
+        --email bench@queryme.io --password bench-password --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from urllib.parse import urlparse
+
+SERVICES_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "services")
+sys.path[:0] = [SERVICES_ROOT, os.path.join(SERVICES_ROOT, "gateway", "app")]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--auth-url", default="", help="db 방식 측정에 사용할 auth_service URL")
+    parser.add_argument("--email", default="bench@queryme.io")
+    parser.add_argument("--password", default="bench-password")
+    parser.add_argument("--redis-url", default="", help="거부 목록에 사용할 Redis URL (비우면 CACHE_BACKEND 설정)")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=5.0, help="방식별 측정 시간")
+    return parser.parse_args()
+
+
+args = parse_args()
+# common 설정은 import 시점에 읽히므로 먼저 환경 변수로 지정
+os.environ.setdefault("SESSION_SECRET_KEY", "bench-secret-key-for-session-modes-only")
+if args.redis_url:
+    os.environ["CACHE_BACKEND"] = "redis"
+    os.environ["REDIS_URL"] = args.redis_url
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from core.config import settings
+from core.auth_cache import auth_cache
+from core.middleware.auth import AuthMiddleware
+from core.proxy import proxy_service
+from common.core.config import session_config
+from common.core.session_token import SESSION_TOKEN_COOKIE, session_token_signer, session_deny_list
+from common.db.redis import close_shared_cache
+
+logging.disable(logging.CRITICAL)
+
+
+async def plain(request: Request):
+    return PlainTextResponse("ok")
+
+
+def make_scope(cookie: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/plain",
+        "raw_path": b"/plain",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"gateway"), (b"cookie", cookie.encode())],
+        "client": ("127.0.0.1", 10000),
+        "server": ("127.0.0.1", 8080),
+    }
+
+
+async def call(app, scope: dict) -> int:
+    status = 0
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def measure(app, cookie: str, concurrency: int, seconds: float) -> tuple[float, float, float]:
+    """(초당 요청 수, p50 ms, p99 ms)"""
+    scope = make_scope(cookie)
+    assert await call(app, dict(scope)) == 200, "인증에 실패했습니다."
+    samples: list = []
+    deadline = time.perf_counter() + seconds
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            status = await call(app, dict(scope))
+            if status != 200:
+                raise RuntimeError(f"unexpected status {status}")
+            samples.append((time.perf_counter() - started) * 1000)
+            # ASGI 직접 호출은 I/O가 없으면 양보하지 않으므로 다른 워커에게 차례를 넘김
+            await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return len(samples) / elapsed, statistics.median(samples), statistics.quantiles(samples, n=100)[98]
+
+
+async def login_db_session(auth_url: str, email: str, password: str) -> str:
+    async with httpx.AsyncClient(base_url=auth_url) as client:
+        await client.post("/signup", json={"email": email, "password": password})
+        response = await client.post("/login", json={"email": email, "password": password})
+        response.raise_for_status()
+        session_id = response.cookies.get("session_id")
+        if not session_id:
+            raise RuntimeError("auth_service가 session_id 쿠키를 주지 않았습니다. SESSION_MODE=db로 실행했는지 확인하세요.")
+        return session_id
+
+
+async def main():
+    app = Starlette(routes=[Route("/plain", plain)])
+    app.add_middleware(AuthMiddleware)
+
+    cases = []
+    if args.auth_url:
+        parsed = urlparse(args.auth_url)
+        settings.auth_service_host = parsed.hostname
+        settings.auth_service_port = parsed.port or 80
+        session_id = await login_db_session(args.auth_url, args.email, args.password)
+        cases.append(("db", "db", f"session_id={session_id}", 0))
+        cases.append(("db + cache", "db", f"session_id={session_id}", settings.auth_cache_max_entries or 10000))
+    else:
+        print("--auth-url이 없어 db 방식은 건너뜁니다.")
+
+    token, _ = session_token_signer.issue({"id": 1, "email": args.email, "role": "user", "is_active": True})
+    cases.append(("signed", "signed", f"{SESSION_TOKEN_COOKIE}={token}", 0))
+
+    print(f"concurrency={args.concurrency}, {args.seconds:.0f}s per case, deny-list backend={session_deny_list.cache.backend.name}")
+    print(f"{'mode':<14}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, mode, cookie, cache_entries in cases:
+        session_config.SESSION_MODE = mode
+        auth_cache.clear()
+        auth_cache.max_entries = cache_entries
+        throughput, p50, p99 = await measure(app, cookie, args.concurrency, args.seconds)
+        print(f"{name:<14}{throughput:>10.0f}{p50:>10.3f}{p99:>10.3f}")
+
+    await proxy_service.close()
+    await close_shared_cache()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+common 공유 캐시(common/db/redis.py) 백엔드/코덱 비교 스크립트
+
+세션 캐시와 같은 크기의 값으로 다음을 반복 측정합니다.
+- get x N: 키마다 GET을 보내는 방식
+- get_many: MGET 한 번으로 N개 조회
+- set x N / set_many: 키마다 SET PX / 파이프라인으로 한 번에 SET PX
+백엔드는 프로세스 내부 캐시(memory)를 항상 측정하고, --redis-url을 주면 Redis도 측정합니다.
+Redis 대신 로컬 stand-in(예: redis-server --port 6380, KeyDB, Dragonfly)을 띄워 측정해도 됩니다.
+
+사용법:
+    python scripts/benchmark/shared_cache.py --keys 100 --repeat 200
+    python scripts/benchmark/shared_cache.py --redis-url redis://localhost:6379/15 --codecs orjson json msgpack
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+
+SERVICES_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "services")
+sys.path[:0] = [SERVICES_ROOT]
+
+from common.db.redis import CacheCodec, InMemoryBackend, RedisBackend, SharedCache, aioredis
+
+logging.disable(logging.CRITICAL)
+
+SESSION_VALUE = {
+    "user": {"id": 1, "email": "bench@queryme.io", "role": "user", "is_active": True},
+    "expires_at": 1792300000.123456,
+}
+
+
+async def timed(call, repeat: int) -> float:
+    """중앙값 ms"""
+    await call()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def run_case(cache: SharedCache, keys: list[str], repeat: int) -> dict:
+    items = {key: SESSION_VALUE for key in keys}
+
+    async def set_each():
+        for key in keys:
+            await cache.set(key, SESSION_VALUE, ttl=60)
+
+    async def set_many():
+        await cache.set_many(items, ttl=60)
+
+    async def get_each():
+        for key in keys:
+            await cache.get(key)
+
+    async def get_many():
+        await cache.get_many(keys)
+
+    results = {
+        "set x N": await timed(set_each, repeat),
+        "set_many": await timed(set_many, repeat),
+        "get x N": await timed(get_each, repeat),
+        "get_many": await timed(get_many, repeat),
+    }
+    found = await cache.get_many(keys)
+    assert len(found) == len(keys) and found[keys[0]] == SESSION_VALUE, "캐시 값이 일치하지 않습니다."
+    await cache.delete(*keys)
+    assert not await cache.get_many(keys), "삭제한 키가 남아 있습니다."
+    return results
+
+
+async def main(keys: int, repeat: int, redis_url: str, codecs: list[str]):
+    key_names = [f"session-{i}" for i in range(keys)]
+    backends = [InMemoryBackend(max_entries=keys * 2)]
+    if redis_url:
+        if aioredis is None:
+            print("redis 패키지가 없어 Redis 측정은 건너뜁니다. (pip install 'queryme-services[cache]')")
+        else:
+            backends.append(RedisBackend(url=redis_url, max_connections=10, socket_timeout=1.0))
+
+    print(f"keys={keys}, repeat={repeat}, value={len(CacheCodec('json').encode(SESSION_VALUE))} bytes (json)")
+    print(f"{'backend':<10}{'codec':<10}{'set x N':>10}{'set_many':>10}{'get x N':>10}{'get_many':>10}  (median ms)")
+    for backend in backends:
+        for codec_name in codecs:
+            try:
+                codec = CacheCodec(codec_name)
+            except ValueError as e:
+                print(f"{backend.name:<10}{codec_name:<10}skipped: {e}")
+                continue
+            cache = SharedCache(namespace="bench", backend=backend, codec=codec)
+            results = await run_case(cache, key_names, repeat)
+            print(
+                f"{backend.name:<10}{codec.name:<10}{results['set x N']:>10.3f}{results['set_many']:>10.3f}"
+                f"{results['get x N']:>10.3f}{results['get_many']:>10.3f}"
+            )
+            if cache.errors:
+                print(f"  errors={cache.errors}")
+        await backend.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=100, help="한 번에 다루는 키 수")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--redis-url", default="", help="측정할 Redis URL (비우면 memory만 측정)")
+    parser.add_argument("--codecs", nargs="+", default=["orjson", "json"], choices=["orjson", "msgpack", "json"])
+    args = parser.parse_args()
+    asyncio.run(main(args.keys, args.repeat, args.redis_url, args.codecs))
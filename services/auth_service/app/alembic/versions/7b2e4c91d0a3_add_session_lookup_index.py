@@ -0,0 +1,33 @@
+"""add session lookup index
+
+Revision ID: 7b2e4c91d0a3
+Revises: d5d0f5190e33
+Create Date: 2026-10-18 14:02:51.218733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2e4c91d0a3'
+down_revision: Union[str, Sequence[str], None] = 'd5d0f5190e33'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_sessions_session_id_expires_at',
+        'sessions',
+        ['session_id', 'expires_at', 'user_id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sessions_session_id_expires_at', table_name='sessions')
@@ -0,0 +1,28 @@
+"""add session expires_at index
+
+Revision ID: c3f81a6e5d27
+Revises: 7b2e4c91d0a3
+Create Date: 2026-10-18 16:25:09.664120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f81a6e5d27'
+down_revision: Union[str, Sequence[str], None] = '7b2e4c91d0a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_sessions_expires_at', 'sessions', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sessions_expires_at', table_name='sessions')
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from schemas.request import UserCreate, UserLogin
 from schemas.user import UserModel
 from services import auth_service
 from fastapi.responses import JSONResponse
 from core.security import get_current_user
-from crud.session_crud import create_session, remove_session
+from core.session_cache import invalidate_sessions
+from crud.session_crud import create_session, remove_session, get_user_session_ids
 from common.schemas.http import SuccessResponse, ErrorResponse
+from common.core.config import session_config
+from common.core.session_token import SESSION_TOKEN_COOKIE, session_token_signer, session_deny_list
 
 router = APIRouter()
 
@@ -30,14 +33,28 @@ async def login(request: UserLogin):
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # 세션 생성
-    session_id = await create_session(user.id)
-    
     # JSON 응답 반환
     response = JSONResponse(
         content=SuccessResponse(data=user).model_dump(),
         status_code=status.HTTP_200_OK
     )
+
+    if session_config.SESSION_MODE == "signed":
+        # signed 모드: DB 세션 없이 서명된 토큰을 발급 (gateway가 로컬에서 검증)
+        token, _ = session_token_signer.issue(user.model_dump())
+        response.set_cookie(
+            key=SESSION_TOKEN_COOKIE,
+            value=token,
+            httponly=True,
+            samesite="lax",
+            max_age=session_config.SESSION_TOKEN_TTL_SECONDS
+        )
+        return response
+
+    # 세션 생성 (기존 세션은 삭제되므로 캐시에서도 제거)
+    stale_session_ids = await get_user_session_ids(user.id)
+    session_id = await create_session(user.id)
+    await invalidate_sessions(stale_session_ids)
     
     # 세션 쿠키 설정
     response.set_cookie(
@@ -51,15 +68,31 @@ async def login(request: UserLogin):
     return response
 
 @router.post("/logout")
-async def logout(current_user = Depends(get_current_user)):
-    await remove_session(current_user.id)
+async def logout(request: Request, current_user = Depends(get_current_user)):
+    claims = getattr(request.state, "session_claims", None)
+    if claims is not None:
+        # signed 모드: 토큰은 만료 전까지 유효하므로 거부 목록에 등록
+        await session_deny_list.revoke(claims)
+    else:
+        session_ids = await get_user_session_ids(current_user.id)
+        await remove_session(current_user.id)
+        await invalidate_sessions(session_ids)
     response = JSONResponse(
         content=SuccessResponse(data=None).model_dump(),
         status_code=status.HTTP_200_OK
     )
     response.delete_cookie("session_id")
+    response.delete_cookie(SESSION_TOKEN_COOKIE)
     return response
 
 @router.get("/me", response_model=SuccessResponse[UserModel])
-async def read_users_me(current_user = Depends(get_current_user)):
+async def read_users_me(
+    request: Request,
+    response: Response,
+    current_user = Depends(get_current_user)
+):
+    # Gateway가 사용자 정보를 세션 만료 시각까지만 캐시할 수 있도록 전달 (epoch seconds)
+    expires_at = getattr(request.state, "session_expires_at", None)
+    if expires_at is not None:
+        response.headers["X-Session-Expires-At"] = str(int(expires_at.timestamp()))
     return SuccessResponse(data=current_user)
\ No newline at end of file
@@ -23,6 +23,20 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+
+    # 비밀번호 해시/검증(bcrypt) 전용 executor 설정 (thread | process)
+    PASSWORD_EXECUTOR_KIND: str = "thread"
+    PASSWORD_EXECUTOR_WORKERS: int = 4
+    PASSWORD_EXECUTOR_MAX_PENDING: int = 200
+
+    # 세션 조회 결과 캐시 TTL (common 공유 캐시가 Redis 백엔드일 때만 사용, 0이면 비활성화)
+    SESSION_CACHE_TTL_SECONDS: float = 30.0
+
+    # 만료 세션 정리 작업 설정 (interval 0이면 비활성화)
+    SESSION_SWEEP_INTERVAL_SECONDS: float = 300.0
+    SESSION_SWEEP_BATCH_SIZE: int = 1000
+    SESSION_SWEEP_MAX_BATCHES: int = 100
+    SESSION_SWEEP_BATCH_PAUSE: float = 0.05
 class DBConfig(BaseSettings):
     class Config(Config):
         pass    
@@ -0,0 +1,144 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from core.config import settings
+from common.core.logger import Logger
+
+logger = Logger.getLogger(__name__)
+
+# 프로세스 풀 워커에서도 같은 설정을 쓰도록 모듈 수준에 둠
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# 지연 시간 분포 계산에 사용할 최근 샘플 수
+LATENCY_SAMPLE_SIZE = 1000
+
+
+def hash_password_sync(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def verify_password_sync(plain: str, hashed: str) -> bool:
+    return pwd_context.verify(plain, hashed)
+
+
+def _percentile(samples, ratio: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+class PasswordExecutor:
+    """
+    bcrypt 해시/검증을 이벤트 루프 밖에서 실행하는 전용 executor
+    - kind: "thread"(기본, bcrypt는 GIL을 풀고 계산함) 또는 "process"
+    - 동시에 실행되는 작업은 workers개로 제한하고, 대기 중인 작업이 max_pending을 넘으면 503으로 거절
+    - 대기 시간(queue)과 실행 시간(run)을 기록해 /metrics에서 확인
+    """
+
+    def __init__(self, kind: str, workers: int, max_pending: int):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unsupported password executor kind: {kind}")
+        self.kind = kind
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._queue_times: deque = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self._run_times: deque = deque(maxlen=LATENCY_SAMPLE_SIZE)
+
+        self.pending = 0
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def start(self):
+        self._ensure_started()
+
+    async def close(self):
+        if self._executor is None:
+            return
+        executor = self._executor
+        self._executor = None
+        self._semaphore = None
+        # 실행 중인 해시 작업이 끝날 때까지 이벤트 루프를 막지 않도록 별도 스레드에서 종료 대기
+        await asyncio.to_thread(executor.shutdown, True, cancel_futures=True)
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(hash_password_sync, password)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return await self._submit(verify_password_sync, plain, hashed)
+
+    def stats(self) -> dict:
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "running": self.running,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "queue_ms": self._latency_stats(self._queue_times),
+            "run_ms": self._latency_stats(self._run_times),
+        }
+
+    def _ensure_started(self):
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password")
+            self._semaphore = asyncio.Semaphore(self.workers)
+            logger.info(f"Password executor started: kind={self.kind}, workers={self.workers}")
+
+    async def _submit(self, func: Callable, *args):
+        self._ensure_started()
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            logger.warning(f"Password executor is saturated ({self.pending} pending), rejected request")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="현재 로그인 요청이 많아 잠시 후 다시 시도해 주세요."
+            )
+        self.submitted += 1
+        self.pending += 1
+        queued_at = time.perf_counter()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            # 세마포어를 얻기 전에 요청이 취소되어도 대기 수를 되돌림
+            self.pending -= 1
+        self.running += 1
+        started_at = time.perf_counter()
+        self._queue_times.append((started_at - queued_at) * 1000)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._semaphore.release()
+            self.running -= 1
+            self.completed += 1
+            self._run_times.append((time.perf_counter() - started_at) * 1000)
+
+    @staticmethod
+    def _latency_stats(samples) -> dict:
+        return {
+            "p50": round(_percentile(samples, 0.50), 2),
+            "p99": round(_percentile(samples, 0.99), 2),
+            "max": round(max(samples), 2) if samples else 0.0,
+        }
+
+
+# 싱글톤 패턴으로 비밀번호 executor 인스턴스 생성
+password_executor = PasswordExecutor(
+    kind=settings.PASSWORD_EXECUTOR_KIND,
+    workers=settings.PASSWORD_EXECUTOR_WORKERS,
+    max_pending=settings.PASSWORD_EXECUTOR_MAX_PENDING
+)
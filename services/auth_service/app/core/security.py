@@ -1,4 +1,3 @@
-from passlib.context import CryptContext
 import jwt
 from jwt.exceptions import InvalidTokenError
 from datetime import datetime, timedelta
@@ -10,25 +9,52 @@ from core.config import settings
 from typing import Annotated
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from schemas.user import UserModel
-from crud.session_crud import get_current_user_from_session
+from core.session_cache import get_session_user_cached
+from core.password_executor import password_executor
+from common.core.config import session_config
+from common.core.session_token import (
+    SESSION_TOKEN_COOKIE,
+    session_token_signer,
+    session_deny_list,
+    to_user_info
+)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
-def verify_password(plain, hashed):
-    return pwd_context.verify(plain, hashed)
+async def verify_password(plain, hashed):
+    # bcrypt 계산이 이벤트 루프를 막지 않도록 전용 executor에서 실행
+    return await password_executor.verify(plain, hashed)
 
-def get_password_hash(password):
-    return pwd_context.hash(password)
+async def get_password_hash(password):
+    return await password_executor.hash(password)
 
 async def get_current_user(
     request: Request
 ) -> UserModel:
     """현재 세션에서 사용자 정보를 가져옵니다."""
+    token = request.cookies.get(SESSION_TOKEN_COOKIE)
+    if session_config.SESSION_MODE == "signed" and token:
+        return await get_current_user_from_token(request, token)
+
     session_id = request.cookies.get("session_id")
     if not session_id:
         raise HTTPException(
             status_code=401,
             detail="세션이 없습니다. 로그인이 필요합니다."
         )
-    return await get_current_user_from_session(session_id)
\ No newline at end of file
+    user, expires_at = await get_session_user_cached(session_id)
+    # Gateway 캐시가 세션 만료 시각을 넘기지 않도록 응답 헤더에서 사용
+    request.state.session_expires_at = expires_at
+    return user
+
+async def get_current_user_from_token(request: Request, token: str) -> UserModel:
+    """signed 모드: 세션 토큰의 서명/만료와 거부 목록을 확인하고 DB 조회 없이 사용자 정보를 만듭니다."""
+    claims = session_token_signer.verify(token)
+    if claims is None or await session_deny_list.is_revoked(claims):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or expired session"
+        )
+    request.state.session_claims = claims
+    request.state.session_expires_at = datetime.fromtimestamp(claims["exp"])
+    return UserModel(**to_user_info(claims))
@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Iterable
+from core.config import settings
+from crud.session_crud import get_session_user
+from schemas.user import UserModel
+from common.db.redis import SharedCache
+from common.core.logger import Logger
+
+logger = Logger.getLogger(__name__)
+
+# 세션 ID -> (사용자 정보, 세션 만료 시각) 캐시, gunicorn 워커 간 공유 (Redis 백엔드일 때)
+session_cache = SharedCache(namespace="auth:session")
+
+# 프로세스 내부 캐시는 로그아웃 시 다른 워커의 캐시를 지울 수 없어 삭제된 세션이 TTL 동안 유효하게 남으므로 사용하지 않음
+if settings.SESSION_CACHE_TTL_SECONDS > 0 and session_cache.backend.name != "redis":
+    logger.error(
+        f"세션 캐시는 Redis 백엔드에서만 사용할 수 있어 비활성화합니다. (backend={session_cache.backend.name}, "
+        "CACHE_BACKEND=redis와 REDIS_URL 설정 필요)"
+    )
+    settings.SESSION_CACHE_TTL_SECONDS = 0.0
+
+
+async def get_session_user_cached(session_id: str) -> tuple[UserModel, datetime]:
+    """
+    세션 ID로 사용자 정보와 세션 만료 시각을 조회합니다.
+    캐시에 없으면 DB에서 조회하고, 세션 만료 시각을 넘지 않는 TTL로 캐시에 넣습니다.
+    """
+    if settings.SESSION_CACHE_TTL_SECONDS > 0:
+        cached = await session_cache.get(session_id)
+        if cached is not None:
+            expires_at = datetime.fromtimestamp(cached["expires_at"])
+            if expires_at > datetime.now():
+                return UserModel(**cached["user"]), expires_at
+
+    user, expires_at = await get_session_user(session_id)
+
+    ttl = min(settings.SESSION_CACHE_TTL_SECONDS, (expires_at - datetime.now()).total_seconds())
+    if ttl > 0:
+        await session_cache.set(
+            session_id,
+            {"user": user.model_dump(), "expires_at": expires_at.timestamp()},
+            ttl=ttl
+        )
+    return user, expires_at
+
+
+async def invalidate_sessions(session_ids: Iterable[str]):
+    """삭제된 세션이 캐시 TTL 동안 계속 유효하지 않도록 캐시에서도 제거합니다."""
+    await session_cache.delete(*session_ids)
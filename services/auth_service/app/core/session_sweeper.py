@@ -0,0 +1,133 @@
+import asyncio
+import random
+import time
+from datetime import datetime
+from typing import Optional
+from core.config import settings
+from crud.session_crud import delete_expired_sessions
+from db.maria import named_lock
+from common.core.logger import Logger
+
+logger = Logger.getLogger(__name__)
+
+# 여러 워커/컨테이너 중 한 곳만 sweep하도록 잡는 MariaDB 잠금 이름
+SWEEP_LOCK_NAME = "session_sweep"
+
+
+class SessionSweeper:
+    """
+    만료된 세션을 주기적으로 삭제하는 백그라운드 작업
+    - 한 번에 batch_size개씩, 배치마다 별도 트랜잭션으로 삭제해 잠금을 짧게 유지
+    - 배치 사이에 batch_pause만큼 쉬어 로그인/세션 조회 쿼리가 끼어들 수 있게 함
+    - 한 번의 sweep은 max_batches까지만 실행하고 남은 행은 다음 주기에 처리
+    - gunicorn 워커마다 실행되지만 GET_LOCK을 잡은 한 곳만 sweep하고 나머지는 이번 주기를 건너뜀
+    - 첫 실행 시각을 interval 안에서 무작위로 흩뜨려 워커들이 동시에 잠금을 시도하지 않게 함
+    """
+
+    def __init__(self, interval: float, batch_size: int, max_batches: int, batch_pause: float):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.batch_pause = batch_pause
+        self._task: Optional[asyncio.Task] = None
+
+        self.sweeps = 0
+        self.skipped = 0
+        self.batches = 0
+        self.purged = 0
+        self.errors = 0
+        self.last_purged = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.last_run_at: Optional[datetime] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0 and self.batch_size > 0
+
+    async def start(self):
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Session sweeper started: interval={self.interval}s, batch_size={self.batch_size}")
+
+    async def close(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def sweep(self) -> int:
+        """
+        만료 시각이 지난 세션을 배치 단위로 삭제하고 삭제한 행 수를 반환합니다.
+        다른 워커가 sweep 중이면(잠금을 못 잡으면) 건너뛰고 0을 반환합니다.
+        """
+        async with named_lock(SWEEP_LOCK_NAME) as acquired:
+            if not acquired:
+                self.skipped += 1
+                return 0
+            return await self._sweep()
+
+    async def _sweep(self) -> int:
+        started = time.perf_counter()
+        # sweep 도중 새로 만료되는 행까지 쫓아가지 않도록 기준 시각을 고정
+        expired_before = datetime.now()
+        purged = 0
+        try:
+            for _ in range(self.max_batches):
+                deleted = await delete_expired_sessions(expired_before, self.batch_size)
+                self.batches += 1
+                purged += deleted
+                if deleted < self.batch_size:
+                    break
+                await asyncio.sleep(self.batch_pause)
+        finally:
+            # 중간 배치가 실패해도 이미 커밋된 배치의 삭제 수와 소요 시간은 기록
+            duration = time.perf_counter() - started
+            self.sweeps += 1
+            self.purged += purged
+            self.last_purged = purged
+            self.last_duration = duration
+            self.max_duration = max(self.max_duration, duration)
+            self.last_run_at = datetime.now()
+            if purged:
+                logger.info(f"Session sweep purged {purged} expired sessions in {duration * 1000:.1f}ms")
+        return purged
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "interval_seconds": self.interval,
+            "batch_size": self.batch_size,
+            "sweeps": self.sweeps,
+            "skipped": self.skipped,
+            "batches": self.batches,
+            "purged": self.purged,
+            "errors": self.errors,
+            "last_purged": self.last_purged,
+            "last_duration_ms": round(self.last_duration * 1000, 2),
+            "max_duration_ms": round(self.max_duration * 1000, 2),
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+        }
+
+    async def _run(self):
+        await asyncio.sleep(random.uniform(0, self.interval))
+        while True:
+            try:
+                await self.sweep()
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Session sweep failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+# 싱글톤 패턴으로 세션 정리 작업 인스턴스 생성
+session_sweeper = SessionSweeper(
+    interval=settings.SESSION_SWEEP_INTERVAL_SECONDS,
+    batch_size=settings.SESSION_SWEEP_BATCH_SIZE,
+    max_batches=settings.SESSION_SWEEP_MAX_BATCHES,
+    batch_pause=settings.SESSION_SWEEP_BATCH_PAUSE
+)
@@ -2,7 +2,7 @@ from fastapi import HTTPException, status
 import uuid
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import delete, and_, select
+from sqlalchemy import delete, and_, select, text
 from models.session import Session as SessionModel
 from models.user import User
 from db.maria import async_transactional
@@ -28,37 +28,63 @@ async def create_session(user_id: int, session: AsyncSession) -> str:
     return session_id
 
 @async_transactional
-async def get_current_user_from_session(session_id: str, session: AsyncSession = None):
-    # 세션 조회
+async def get_session_user(session_id: str, session: AsyncSession = None):
+    """
+    세션 ID로 사용자 정보와 세션 만료 시각을 함께 조회합니다.
+    /me는 게이트웨이의 모든 인증 요청 경로에 있으므로 sessions-user JOIN 한 번으로
+    UserModel에 필요한 컬럼만 가져옵니다.
+    """
     result = await session.execute(
-        select(SessionModel).where(
+        select(
+            User.id,
+            User.email,
+            User.role,
+            User.is_active,
+            SessionModel.expires_at
+        )
+        .join(User, User.id == SessionModel.user_id)
+        .where(
             and_(
                 SessionModel.session_id == session_id,
                 SessionModel.expires_at > datetime.now()
             )
         )
     )
-    session_obj = result.scalar_one_or_none()
-    
-    if not session_obj:
+    row = result.one_or_none()
+
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired session"
         )
-    
-    # 사용자 정보 조회
+
+    user = UserModel(id=row.id, email=row.email, role=row.role, is_active=row.is_active)
+    return user, row.expires_at
+
+
+@async_transactional
+async def get_user_session_ids(user_id: int, session: AsyncSession = None) -> list[str]:
+    """사용자의 세션 ID 목록을 조회합니다. (세션 삭제 전 캐시 무효화 대상 확인용)"""
     result = await session.execute(
-        select(User).where(User.id == session_obj.user_id)
+        select(SessionModel.session_id).where(SessionModel.user_id == user_id)
     )
-    user = result.scalar_one_or_none()
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
-    
-    return UserModel.model_validate(user)
+    return list(result.scalars().all())
+
+
+@async_transactional
+async def delete_expired_sessions(expired_before: datetime, limit: int, session: AsyncSession = None) -> int:
+    """만료된 세션을 오래된 순서로 최대 limit개 삭제하고 삭제한 행 수를 반환합니다."""
+    # ix_sessions_expires_at 범위를 앞에서부터 limit개만 읽고 잠그도록 ORDER BY + LIMIT 사용 (MariaDB)
+    result = await session.execute(
+        text("DELETE FROM sessions WHERE expires_at <= :expired_before ORDER BY expires_at LIMIT :limit"),
+        {"expired_before": expired_before, "limit": limit}
+    )
+    return result.rowcount
+
+
+async def get_current_user_from_session(session_id: str):
+    user, _ = await get_session_user(session_id)
+    return user
 
 
 @async_transactional
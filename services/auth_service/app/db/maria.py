@@ -1,11 +1,14 @@
 
+from contextlib import asynccontextmanager
 from functools import wraps
+from typing import AsyncIterator
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import TimeoutError
 from sqlalchemy.engine import create_engine
+from sqlalchemy import text
 from core.config import db_config
 
 ASYNC_DB_URL = (
@@ -75,3 +78,21 @@ def async_transactional(func):
                     raise e
 
     return wrapper
+
+
+@asynccontextmanager
+async def named_lock(name: str) -> AsyncIterator[bool]:
+    """
+    MariaDB GET_LOCK 기반 잠금 (워커/컨테이너 간 단일 실행 보장)
+    잠금은 커넥션에 묶이므로 블록이 끝날 때까지 같은 커넥션을 유지하고,
+    다른 커넥션이 잡고 있으면 기다리지 않고 False를 반환합니다.
+    """
+    async with engine.connect() as connection:
+        acquired = (await connection.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": name})).scalar() == 1
+        await connection.commit()
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": name})
+                await connection.commit()
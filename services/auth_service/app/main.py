@@ -14,11 +14,20 @@ from api.auth_router import router as auth_router
 from models import Session, User
 from db.maria import Base, engine
 from common.core.logger import Logger
+from core.password_executor import password_executor
+from core.session_cache import session_cache
+from core.session_sweeper import session_sweeper
+from common.db.redis import close_shared_cache
+from common.core.config import session_config
+from common.core.session_token import session_token_signer, session_deny_list, validate_session_config
 
 logger = Logger.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # signed 세션 모드 설정이 잘못되었으면 시작하지 않음
+    validate_session_config()
+
     # Alembic migration 실행
     try:
         subprocess.run(["alembic", "upgrade", "head"], check=True, cwd=os.path.dirname(__file__))
@@ -28,8 +37,13 @@ async def lifespan(app: FastAPI):
         raise
     except FileNotFoundError:
         logger.warning("Alembic not found, skipping migration")
-    
+
+    await password_executor.start()
+    await session_sweeper.start()
     yield
+    await session_sweeper.close()
+    await password_executor.close()
+    await close_shared_cache()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -47,5 +61,18 @@ app.add_middleware(
 async def health_check():
     return {"status": "ok"}
 
+@app.get("/metrics")
+async def metrics():
+    """내부 지표 조회 엔드포인트 (워커 프로세스 단위)"""
+    return {
+        "pid": os.getpid(),
+        "password_executor": password_executor.stats(),
+        "session_cache": session_cache.stats(),
+        "session_sweeper": session_sweeper.stats(),
+        "session_mode": session_config.SESSION_MODE,
+        "session_token": session_token_signer.stats(),
+        "session_deny_list": session_deny_list.stats()
+    }
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8081, reload=True)
\ No newline at end of file
@@ -1,10 +1,17 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from db.maria import Base
 
 class Session(Base):
     __tablename__ = "sessions"
+    __table_args__ = (
+        # /me 세션 조회: session_id 일치 + expires_at 범위 조건을 인덱스에서 처리하고,
+        # JOIN에 쓰는 user_id까지 담아 sessions 테이블 본문을 읽지 않도록 함
+        Index("ix_sessions_session_id_expires_at", "session_id", "expires_at", "user_id"),
+        # 만료 세션 정리: expires_at 범위 삭제를 오래된 순서로 배치 처리
+        Index("ix_sessions_expires_at", "expires_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     session_id: Mapped[str] = mapped_column(String(255), unique=True, index=True)
@@ -4,13 +4,13 @@ from schemas.user import UserModel
 from core.security import get_password_hash, verify_password
 
 async def create_user_service(user: UserCreate):
-    hashed_pw = get_password_hash(user.password)
+    hashed_pw = await get_password_hash(user.password)
     user = await create_user(user, hashed_pw)
     return UserModel.model_validate(user)
 
 async def authenticate_user_service(email: str, password: str):
     user = await authenticate_user(email)
-    if user and verify_password(password, user.hashed_password):
+    if user and await verify_password(password, user.hashed_password):
         return UserModel.model_validate(user)
     return None
 
@@ -26,4 +26,34 @@ class DBConfig(BaseSettings):
     DB_PORT: str
     DB_NAME: str
 
-db_config = DBConfig()
\ No newline at end of file
+
+class CacheConfig(BaseSettings):
+    class Config(Config):
+        pass
+
+    # 공유 캐시 백엔드 (memory | redis), redis를 쓸 수 없으면 memory로 대체
+    CACHE_BACKEND: str = "memory"
+    CACHE_KEY_PREFIX: str = "queryme"
+    # 직렬화 코덱 (auto | orjson | msgpack | json)
+    CACHE_CODEC: str = "auto"
+    CACHE_MEMORY_MAX_ENTRIES: int = 10000
+
+    REDIS_URL: str = ""
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT: float = 1.0
+
+
+class SessionConfig(BaseSettings):
+    class Config(Config):
+        pass
+
+    # 세션 방식 (db: session_id 쿠키 + DB 조회 | signed: 서명된 세션 토큰을 gateway에서 로컬 검증)
+    # auth_service와 gateway에 같은 값을 설정해야 합니다.
+    SESSION_MODE: str = "db"
+    # signed 모드 토큰 서명 키 (32바이트 이상, 기본값 없음)
+    SESSION_SECRET_KEY: str = ""
+    SESSION_TOKEN_TTL_SECONDS: int = 3600
+
+db_config = DBConfig()
+cache_config = CacheConfig()
+session_config = SessionConfig()
\ No newline at end of file
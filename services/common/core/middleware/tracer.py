@@ -1,44 +1,56 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 import uuid
 
-class Tracer(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
-        
-    async def dispatch(self, request: Request, call_next):
+SPAN_ID_HEADER = b'x-span-id'
+PARENT_SPAN_ID_HEADER = b'x-parent-span-id'
+
+
+class Tracer:
+    """
+    요청마다 새 span-id를 발급하고 기존 span-id를 parent-span-id로 넘기는 순수 ASGI 미들웨어
+    scope의 headers만 교체하고 receive/send는 그대로 전달하므로 스트리밍 응답에 버퍼링이 추가되지 않습니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
         # 기존 헤더에서 trace 정보 추출
-        span_id = request.headers.get('x-span-id')
+        span_id = None
+        for name_bytes, value_bytes in scope['headers']:
+            if name_bytes == SPAN_ID_HEADER:
+                span_id = value_bytes
+                break
 
         # 새로운 span-id 생성 및 parent-span-id 설정
-        new_span_id = str(uuid.uuid4())
+        new_span_id = str(uuid.uuid4()).encode('utf-8')
         new_parent_span_id = span_id  # 현재 span-id를 parent로 설정
 
-        # request.scope의 headers를 업데이트
-        # headers는 (name, value) 튜플의 리스트 형태로 저장됨
+        # headers는 (name, value) 튜플의 리스트 형태로 저장됨 (ASGI 규격상 이름은 소문자)
         updated_headers = []
-        header_names_updated = set()
-        
+        span_id_updated = False
+        parent_span_id_updated = False
+
         # 기존 헤더들을 순회하면서 trace 관련 헤더는 새 값으로 대체
-        for name_bytes, value_bytes in request.scope['headers']:
-            name = name_bytes.decode('utf-8').lower()
-            if name == 'x-span-id':
-                updated_headers.append((b'x-span-id', new_span_id.encode('utf-8')))
-                header_names_updated.add('x-span-id')
-            elif name == 'x-parent-span-id':
+        for name_bytes, value_bytes in scope['headers']:
+            if name_bytes == SPAN_ID_HEADER:
+                updated_headers.append((SPAN_ID_HEADER, new_span_id))
+                span_id_updated = True
+            elif name_bytes == PARENT_SPAN_ID_HEADER:
                 if new_parent_span_id:
-                    updated_headers.append((b'x-parent-span-id', new_parent_span_id.encode('utf-8')))
-                header_names_updated.add('x-parent-span-id')
+                    updated_headers.append((PARENT_SPAN_ID_HEADER, new_parent_span_id))
+                parent_span_id_updated = True
             else:
                 updated_headers.append((name_bytes, value_bytes))
-        
+
         # 새로운 헤더가 기존에 없었다면 추가
-        if 'x-span-id' not in header_names_updated:
-            updated_headers.append((b'x-span-id', new_span_id.encode('utf-8')))
-        if 'x-parent-span-id' not in header_names_updated and new_parent_span_id:
-            updated_headers.append((b'x-parent-span-id', new_parent_span_id.encode('utf-8')))
-        
-        # request.scope의 headers 업데이트
-        request.scope['headers'] = updated_headers
-
-        return await call_next(request)
\ No newline at end of file
+        if not span_id_updated:
+            updated_headers.append((SPAN_ID_HEADER, new_span_id))
+        if not parent_span_id_updated and new_parent_span_id:
+            updated_headers.append((PARENT_SPAN_ID_HEADER, new_parent_span_id))
+
+        await self.app({**scope, 'headers': updated_headers}, receive, send)
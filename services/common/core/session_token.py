@@ -0,0 +1,171 @@
+import base64
+import hashlib
+import hmac
+import json
+import time
+import uuid
+from typing import Optional
+from common.core.config import session_config
+from common.core.logger import Logger
+from common.db.redis import SharedCache
+
+logger = Logger.getLogger(__name__)
+
+# signed 모드에서 세션 토큰을 담는 쿠키 (db 모드의 session_id 쿠키와 구분)
+SESSION_TOKEN_COOKIE = "session_token"
+# 토큰 claims에 반드시 있어야 하는 필드
+REQUIRED_CLAIMS = frozenset({"id", "email", "role", "is_active", "exp", "jti"})
+# 예전 기본값 (설정 예시에 남아 있을 수 있으므로 비밀 키로 허용하지 않음)
+PLACEHOLDER_SECRET_KEY = "change-me"
+MIN_SECRET_KEY_BYTES = 32
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+class SessionTokenSigner:
+    """
+    HMAC-SHA256으로 서명한 compact 세션 토큰 ("{payload}.{signature}", 둘 다 base64url)
+    payload는 사용자 정보(id, email, role, is_active)와 만료 시각(exp), 토큰 ID(jti)를 담은 JSON입니다.
+    auth_service가 발급하고 gateway가 auth_service 호출 없이 로컬에서 검증합니다.
+    """
+
+    def __init__(self, secret_key: str, ttl_seconds: int):
+        self._key = secret_key.encode("utf-8")
+        self.ttl_seconds = ttl_seconds
+
+        self.issued = 0
+        self.verified = 0
+        self.invalid = 0
+        self.expired = 0
+
+    def issue(self, user: dict) -> tuple[str, dict]:
+        """사용자 정보로 토큰을 발급하고 (토큰, claims)를 반환합니다."""
+        claims = {
+            "id": user["id"],
+            "email": user["email"],
+            "role": user["role"],
+            "is_active": user["is_active"],
+            "exp": int(time.time()) + self.ttl_seconds,
+            "jti": uuid.uuid4().hex,
+        }
+        payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+        self.issued += 1
+        return f"{payload}.{self._sign(payload)}", claims
+
+    def verify(self, token: Optional[str]) -> Optional[dict]:
+        """서명과 만료 시각을 확인하고 claims를 반환합니다. 유효하지 않으면 None"""
+        if not token:
+            return None
+        try:
+            payload, signature = token.split(".", 1)
+            # 비ASCII 문자가 섞인 str은 compare_digest가 TypeError를 내므로 바이트로 비교
+            if not hmac.compare_digest(signature.encode("ascii"), self._sign(payload).encode("ascii")):
+                self.invalid += 1
+                return None
+            claims = json.loads(_b64decode(payload))
+        except (ValueError, TypeError):
+            # UnicodeEncodeError/UnicodeDecodeError, binascii.Error, JSONDecodeError 모두 ValueError 하위 클래스
+            self.invalid += 1
+            return None
+        if (
+            not isinstance(claims, dict)
+            or not REQUIRED_CLAIMS <= claims.keys()
+            or not isinstance(claims["exp"], (int, float))
+            or not isinstance(claims["jti"], str)
+        ):
+            self.invalid += 1
+            return None
+        if claims["exp"] <= time.time():
+            self.expired += 1
+            return None
+        self.verified += 1
+        return claims
+
+    def stats(self) -> dict:
+        return {
+            "issued": self.issued,
+            "verified": self.verified,
+            "invalid": self.invalid,
+            "expired": self.expired,
+        }
+
+    def _sign(self, payload: str) -> str:
+        return _b64encode(hmac.new(self._key, payload.encode("ascii"), hashlib.sha256).digest())
+
+
+class SessionDenyList:
+    """
+    로그아웃한 토큰 ID(jti) 목록
+    토큰 만료 시각까지만 보관하면 되므로 공유 캐시에 남은 수명만큼의 TTL로 저장합니다.
+    gateway와 auth_service가 같은 목록을 보려면 CACHE_BACKEND=redis여야 합니다.
+    """
+
+    def __init__(self, cache: SharedCache):
+        self.cache = cache
+        self.revoked = 0
+        self.lookup_errors = 0
+
+    async def revoke(self, claims: dict):
+        ttl = claims.get("exp", 0) - time.time()
+        if ttl <= 0:
+            return
+        await self.cache.set(claims["jti"], 1, ttl=ttl)
+        self.revoked += 1
+
+    async def is_revoked(self, claims: dict) -> bool:
+        """
+        로그아웃한 토큰이면 True
+        조회에 실패하면 로그아웃한 토큰을 통과시키지 않도록 거부된 것으로 처리합니다. (fail-closed)
+        """
+        try:
+            return await self.cache.get_or_raise(claims["jti"]) is not None
+        except Exception as e:
+            self.lookup_errors += 1
+            logger.error(f"세션 거부 목록 조회 실패, 요청을 거부합니다: error={e}")
+            return True
+
+    def stats(self) -> dict:
+        return {"revoked": self.revoked, "lookup_errors": self.lookup_errors, **self.cache.stats()}
+
+
+def to_user_info(claims: dict) -> dict:
+    """토큰 claims를 UserModel 필드만 담은 사용자 정보로 변환"""
+    return {
+        "id": claims["id"],
+        "email": claims["email"],
+        "role": claims["role"],
+        "is_active": claims["is_active"],
+    }
+
+
+def validate_session_config():
+    """
+    signed 모드 설정을 확인합니다. 서비스 시작 시(lifespan) 호출하며, 잘못된 설정이면 RuntimeError로 시작을 중단합니다.
+    비밀 키가 없거나 예전 기본값이거나 32바이트보다 짧으면 토큰 위조를 막을 수 없고,
+    거부 목록이 Redis가 아니면 로그아웃한 토큰이 다른 프로세스에서 만료 전까지 계속 유효합니다.
+    """
+    if session_config.SESSION_MODE not in ("db", "signed"):
+        raise RuntimeError(f"SESSION_MODE는 db 또는 signed여야 합니다: {session_config.SESSION_MODE}")
+    if session_config.SESSION_MODE != "signed":
+        return
+    secret_key = session_config.SESSION_SECRET_KEY
+    if not secret_key or secret_key == PLACEHOLDER_SECRET_KEY:
+        raise RuntimeError("signed 세션 모드에는 SESSION_SECRET_KEY 설정이 필요합니다.")
+    if len(secret_key.encode("utf-8")) < MIN_SECRET_KEY_BYTES:
+        raise RuntimeError(f"SESSION_SECRET_KEY는 {MIN_SECRET_KEY_BYTES}바이트 이상이어야 합니다.")
+    if session_deny_list.cache.backend.name != "redis":
+        raise RuntimeError("signed 세션 모드에는 세션 거부 목록을 공유할 Redis 캐시가 필요합니다. (CACHE_BACKEND=redis)")
+
+
+# 싱글톤 패턴으로 세션 토큰 서명기/거부 목록 인스턴스 생성
+session_token_signer = SessionTokenSigner(
+    secret_key=session_config.SESSION_SECRET_KEY,
+    ttl_seconds=session_config.SESSION_TOKEN_TTL_SECONDS
+)
+session_deny_list = SessionDenyList(SharedCache(namespace="session:revoked"))
@@ -0,0 +1,328 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+from common.core.config import cache_config
+from common.core.logger import Logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+logger = Logger.getLogger(__name__)
+
+
+class CacheCodec:
+    """
+    캐시 값 직렬화 코덱
+    - auto: orjson이 있으면 orjson, 없으면 표준 json (둘 다 JSON 바이트라 서로 읽을 수 있음)
+    - msgpack: 명시적으로 지정한 경우에만 사용 (같은 Redis를 쓰는 모든 서비스가 같은 코덱이어야 함)
+    """
+
+    def __init__(self, name: str = "auto"):
+        if name == "auto":
+            name = "orjson" if orjson is not None else "json"
+        if name == "orjson" and orjson is None:
+            raise ValueError("orjson codec requires the orjson package")
+        if name == "msgpack" and msgpack is None:
+            raise ValueError("msgpack codec requires the msgpack package")
+        if name not in ("orjson", "msgpack", "json"):
+            raise ValueError(f"Unsupported cache codec: {name}")
+        self.name = name
+
+    def encode(self, value: Any) -> bytes:
+        if self.name == "orjson":
+            return orjson.dumps(value)
+        if self.name == "msgpack":
+            return msgpack.packb(value, use_bin_type=True)
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        if self.name == "orjson":
+            return orjson.loads(data)
+        if self.name == "msgpack":
+            return msgpack.unpackb(data, raw=False)
+        return json.loads(data)
+
+
+class CacheBackend:
+    """바이트 값을 저장하는 캐시 백엔드 공통 인터페이스 (TTL은 초 단위, None이면 만료 없음)"""
+
+    name = "base"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def mget(self, keys: list[str]) -> list[Optional[bytes]]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+        raise NotImplementedError
+
+    async def mset(self, items: dict[str, bytes], ttl: Optional[float] = None):
+        raise NotImplementedError
+
+    async def delete(self, keys: list[str]) -> int:
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+
+class InMemoryBackend(CacheBackend):
+    """
+    프로세스 내부 캐시 백엔드 (Redis가 없을 때의 대체, 로컬 개발/벤치마크용 stand-in)
+    max_entries를 넘으면 가장 오래 사용하지 않은 키부터 제거합니다.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[Optional[float], bytes]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._get(key)
+
+    async def mget(self, keys: list[str]) -> list[Optional[bytes]]:
+        return [self._get(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+        self._set(key, value, ttl)
+
+    async def mset(self, items: dict[str, bytes], ttl: Optional[float] = None):
+        for key, value in items.items():
+            self._set(key, value, ttl)
+
+    async def delete(self, keys: list[str]) -> int:
+        return sum(1 for key in keys if self._entries.pop(key, None) is not None)
+
+    def _get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: bytes, ttl: Optional[float]):
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class RedisBackend(CacheBackend):
+    """redis.asyncio 기반 공유 캐시 백엔드 (gunicorn 워커/컨테이너 간 공유)"""
+
+    name = "redis"
+
+    def __init__(self, url: str, max_connections: int, socket_timeout: float):
+        self.url = url
+        self._client = aioredis.from_url(
+            url,
+            max_connections=max_connections,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout
+        )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(key)
+
+    async def mget(self, keys: list[str]) -> list[Optional[bytes]]:
+        if not keys:
+            return []
+        return await self._client.mget(keys)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+        await self._client.set(key, value, px=self._ttl_ms(ttl))
+
+    async def mset(self, items: dict[str, bytes], ttl: Optional[float] = None):
+        # MSET은 키별 TTL을 줄 수 없으므로 SET PX를 파이프라인으로 한 번에 전송
+        if not items:
+            return
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, value, px=self._ttl_ms(ttl))
+            await pipe.execute()
+
+    async def delete(self, keys: list[str]) -> int:
+        if not keys:
+            return 0
+        return await self._client.delete(*keys)
+
+    async def close(self):
+        await self._client.aclose()
+
+    @staticmethod
+    def _ttl_ms(ttl: Optional[float]) -> Optional[int]:
+        return max(1, int(ttl * 1000)) if ttl is not None else None
+
+
+def create_cache_backend() -> CacheBackend:
+    """설정에 따라 백엔드를 만듭니다. Redis를 쓸 수 없으면 프로세스 내부 캐시로 대체합니다."""
+    if cache_config.CACHE_BACKEND == "redis":
+        if aioredis is None:
+            logger.warning("redis 패키지가 없어 프로세스 내부 캐시를 사용합니다. (pip install 'queryme-services[cache]')")
+        elif not cache_config.REDIS_URL:
+            logger.warning("REDIS_URL이 설정되지 않아 프로세스 내부 캐시를 사용합니다.")
+        else:
+            return RedisBackend(
+                url=cache_config.REDIS_URL,
+                max_connections=cache_config.REDIS_MAX_CONNECTIONS,
+                socket_timeout=cache_config.REDIS_SOCKET_TIMEOUT
+            )
+    return InMemoryBackend(max_entries=cache_config.CACHE_MEMORY_MAX_ENTRIES)
+
+
+class SharedCache:
+    """
+    네임스페이스 단위 캐시
+    - 키는 "{prefix}:{namespace}:{key}" 형태로 저장해 서비스/용도별로 겹치지 않게 함
+    - 값은 코덱으로 직렬화해 백엔드에 저장
+    - 캐시는 보조 수단이므로 백엔드 오류는 로그와 카운터만 남기고 miss로 처리 (fail-open)
+      조회 실패를 허용으로 처리하면 안 되는 곳은 오류를 그대로 던지는 get_or_raise 사용
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        backend: Optional[CacheBackend] = None,
+        codec: Optional[CacheCodec] = None,
+        default_ttl: Optional[float] = None
+    ):
+        self.namespace = namespace
+        self.backend = backend or shared_cache_backend
+        self.codec = codec or shared_cache_codec
+        self.default_ttl = default_ttl
+        self._prefix = f"{cache_config.CACHE_KEY_PREFIX}:{namespace}:"
+
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.deletes = 0
+        self.errors = 0
+
+    def key(self, key: str) -> str:
+        return self._prefix + key
+
+    async def get(self, key: str) -> Any:
+        try:
+            data = await self.backend.get(self.key(key))
+        except Exception as e:
+            self._on_error("get", e)
+            return None
+        return self._decode(data)
+
+    async def get_or_raise(self, key: str) -> Any:
+        """
+        get과 같지만 백엔드 오류를 miss로 바꾸지 않고 그대로 던집니다.
+        거부 목록처럼 조회 실패를 허용으로 처리하면 안 되는 곳(fail-closed)에서 사용합니다.
+        """
+        try:
+            data = await self.backend.get(self.key(key))
+            if data is None:
+                self.misses += 1
+                return None
+            value = self.codec.decode(data)
+        except Exception as e:
+            self._on_error("get", e)
+            raise
+        self.hits += 1
+        return value
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """여러 키를 한 번에(MGET) 조회합니다. 찾은 키만 담아 반환"""
+        keys = list(keys)
+        try:
+            values = await self.backend.mget([self.key(key) for key in keys])
+        except Exception as e:
+            self._on_error("mget", e)
+            self.misses += len(keys)
+            return {}
+        found = {}
+        for key, data in zip(keys, values):
+            value = self._decode(data)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        ttl = ttl if ttl is not None else self.default_ttl
+        if ttl is not None and ttl <= 0:
+            return
+        try:
+            await self.backend.set(self.key(key), self.codec.encode(value), ttl)
+            self.sets += 1
+        except Exception as e:
+            self._on_error("set", e)
+
+    async def set_many(self, items: dict[str, Any], ttl: Optional[float] = None):
+        ttl = ttl if ttl is not None else self.default_ttl
+        if not items or (ttl is not None and ttl <= 0):
+            return
+        try:
+            await self.backend.mset({self.key(key): self.codec.encode(value) for key, value in items.items()}, ttl)
+            self.sets += len(items)
+        except Exception as e:
+            self._on_error("mset", e)
+
+    async def delete(self, *keys: str):
+        if not keys:
+            return
+        try:
+            self.deletes += await self.backend.delete([self.key(key) for key in keys])
+        except Exception as e:
+            self._on_error("delete", e)
+
+    def stats(self) -> dict:
+        return {
+            "backend": self.backend.name,
+            "codec": self.codec.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "deletes": self.deletes,
+            "errors": self.errors,
+        }
+
+    def _decode(self, data: Optional[bytes]) -> Any:
+        if data is None:
+            self.misses += 1
+            return None
+        try:
+            value = self.codec.decode(data)
+        except Exception as e:
+            self._on_error("decode", e)
+            return None
+        self.hits += 1
+        return value
+
+    def _on_error(self, operation: str, error: Exception):
+        self.errors += 1
+        logger.warning(f"Cache {operation} failed: namespace={self.namespace}, error={error}")
+
+
+async def close_shared_cache():
+    """lifespan 종료 시 공유 캐시 백엔드 연결을 닫습니다."""
+    await shared_cache_backend.close()
+
+
+# 싱글톤 패턴으로 프로세스 공유 캐시 백엔드/코덱 인스턴스 생성
+shared_cache_backend = create_cache_backend()
+shared_cache_codec = CacheCodec(cache_config.CACHE_CODEC)
@@ -0,0 +1,38 @@
+import pytest
+from common.db.redis import CacheBackend, CacheCodec, InMemoryBackend, SharedCache
+
+
+class FailingBackend(CacheBackend):
+    """모든 호출이 연결 오류를 내는 백엔드"""
+
+    name = "failing"
+
+    async def get(self, key):
+        raise ConnectionError("down")
+
+    async def mget(self, keys):
+        raise ConnectionError("down")
+
+    async def set(self, key, value, ttl=None):
+        raise ConnectionError("down")
+
+    async def mset(self, items, ttl=None):
+        raise ConnectionError("down")
+
+    async def delete(self, keys):
+        raise ConnectionError("down")
+
+
+@pytest.fixture
+def failing_backend() -> CacheBackend:
+    return FailingBackend()
+
+
+@pytest.fixture
+def memory_backend() -> InMemoryBackend:
+    return InMemoryBackend(max_entries=100)
+
+
+@pytest.fixture
+def cache(memory_backend: InMemoryBackend) -> SharedCache:
+    return SharedCache(namespace="test", backend=memory_backend, codec=CacheCodec("json"))
@@ -0,0 +1,210 @@
+import pytest
+import common.db.redis as redis_module
+from common.core.config import cache_config
+from common.db.redis import CacheBackend, CacheCodec, InMemoryBackend, RedisBackend, SharedCache
+
+SESSION_VALUE = {
+    "user": {"id": 1, "email": "user@queryme.io", "role": "user", "is_active": True},
+    "expires_at": 1792300000.123456,
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(redis_module.time, "monotonic", clock)
+    return clock
+
+
+# InMemoryBackend
+async def test_memory_backend_expires_entries_after_ttl(clock: FakeClock):
+    backend = InMemoryBackend(max_entries=10)
+    await backend.set("short", b"1", ttl=5)
+    await backend.set("forever", b"2")
+
+    clock.now += 4.9
+    assert await backend.get("short") == b"1"
+
+    clock.now += 0.1
+    assert await backend.get("short") is None
+    assert await backend.mget(["short", "forever"]) == [None, b"2"]
+
+
+async def test_memory_backend_evicts_least_recently_used():
+    backend = InMemoryBackend(max_entries=2)
+    await backend.set("a", b"1")
+    await backend.set("b", b"2")
+    # a를 읽어 최근 사용으로 만든 뒤 c를 넣으면 b가 제거됨
+    assert await backend.get("a") == b"1"
+    await backend.set("c", b"3")
+
+    assert await backend.mget(["a", "b", "c"]) == [b"1", None, b"3"]
+
+
+async def test_memory_backend_delete_counts_existing_keys():
+    backend = InMemoryBackend(max_entries=10)
+    await backend.mset({"a": b"1", "b": b"2"})
+
+    assert await backend.delete(["a", "missing"]) == 1
+    assert await backend.get("a") is None
+
+
+# SharedCache
+async def test_shared_cache_prefixes_keys_with_namespace(memory_backend: InMemoryBackend):
+    first = SharedCache(namespace="first", backend=memory_backend, codec=CacheCodec("json"))
+    second = SharedCache(namespace="second", backend=memory_backend, codec=CacheCodec("json"))
+
+    await first.set("key", "first-value")
+    await second.set("key", "second-value")
+
+    assert first.key("key") == f"{cache_config.CACHE_KEY_PREFIX}:first:key"
+    assert await memory_backend.get(first.key("key")) == b'"first-value"'
+    assert await first.get("key") == "first-value"
+    assert await second.get("key") == "second-value"
+
+
+async def test_shared_cache_get_many_returns_found_keys_only(cache: SharedCache):
+    await cache.set_many({"a": 1, "b": {"nested": [1, 2]}}, ttl=60)
+
+    assert await cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": {"nested": [1, 2]}}
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["sets"] == 2
+
+
+async def test_shared_cache_skips_non_positive_ttl(cache: SharedCache):
+    await cache.set("a", 1, ttl=0)
+    await cache.set_many({"b": 2}, ttl=-1)
+
+    assert await cache.get_many(["a", "b"]) == {}
+    assert cache.stats()["sets"] == 0
+
+
+async def test_shared_cache_delete(cache: SharedCache):
+    await cache.set_many({"a": 1, "b": 2})
+    await cache.delete("a", "missing")
+
+    assert await cache.get_many(["a", "b"]) == {"b": 2}
+    assert cache.stats()["deletes"] == 1
+
+
+async def test_shared_cache_fails_open_on_backend_errors(failing_backend: CacheBackend):
+    cache = SharedCache(namespace="test", backend=failing_backend, codec=CacheCodec("json"))
+
+    await cache.set("a", 1)
+    await cache.set_many({"a": 1})
+    await cache.delete("a")
+    assert await cache.get("a") is None
+    assert await cache.get_many(["a", "b"]) == {}
+
+    stats = cache.stats()
+    assert stats["errors"] == 5
+    assert stats["misses"] == 2
+
+
+async def test_shared_cache_get_or_raise_propagates_errors(failing_backend: CacheBackend, cache: SharedCache):
+    failing = SharedCache(namespace="test", backend=failing_backend, codec=CacheCodec("json"))
+    with pytest.raises(ConnectionError):
+        await failing.get_or_raise("a")
+    assert failing.stats()["errors"] == 1
+
+    await cache.set("a", 1)
+    assert await cache.get_or_raise("a") == 1
+    assert await cache.get_or_raise("missing") is None
+
+
+async def test_shared_cache_treats_undecodable_values_as_errors(cache: SharedCache, memory_backend: InMemoryBackend):
+    await memory_backend.set(cache.key("broken"), b"{not json")
+
+    assert await cache.get("broken") is None
+    assert cache.stats()["errors"] == 1
+
+
+# CacheCodec
+@pytest.mark.parametrize("name", ["json", "orjson", "msgpack"])
+def test_codec_round_trip(name: str):
+    try:
+        codec = CacheCodec(name)
+    except ValueError:
+        pytest.skip(f"{name} package is not installed")
+
+    assert codec.decode(codec.encode(SESSION_VALUE)) == SESSION_VALUE
+    assert codec.decode(codec.encode("한글 값")) == "한글 값"
+
+
+def test_json_codecs_are_interchangeable():
+    try:
+        fast = CacheCodec("orjson")
+    except ValueError:
+        pytest.skip("orjson package is not installed")
+    plain = CacheCodec("json")
+
+    assert plain.decode(fast.encode(SESSION_VALUE)) == SESSION_VALUE
+    assert fast.decode(plain.encode(SESSION_VALUE)) == SESSION_VALUE
+
+
+def test_codec_auto_and_unknown():
+    assert CacheCodec("auto").name in ("orjson", "json")
+    with pytest.raises(ValueError):
+        CacheCodec("pickle")
+
+
+# RedisBackend
+@pytest.fixture
+async def redis_backend():
+    fakeredis = pytest.importorskip("fakeredis")
+    if redis_module.aioredis is None:
+        pytest.skip("redis package is not installed")
+    backend = RedisBackend(url="redis://localhost:6379/15", max_connections=10, socket_timeout=1.0)
+    # 실제 서버 대신 fakeredis 클라이언트로 교체
+    await backend.close()
+    backend._client = fakeredis.FakeAsyncRedis()
+    yield backend
+    await backend._client.flushall()
+    await backend.close()
+
+
+async def test_redis_backend_get_set_delete(redis_backend: RedisBackend):
+    await redis_backend.set("a", b"1")
+
+    assert await redis_backend.get("a") == b"1"
+    assert await redis_backend.delete(["a", "missing"]) == 1
+    assert await redis_backend.get("a") is None
+    assert await redis_backend.delete([]) == 0
+
+
+async def test_redis_backend_sets_ttl_in_milliseconds(redis_backend: RedisBackend):
+    await redis_backend.set("short", b"1", ttl=1.5)
+    await redis_backend.mset({"x": b"1", "y": b"2"}, ttl=0.0001)
+    await redis_backend.set("forever", b"2")
+
+    assert 0 < await redis_backend._client.pttl("short") <= 1500
+    # 1ms 미만 TTL도 만료 없는 키가 되지 않도록 최소 1ms
+    assert await redis_backend._client.pttl("x") <= 1
+    assert await redis_backend._client.pttl("forever") == -1
+
+
+async def test_redis_backend_mget_and_pipelined_mset(redis_backend: RedisBackend):
+    await redis_backend.mset({"a": b"1", "b": b"2"}, ttl=60)
+
+    assert await redis_backend.mget(["a", "missing", "b"]) == [b"1", None, b"2"]
+    assert await redis_backend.mget([]) == []
+    assert 0 < await redis_backend._client.pttl("b") <= 60000
+
+
+async def test_shared_cache_on_redis_backend(redis_backend: RedisBackend):
+    cache = SharedCache(namespace="auth:session", backend=redis_backend, codec=CacheCodec("json"))
+    await cache.set("session", SESSION_VALUE, ttl=30)
+    await cache.set_many({"a": 1, "b": 2}, ttl=30)
+
+    assert await cache.get("session") == SESSION_VALUE
+    assert await cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+    assert await redis_backend._client.exists(f"{cache_config.CACHE_KEY_PREFIX}:auth:session:session") == 1
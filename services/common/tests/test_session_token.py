@@ -0,0 +1,113 @@
+import base64
+import json
+import time
+import pytest
+from common.core.config import session_config
+from common.core.session_token import SessionDenyList, SessionTokenSigner, session_deny_list, validate_session_config
+from common.db.redis import CacheBackend, CacheCodec, SharedCache
+
+SECRET_KEY = "test-secret-key-that-is-long-enough"
+USER = {"id": 1, "email": "user@queryme.io", "role": "user", "is_active": True}
+
+
+@pytest.fixture
+def signer() -> SessionTokenSigner:
+    return SessionTokenSigner(secret_key=SECRET_KEY, ttl_seconds=60)
+
+
+def signed_token(signer: SessionTokenSigner, claims) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode("utf-8")).decode("ascii").rstrip("=")
+    return f"{payload}.{signer._sign(payload)}"
+
+
+def test_verify_round_trip(signer: SessionTokenSigner):
+    token, claims = signer.issue(USER)
+
+    assert signer.verify(token) == claims
+    assert signer.stats()["verified"] == 1
+
+
+@pytest.mark.parametrize("token", ["abc.é", "é.abc", "no-dot", "abc.def", "", None])
+def test_verify_rejects_malformed_tokens(signer: SessionTokenSigner, token):
+    assert signer.verify(token) is None
+
+
+def test_verify_rejects_tampered_payload(signer: SessionTokenSigner):
+    token, _ = signer.issue(USER)
+    other, _ = signer.issue({**USER, "role": "admin"})
+
+    assert signer.verify(f"{other.split('.')[0]}.{token.split('.')[1]}") is None
+
+
+@pytest.mark.parametrize("claims", [
+    ["not", "a", "dict"],
+    "string",
+    {"id": 1, "exp": int(time.time()) + 60},
+    {**USER, "jti": "x"},
+    {**USER, "exp": "later", "jti": "x"},
+])
+def test_verify_rejects_invalid_claims(signer: SessionTokenSigner, claims):
+    assert signer.verify(signed_token(signer, claims)) is None
+    assert signer.stats()["invalid"] == 1
+
+
+def test_verify_rejects_expired_token(signer: SessionTokenSigner):
+    token = signed_token(signer, {**USER, "exp": int(time.time()) - 1, "jti": "x"})
+
+    assert signer.verify(token) is None
+    assert signer.stats()["expired"] == 1
+
+
+async def test_deny_list_revokes_until_expiry(cache: SharedCache, signer: SessionTokenSigner):
+    deny_list = SessionDenyList(cache)
+    _, claims = signer.issue(USER)
+
+    assert not await deny_list.is_revoked(claims)
+    await deny_list.revoke(claims)
+    assert await deny_list.is_revoked(claims)
+
+
+async def test_deny_list_fails_closed_on_lookup_error(failing_backend: CacheBackend, signer: SessionTokenSigner):
+    deny_list = SessionDenyList(SharedCache(namespace="revoked", backend=failing_backend, codec=CacheCodec("json")))
+    _, claims = signer.issue(USER)
+
+    assert await deny_list.is_revoked(claims)
+    assert deny_list.stats()["lookup_errors"] == 1
+
+
+@pytest.fixture
+def redis_deny_list(monkeypatch):
+    """signed 모드 검증용으로 거부 목록 백엔드를 Redis로 간주"""
+    monkeypatch.setattr(session_deny_list.cache.backend, "name", "redis")
+
+
+@pytest.mark.parametrize("secret_key", ["", "change-me", "short-secret"])
+def test_validate_rejects_weak_secret_in_signed_mode(monkeypatch, redis_deny_list, secret_key: str):
+    monkeypatch.setattr(session_config, "SESSION_MODE", "signed")
+    monkeypatch.setattr(session_config, "SESSION_SECRET_KEY", secret_key)
+
+    with pytest.raises(RuntimeError):
+        validate_session_config()
+
+
+def test_validate_rejects_signed_mode_without_redis(monkeypatch):
+    monkeypatch.setattr(session_config, "SESSION_MODE", "signed")
+    monkeypatch.setattr(session_config, "SESSION_SECRET_KEY", SECRET_KEY)
+    monkeypatch.setattr(session_deny_list.cache.backend, "name", "memory")
+
+    with pytest.raises(RuntimeError):
+        validate_session_config()
+
+
+def test_validate_session_config(monkeypatch, redis_deny_list):
+    monkeypatch.setattr(session_config, "SESSION_MODE", "db")
+    monkeypatch.setattr(session_config, "SESSION_SECRET_KEY", "")
+    validate_session_config()
+
+    monkeypatch.setattr(session_config, "SESSION_MODE", "signed")
+    monkeypatch.setattr(session_config, "SESSION_SECRET_KEY", SECRET_KEY)
+    validate_session_config()
+
+    monkeypatch.setattr(session_config, "SESSION_MODE", "jwt")
+    with pytest.raises(RuntimeError):
+        validate_session_config()
@@ -27,14 +27,16 @@ class DBConfig(BaseSettings):
     DB_PORT: str
     DB_NAME: str
 
-# class Settings(BaseSettings):
-#     class Config(Config):
-#         pass
+class Settings(BaseSettings):
+    class Config(Config):
+        pass
 
-#     SECRET_KEY: str = "your-secret"
-#     ALGORITHM: str = "HS256"
-#     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    # 연결 정보 수정/삭제 시 엔진 무효화를 알릴 nl2sql 서비스 URL (비어 있으면 호출하지 않음)
+    NL2SQL_SERVICE_URL: str = ""
+    NL2SQL_INVALIDATE_TIMEOUT: float = 3.0
+    # nl2sql 서비스 내부 API 호출용 공유 토큰 (nl2sql 서비스의 INTERNAL_API_TOKEN과 같은 값)
+    INTERNAL_API_TOKEN: str = ""
 
-# settings = Settings()
+settings = Settings()
 
 db_config = DBConfig()
@@ -2,7 +2,7 @@ import os
 from contextlib import asynccontextmanager
 import sys
 import subprocess
-from core.config import PROFILE
+from core.config import PROFILE, settings
 
 if PROFILE == "local":
     project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -28,6 +28,9 @@ async def lifespan(app: FastAPI):
         raise
     except FileNotFoundError:
         logger.warning("Alembic not found, skipping migration")
+
+    if not settings.NL2SQL_SERVICE_URL:
+        logger.warning("NL2SQL_SERVICE_URL is not set; engine invalidation on connection update/delete is disabled")
     
     yield
 
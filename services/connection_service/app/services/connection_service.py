@@ -5,6 +5,7 @@ from schemas.request import (
     ConnectionDeleteRequest
 )
 from schemas.connection import ConnectionModel
+from utils.http_util import invalidate_nl2sql_engine
 
 async def create_connection_service(request: ConnectionCreateRequest):
     connection = await connection_crud.create_connection(request)
@@ -16,10 +17,12 @@ async def get_connection_service(connection_id: str):
 
 async def update_connection_service(request: ConnectionUpdateRequest):
     connection = await connection_crud.update_connection(request)
+    await invalidate_nl2sql_engine(request.connection_id)
     return ConnectionModel.model_validate(connection)
 
 async def delete_connection_service(request: ConnectionDeleteRequest):
     connection = await connection_crud.delete_connection(request)
+    await invalidate_nl2sql_engine(request.connection_id)
     return ConnectionModel.model_validate(connection)
 
 async def get_connection_list_service(user_id: int):
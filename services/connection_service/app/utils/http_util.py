@@ -0,0 +1,27 @@
+import httpx
+from core.config import settings
+from common.core.logger import Logger
+
+logger = Logger.getLogger(__name__)
+
+
+async def invalidate_nl2sql_engine(connection_id: str):
+    """
+    nl2sql 서비스에 캐시된 대상 DB 엔진 무효화를 요청합니다.
+    무효화 실패가 연결 정보 수정/삭제를 막지 않도록 오류는 로그만 남깁니다.
+    """
+    if not settings.NL2SQL_SERVICE_URL:
+        return
+
+    url = f"{settings.NL2SQL_SERVICE_URL}/engine/invalidate"
+    try:
+        async with httpx.AsyncClient(timeout=settings.NL2SQL_INVALIDATE_TIMEOUT) as client:
+            response = await client.post(
+                url,
+                json={"connection_id": str(connection_id)},
+                headers={"X-Internal-Token": settings.INTERNAL_API_TOKEN}
+            )
+        if response.status_code != 200:
+            logger.warning(f"nl2sql 엔진 무효화 실패: connection_id={connection_id}, status={response.status_code}")
+    except httpx.HTTPError as e:
+        logger.warning(f"nl2sql 엔진 무효화 요청 오류: connection_id={connection_id}, error={e}")
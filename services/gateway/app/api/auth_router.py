@@ -1,12 +1,16 @@
 from fastapi import APIRouter, Request, Response
 from core.config import settings
 from core.proxy import proxy_service
+from core.auth_cache import auth_cache
 from common.core.logger import Logger
 
 logger = Logger.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# 세션이 바뀌는 경로 - 통과 시 캐시된 사용자 정보를 무효화
+SESSION_CHANGING_PATHS = {"login", "logout"}
+
 
 @router.api_route(
     "/{path:path}",
@@ -26,13 +30,19 @@ async def proxy_auth_requests(request: Request, path: str) -> Response:
         auth_service_url = settings.get_auth_service_url()
         
         logger.info(f"Routing auth request to: {auth_service_url} (profile: {settings.profile})")
-        
+
         # 프록시로 요청 전달
-        return await proxy_service.forward_request(
+        response = await proxy_service.forward_request(
             request=request,
             target_url=auth_service_url,
             path_prefix="/auth"
         )
+
+        # 세션 삭제가 끝난 뒤 무효화해야 처리 중에 들어온 /auth/me가 이전 세션을 다시 캐시하지 않음
+        if path.strip("/") in SESSION_CHANGING_PATHS and response.status_code < 400:
+            auth_cache.invalidate(request.cookies.get("session_id"))
+
+        return response
         
     except ValueError as e:
         logger.error(f"Configuration error: {e}")
@@ -7,6 +7,9 @@ logger = Logger.getLogger(__name__)
 
 router = APIRouter(prefix="/nl2sql", tags=["nl2sql"])
 
+# 서비스 간 내부 API는 gateway로 노출하지 않음
+BLOCKED_PATH_PREFIXES = ("engine/",)
+
 
 @router.api_route(
     "/{path:path}",
@@ -21,6 +24,9 @@ async def proxy_nl2sql_requests(request: Request, path: str) -> Response:
     - local: localhost:8083으로 라우팅
     - prod: nl2sql_service:8080으로 라우팅
     """
+    if path.lstrip("/").startswith(BLOCKED_PATH_PREFIXES):
+        return Response(content="Not Found", status_code=404, media_type="text/plain")
+
     try:
         # 환경에 따른 NL2SQL 서비스 URL 가져오기
         nl2sql_service_url = settings.get_nl2sql_service_url()
@@ -0,0 +1,147 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+from core.config import settings
+from common.core.logger import Logger
+
+logger = Logger.getLogger(__name__)
+
+
+class AuthCache:
+    """
+    /auth/me 조회 결과를 session_id 쿠키 기준으로 보관하는 TTL + LRU 캐시
+    - 항목의 만료 시각은 min(설정 TTL, 세션 expires_at)
+    - 최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - 워커 프로세스 단위 캐시이므로 다른 워커의 로그아웃/세션 삭제는 TTL 이내에 반영됨 (TTL은 수 초로 짧게 유지)
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # session_id -> (user_info, expire_at(monotonic))
+        self._entries: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+        # user_id -> session_id 집합 (사용자 단위 무효화용)
+        self._user_sessions: dict[int, set[str]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, session_id: str) -> Optional[dict]:
+        """캐시된 사용자 정보를 반환합니다. 없거나 만료되었으면 None"""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        user_info, expire_at = entry
+        if expire_at <= time.monotonic():
+            self._remove(session_id)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(session_id)
+        self.hits += 1
+        return user_info
+
+    def set(self, session_id: str, user_info: dict, session_expires_at: Optional[float] = None):
+        """
+        사용자 정보를 캐시에 저장합니다.
+
+        Args:
+            session_id: 세션 쿠키 값
+            user_info: /auth/me 응답 본문
+            session_expires_at: 세션 만료 시각 (epoch seconds)
+        """
+        if not self.enabled:
+            return
+
+        ttl = self.ttl_seconds
+        if session_expires_at is not None:
+            ttl = min(ttl, session_expires_at - time.time())
+        if ttl <= 0:
+            return
+
+        if session_id in self._entries:
+            self._remove(session_id)
+
+        self._entries[session_id] = (user_info, time.monotonic() + ttl)
+        user_id = self._get_user_id(user_info)
+        if user_id is not None:
+            self._user_sessions.setdefault(user_id, set()).add(session_id)
+
+        while len(self._entries) > self.max_entries:
+            oldest_session_id = next(iter(self._entries))
+            self._remove(oldest_session_id)
+            self.evictions += 1
+
+    def invalidate(self, session_id: Optional[str]):
+        """
+        세션과 해당 사용자의 다른 세션을 함께 무효화합니다.
+        auth_service는 로그인/로그아웃 시 사용자의 모든 세션을 삭제하기 때문입니다.
+        """
+        if not session_id:
+            return
+
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return
+
+        user_id = self._get_user_id(entry[0])
+        session_ids = self._user_sessions.get(user_id, {session_id}) if user_id is not None else {session_id}
+        for cached_session_id in list(session_ids):
+            self._remove(cached_session_id)
+            self.invalidations += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._user_sessions.clear()
+
+    def stats(self) -> dict:
+        """캐시 지표를 반환합니다."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, session_id: str):
+        entry = self._entries.pop(session_id, None)
+        if entry is None:
+            return
+
+        user_id = self._get_user_id(entry[0])
+        session_ids = self._user_sessions.get(user_id)
+        if session_ids is not None:
+            session_ids.discard(session_id)
+            if not session_ids:
+                del self._user_sessions[user_id]
+
+    @staticmethod
+    def _get_user_id(user_info: dict) -> Optional[int]:
+        try:
+            return user_info["data"]["id"]
+        except (KeyError, TypeError):
+            return None
+
+
+# 싱글톤 패턴으로 캐시 인스턴스 생성
+auth_cache = AuthCache(
+    max_entries=settings.auth_cache_max_entries,
+    ttl_seconds=settings.auth_cache_ttl_seconds
+)
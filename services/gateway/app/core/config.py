@@ -1,5 +1,6 @@
 import os
 import ast
+import json
 from typing import Dict
 from pydantic import BaseModel, field_validator
 from pydantic_settings import BaseSettings
@@ -22,6 +23,14 @@ class ServiceEndpoint(BaseModel):
         return f"http://{self.host}:{self.port}"
 
 
+class UpstreamPoolConfig(BaseModel):
+    """업스트림 서비스별 HTTP 커넥션 풀 설정"""
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 5.0
+    http2: bool = False
+
+
 class GatewaySettings(BaseSettings):
     profile: str = PROFILE
     
@@ -77,6 +86,25 @@ class GatewaySettings(BaseSettings):
 
     cors_origins: list[str] = ["*"]
 
+    # 업스트림 커넥션 풀 기본값 (서비스별 upstream_pools 설정이 우선)
+    upstream_max_connections: int = 100
+    upstream_max_keepalive_connections: int = 20
+    upstream_keepalive_expiry: float = 5.0
+    upstream_http2: bool = False
+
+    # 서비스별 풀 설정 오버라이드
+    # 예) upstream_pools={"nl2sql_service": {"max_connections": 200}, "auth_service": {"http2": true}}
+    upstream_pools: dict[str, dict] = {}
+
+    # /auth/me 사용자 정보 캐시 설정 (0이면 캐시 비활성화)
+    # 워커 프로세스 단위 캐시이므로 다른 워커/인스턴스를 거친 로그아웃이나 세션 삭제는
+    # 최대 auth_cache_ttl_seconds 동안 반영되지 않음 (세션 폐기 지연 상한)
+    auth_cache_max_entries: int = 10000
+    auth_cache_ttl_seconds: float = 5.0
+
+    # /metrics 조회용 운영자 토큰 (X-Metrics-Token 헤더, 비어 있으면 /metrics 비활성화)
+    metrics_token: str = ""
+
     @field_validator('cors_origins', mode='before')
     def parse_cors_origins(cls, v):
         try:
@@ -89,6 +117,17 @@ class GatewaySettings(BaseSettings):
         except:
             return []
 
+    @field_validator('upstream_pools', mode='before')
+    def parse_upstream_pools(cls, v):
+        try:
+            if isinstance(v, str):
+                return json.loads(v)
+            elif isinstance(v, dict):
+                return v
+            else:
+                return {}
+        except:
+            return {}
     
     class Config:
         extra = "allow"
@@ -157,6 +196,26 @@ class GatewaySettings(BaseSettings):
         else:
             raise ValueError(f"Unknown profile: {self.profile}. Supported profiles: local, prod")
     
+    def get_upstream_urls(self) -> Dict[str, str]:
+        """업스트림 서비스 이름별 URL을 반환합니다."""
+        return {
+            "auth_service": self.get_auth_service_url(),
+            "connection_service": self.get_connection_service_url(),
+            "nl2sql_service": self.get_nl2sql_service_url(),
+            "ddl_session_service": self.get_ddl_session_service_url(),
+            "history_service": self.get_history_service_url(),
+        }
+    
+    def get_upstream_pool_config(self, service_name: str) -> UpstreamPoolConfig:
+        """서비스별 커넥션 풀 설정을 반환합니다. 지정하지 않은 항목은 기본값을 사용합니다."""
+        return UpstreamPoolConfig(**{
+            "max_connections": self.upstream_max_connections,
+            "max_keepalive_connections": self.upstream_max_keepalive_connections,
+            "keepalive_expiry": self.upstream_keepalive_expiry,
+            "http2": self.upstream_http2,
+            **self.upstream_pools.get(service_name, {})
+        })
+    
     def get_service_info(self) -> Dict:
         """서비스 정보를 반환합니다."""
         return {
@@ -1,39 +1,59 @@
 import json
-import httpx
 from typing import Optional
-from fastapi import Request, Response
+from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 from core.config import settings
+from core.auth_cache import auth_cache
+from core.proxy import proxy_service
 from common.core.logger import Logger
+from common.core.config import session_config
+from common.core.session_token import (
+    SESSION_TOKEN_COOKIE,
+    session_token_signer,
+    session_deny_list,
+    to_user_info
+)
 
 logger = Logger.getLogger(__name__)
 
+USER_INFO_HEADER = b"x-user-info"
 
-class AuthMiddleware(BaseHTTPMiddleware):
+
+class AuthMiddleware:
     """
-    인증 미들웨어
+    인증 미들웨어 (순수 ASGI)
     /auth 경로가 아닌 모든 요청에 대해 /auth/me로 사용자 정보를 조회하고
     헤더에 사용자 정보를 추가하여 요청을 처리합니다.
+
+    BaseHTTPMiddleware와 달리 요청/응답을 별도 태스크나 메모리 스트림으로 감싸지 않으므로
+    SSE 같은 스트리밍 응답이 버퍼링 없이 그대로 전달됩니다.
     """
     
-    def __init__(self, app, skip_paths: Optional[list] = None):
-        super().__init__(app)
-        self.skip_paths = skip_paths or ["/", "/health", "/docs", "/redoc", "/openapi.json"]
-        self.client = httpx.AsyncClient(timeout=httpx.Timeout(10.0))
+    def __init__(self, app: ASGIApp, skip_paths: Optional[list] = None):
+        self.app = app
+        # /metrics는 세션 대신 운영자 토큰(metrics_token)으로 보호
+        self.skip_paths = skip_paths or ["/", "/health", "/metrics", "/docs", "/redoc", "/openapi.json"]
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """미들웨어 실행 로직"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         
         # OPTIONS 요청은 CORS preflight이므로 인증 스킵
         if request.method == "OPTIONS":
             logger.debug(f"Skipping auth middleware for OPTIONS request: {request.url.path}")
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         
         # /auth 경로거나 스킵할 경로면 그대로 진행
         if self._should_skip_auth(request.url.path):
             logger.debug(f"Skipping auth middleware for path: {request.url.path}")
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         
         # 사용자 정보 조회
         user_info = await self._get_user_info(request)
@@ -44,27 +64,22 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 status_code=401,
                 content={"detail": "Authentication required"}
             )
-            
-            # CORS 헤더 직접 추가
-            # response.headers["Access-Control-Allow-Origin"] = "http://localhost:5173"
-            # response.headers["Access-Control-Allow-Credentials"] = "true"
-            # response.headers["Access-Control-Allow-Methods"] = "*"
-            # response.headers["Access-Control-Allow-Headers"] = "*"
-            
-            return response
+            await response(scope, receive, send)
+            return
         
         # 사용자 정보를 헤더에 추가
         user_info_json = json.dumps(user_info, ensure_ascii=False)
         logger.debug(f"Adding user info to headers: {user_info_json}")
         
-        # 요청 헤더에 사용자 정보 추가
-        request.headers.__dict__["_list"].append(
-            (b"x-user-info", user_info_json.encode("utf-8"))
-        )
+        # 클라이언트가 보낸 x-user-info는 버리고 조회한 사용자 정보로 대체
+        headers = [
+            (name, value) for name, value in scope["headers"]
+            if name != USER_INFO_HEADER
+        ]
+        headers.append((USER_INFO_HEADER, user_info_json.encode("utf-8")))
         
         # 다음 미들웨어/핸들러로 진행
-        response = await call_next(request)
-        return response
+        await self.app({**scope, "headers": headers}, receive, send)
     
     def _should_skip_auth(self, path: str) -> bool:
         """인증을 스킵할 경로인지 확인"""
@@ -82,7 +97,20 @@ class AuthMiddleware(BaseHTTPMiddleware):
     async def _get_user_info(self, request: Request) -> Optional[dict]:
         """
         /auth/me 엔드포인트로 사용자 정보 조회
+        session_id 쿠키 기준으로 캐시된 결과가 있으면 auth 서비스를 호출하지 않습니다.
+        signed 모드에서 세션 토큰이 있으면 auth 서비스 호출 없이 로컬에서 검증합니다.
         """
+        if session_config.SESSION_MODE == "signed":
+            token = request.cookies.get(SESSION_TOKEN_COOKIE)
+            if token:
+                return await self._verify_session_token(token)
+
+        session_id = request.cookies.get("session_id")
+        if session_id:
+            user_info = auth_cache.get(session_id)
+            if user_info is not None:
+                return user_info
+
         try:
             # auth 서비스 URL 가져오기
             auth_service_url = settings.get_auth_service_url()
@@ -94,15 +122,21 @@ class AuthMiddleware(BaseHTTPMiddleware):
             logger.debug(f"Fetching user info from: {me_url}")
             logger.debug(f"Auth headers: {auth_headers}")
             
-            # /auth/me 요청 보내기
-            response = await self.client.get(
-                me_url,
-                headers=auth_headers
+            # /auth/me 요청 보내기 - 프록시와 같은 auth 서비스 전용 커넥션 풀 사용
+            upstream = proxy_service.get_upstream(auth_service_url)
+            response = await upstream.send(
+                upstream.build_request("GET", me_url, headers=auth_headers, timeout=10.0)
             )
             
             if response.status_code == 200:
                 user_info = response.json()
                 logger.debug(f"Successfully fetched user info: {user_info}")
+                if session_id:
+                    auth_cache.set(
+                        session_id,
+                        user_info,
+                        self._parse_session_expires_at(response.headers.get("x-session-expires-at"))
+                    )
                 return user_info
             else:
                 logger.warning(f"Failed to fetch user info: status={response.status_code}, response={response.text}")
@@ -112,6 +146,22 @@ class AuthMiddleware(BaseHTTPMiddleware):
             logger.error(f"Error fetching user info: {e}")
             return None
     
+    @staticmethod
+    async def _verify_session_token(token: str) -> Optional[dict]:
+        """서명/만료와 로그아웃 거부 목록을 확인하고 /auth/me와 같은 형태의 사용자 정보를 반환"""
+        claims = session_token_signer.verify(token)
+        if claims is None or await session_deny_list.is_revoked(claims):
+            return None
+        return {"code": 200, "errMsg": "success", "data": to_user_info(claims)}
+
+    @staticmethod
+    def _parse_session_expires_at(value: Optional[str]) -> Optional[float]:
+        """auth 서비스가 내려준 세션 만료 시각(epoch seconds)을 파싱"""
+        try:
+            return float(value) if value else None
+        except ValueError:
+            return None
+    
     def _extract_auth_headers(self, request: Request) -> dict:
         """요청에서 인증 관련 헤더 추출"""
         auth_headers = {}
@@ -123,9 +173,3 @@ class AuthMiddleware(BaseHTTPMiddleware):
             auth_headers[auth_header_name] = request.headers[auth_header_name]
         
         return auth_headers
-    
-    async def __aenter__(self):
-        return self
-    
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
@@ -1,24 +1,185 @@
 import traceback
+import time
 import httpx
-from typing import Optional
+from typing import AsyncIterator, Optional
 from fastapi import Request, Response
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from core.config import settings, UpstreamPoolConfig
 from common.core.logger import Logger
-import asyncio
-import json
+import re
 import uuid
 
 logger = Logger.getLogger(__name__)
 
+# 본문에서 ddl_session_id를 찾을 때 읽어 볼 최대 앞부분 크기
+SESSION_ID_PEEK_BYTES = 4096
+SESSION_ID_PATTERN = re.compile(rb'"ddl_session_id"\s*:\s*"([^"\\]{1,128})"')
+
+
+class SSEStreamMetrics:
+    """SSE 스트림 1건의 첫 이벤트 도달 시간(TTFB)과 이벤트 간 간격 측정"""
+
+    def __init__(self, started_at: float):
+        self.started_at = started_at
+        self.first_event_at: Optional[float] = None
+        self.last_event_at: Optional[float] = None
+        self.events = 0
+        self.max_gap = 0.0
+        self.total_gap = 0.0
+
+    def record_event(self):
+        now = time.perf_counter()
+        if self.first_event_at is None:
+            self.first_event_at = now
+        else:
+            gap = now - self.last_event_at
+            self.total_gap += gap
+            self.max_gap = max(self.max_gap, gap)
+        self.last_event_at = now
+        self.events += 1
+
+    @property
+    def ttfb(self) -> Optional[float]:
+        if self.first_event_at is None:
+            return None
+        return self.first_event_at - self.started_at
+
+    @property
+    def mean_gap(self) -> float:
+        return self.total_gap / (self.events - 1) if self.events > 1 else 0.0
+
+
+class SSEStats:
+    """프로세스 전체 SSE 스트림 지표 누적"""
+
+    def __init__(self):
+        self.streams = 0
+        self.events = 0
+        self.total_ttfb = 0.0
+        self.max_ttfb = 0.0
+        self.max_gap = 0.0
+
+    def record(self, metrics: SSEStreamMetrics):
+        self.streams += 1
+        self.events += metrics.events
+        if metrics.ttfb is not None:
+            self.total_ttfb += metrics.ttfb
+            self.max_ttfb = max(self.max_ttfb, metrics.ttfb)
+        self.max_gap = max(self.max_gap, metrics.max_gap)
+
+    def to_dict(self) -> dict:
+        return {
+            "streams": self.streams,
+            "events": self.events,
+            "avg_ttfb_ms": round(self.total_ttfb / self.streams * 1000, 2) if self.streams else 0.0,
+            "max_ttfb_ms": round(self.max_ttfb * 1000, 2),
+            "max_gap_ms": round(self.max_gap * 1000, 2),
+        }
+
+
+class UpstreamPool:
+    """
+    업스트림 서비스 하나가 전용으로 사용하는 HTTP 커넥션 풀
+    - 서비스마다 별도 클라이언트를 두어 느린 스트림이 다른 서비스의 풀 슬롯을 점유하지 않도록 함
+    - 풀 대기 시간은 httpcore trace 이벤트(커넥션 확보 후 첫 이벤트)까지의 시간으로 측정
+    """
+
+    def __init__(self, name: str, base_url: str, config: UpstreamPoolConfig):
+        self.name = name
+        self.base_url = base_url
+        self.config = config
+        self.client = self._create_client(config)
+
+        self.requests = 0
+        self.errors = 0
+        self.pending = 0
+        self.acquired = 0
+        self.total_pool_wait = 0.0
+        self.max_pool_wait = 0.0
+
+    def _create_client(self, config: UpstreamPoolConfig) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry
+        )
+        timeout = httpx.Timeout(connect=30.0, read=None, write=30.0, pool=30.0)  # SSE를 위해 read timeout 제거
+        try:
+            return httpx.AsyncClient(timeout=timeout, limits=limits, http2=config.http2, follow_redirects=True)
+        except ImportError:
+            # h2 패키지가 없으면 HTTP/1.1로 동작
+            logger.warning(f"HTTP/2 사용 불가(h2 미설치) - {self.name} 업스트림은 HTTP/1.1로 연결합니다.")
+            self.config = config.model_copy(update={"http2": False})
+            return httpx.AsyncClient(timeout=timeout, limits=limits, follow_redirects=True)
+
+    def build_request(self, *args, **kwargs) -> httpx.Request:
+        return self.client.build_request(*args, **kwargs)
+
+    async def send(self, request: httpx.Request, stream: bool = False) -> httpx.Response:
+        """요청을 전송하고 풀 대기 시간을 기록합니다."""
+        started_at = time.perf_counter()
+        acquired_at: Optional[float] = None
+
+        async def trace(event_name: str, info: dict):
+            nonlocal acquired_at
+            if acquired_at is None:
+                acquired_at = time.perf_counter()
+
+        request.extensions["trace"] = trace
+        self.requests += 1
+        self.pending += 1
+        try:
+            return await self.client.send(request, stream=stream)
+        except httpx.RequestError:
+            self.errors += 1
+            raise
+        finally:
+            self.pending -= 1
+            if acquired_at is not None:
+                pool_wait = acquired_at - started_at
+                self.acquired += 1
+                self.total_pool_wait += pool_wait
+                self.max_pool_wait = max(self.max_pool_wait, pool_wait)
+
+    def stats(self) -> dict:
+        return {
+            "url": self.base_url,
+            **self.config.model_dump(),
+            "requests": self.requests,
+            "errors": self.errors,
+            "pending": self.pending,
+            "avg_pool_wait_ms": round(self.total_pool_wait / self.acquired * 1000, 3) if self.acquired else 0.0,
+            "max_pool_wait_ms": round(self.max_pool_wait * 1000, 3),
+        }
+
+    async def close(self):
+        await self.client.aclose()
+
 
 class ProxyService:
     """HTTP 요청을 다른 서비스로 프록시하는 서비스"""
     
     def __init__(self):
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(connect=30.0, read=None, write=30.0, pool=30.0),  # SSE를 위해 read timeout 제거
-            follow_redirects=True
-        )
+        # 업스트림 URL -> 전용 커넥션 풀
+        self.upstreams: dict[str, UpstreamPool] = {
+            url.rstrip("/"): UpstreamPool(name, url, settings.get_upstream_pool_config(name))
+            for name, url in settings.get_upstream_urls().items()
+        }
+        self.sse_stats = SSEStats()
+    
+    def get_upstream(self, target_url: str) -> UpstreamPool:
+        """대상 URL에 해당하는 커넥션 풀을 반환합니다. 등록되지 않은 URL은 기본 설정으로 생성합니다."""
+        key = target_url.rstrip("/")
+        upstream = self.upstreams.get(key)
+        if upstream is None:
+            upstream = UpstreamPool(key, key, settings.get_upstream_pool_config(key))
+            self.upstreams[key] = upstream
+        return upstream
+    
+    def pool_stats(self) -> dict:
+        """업스트림별 커넥션 풀 지표를 반환합니다."""
+        return {upstream.name: upstream.stats() for upstream in self.upstreams.values()}
     
     async def forward_request(
         self,
@@ -49,21 +210,24 @@ class ProxyService:
             headers = dict(request.headers)
             headers.pop("host", None)
             
-            # 요청 본문 읽기
-            body = await request.body()
-            
             logger.info(f"Proxying {request.method} {request.url.path} -> {full_target_url}")
+            
+            # 요청 본문은 메모리에 모으지 않고 업스트림으로 그대로 스트리밍
+            session_id, content = await self._prepare_request_content(request)
 
-            trace_info = self._generate_new_trace_info(body)
+            trace_info = self._generate_new_trace_info(session_id)
             headers.update(trace_info)
             
-            # 요청 전달
-            response = await self.client.request(
+            # 요청 전달 - 응답 본문은 스트리밍으로 읽어 SSE 이벤트를 즉시 전달
+            started_at = time.perf_counter()
+            upstream = self.get_upstream(target_url)
+            upstream_request = upstream.build_request(
                 method=request.method,
                 url=full_target_url,
                 headers=headers,
-                content=body,
+                content=content,
             )
+            response = await upstream.send(upstream_request, stream=True)
             
             # 응답 헤더 필터링 및 SSE 헤더 추가
             filtered_headers = self._filter_response_headers(response.headers)
@@ -81,10 +245,11 @@ class ProxyService:
                 
                 # SSE 스트리밍 응답 반환
                 return StreamingResponse(
-                    self._generate_sse_content(response),
+                    self._generate_sse_content(response, started_at),
                     status_code=response.status_code,
                     headers=filtered_headers,
-                    media_type=content_type
+                    media_type=content_type,
+                    background=BackgroundTask(response.aclose)
                 )
             else:
                 # 일반 스트리밍 응답 반환
@@ -92,7 +257,8 @@ class ProxyService:
                     self._generate_response_content(response),
                     status_code=response.status_code,
                     headers=filtered_headers,
-                    media_type=content_type
+                    media_type=content_type,
+                    background=BackgroundTask(response.aclose)
                 )
             
         except httpx.RequestError as e:
@@ -131,26 +297,91 @@ class ProxyService:
         async for chunk in response.aiter_bytes():
             yield chunk
     
-    async def _generate_sse_content(self, response: httpx.Response):
-        """SSE 응답 내용을 최적화된 방식으로 스트리밍합니다."""
+    async def _generate_sse_content(self, response: httpx.Response, started_at: float):
+        """
+        SSE 응답을 이벤트 단위로 지연 없이 전달합니다.
+        업스트림 청크를 빈 줄(이벤트 구분자) 기준으로 모아 완성된 이벤트만 내보내고,
+        data 필드의 <NL>만 줄바꿈으로 복원합니다.
+        """
+        metrics = SSEStreamMetrics(started_at)
+        buffer = b""
         try:
-            async for line in response.aiter_lines():
-                await asyncio.sleep(0.1)
-                
-                if line:  # 빈 라인이 아닌 경우
-                    # print(f"@@@@@@@@@@@@@@@@@ line: ", repr(line))
-                    line = line.replace('<NL>', '\n')
-                    yield f"{line}"
+            async for chunk in response.aiter_bytes():
+                buffer += chunk.replace(b"\r\n", b"\n")
+                *events, buffer = buffer.split(b"\n\n")
+                for event in events:
+                    if not event:
+                        continue
+                    metrics.record_event()
+                    yield self._decode_sse_event(event)
+
+            # 구분자 없이 끝난 마지막 이벤트
+            if buffer.strip():
+                metrics.record_event()
+                yield self._decode_sse_event(buffer.rstrip(b"\n"))
         except Exception as e:
             logger.error(f"Error during SSE streaming: {e}")
-            yield f"data: Error during streaming: {str(e)}\n\n"
+            yield f"data: Error during streaming: {str(e)}\n\n".encode("utf-8")
+        finally:
+            self.sse_stats.record(metrics)
+            ttfb_ms = metrics.ttfb * 1000 if metrics.ttfb is not None else -1
+            logger.info(
+                f"SSE stream finished: events={metrics.events}, ttfb={ttfb_ms:.1f}ms, "
+                f"mean_gap={metrics.mean_gap * 1000:.1f}ms, max_gap={metrics.max_gap * 1000:.1f}ms"
+            )
 
-    def _generate_new_trace_info(self, body: bytes):
-        try:
-            body_json = json.loads(body)
-            session_id = body_json.get("ddl_session_id", str(uuid.uuid4()))
-        except:
-            session_id = str(uuid.uuid4())
+    @staticmethod
+    def _decode_sse_event(event: bytes) -> bytes:
+        """
+        이벤트의 data 필드에서 <NL>을 줄바꿈으로 복원합니다.
+        줄바꿈이 포함된 값은 SSE 규격대로 여러 개의 data: 줄로 나누어 이벤트 경계를 유지합니다.
+        """
+        lines = []
+        for line in event.split(b"\n"):
+            if not line.startswith(b"data:"):
+                lines.append(line)
+                continue
+
+            value = line[5:]
+            if value.startswith(b" "):
+                value = value[1:]
+            for part in value.replace(b"<NL>", b"\n").split(b"\n"):
+                lines.append(b"data: " + part)
+        return b"\n".join(lines) + b"\n\n"
+
+    async def _prepare_request_content(self, request: Request) -> tuple[Optional[str], Optional[AsyncIterator[bytes]]]:
+        """
+        요청 본문 스트림과 세션 ID를 준비합니다.
+        세션 ID는 x-session-id 헤더를 우선 사용하고, 없으면 JSON 본문의 앞부분(최대 SESSION_ID_PEEK_BYTES)에서만 찾습니다.
+        앞부분을 읽은 경우 읽은 청크를 다시 이어 붙여 업스트림에는 원본 본문이 그대로 전달됩니다.
+        """
+        session_id = request.headers.get("x-session-id") or None
+        if "content-length" not in request.headers and "transfer-encoding" not in request.headers:
+            return session_id, None
+
+        stream = request.stream()
+        if session_id or "json" not in request.headers.get("content-type", ""):
+            return session_id, stream
+
+        prefix = b""
+        async for chunk in stream:
+            prefix += chunk
+            if len(prefix) >= SESSION_ID_PEEK_BYTES:
+                break
+
+        match = SESSION_ID_PATTERN.search(prefix[:SESSION_ID_PEEK_BYTES])
+        if match:
+            session_id = match.group(1).decode("utf-8", errors="ignore")
+
+        async def content():
+            yield prefix
+            async for chunk in stream:
+                yield chunk
+
+        return session_id, content()
+
+    def _generate_new_trace_info(self, session_id: Optional[str] = None):
+        session_id = session_id or str(uuid.uuid4())
             
         trace_info = {
             # 기존 필드
@@ -166,8 +397,9 @@ class ProxyService:
         return trace_info
     
     async def close(self):
-        """HTTP 클라이언트를 정리합니다."""
-        await self.client.aclose()
+        """업스트림별 HTTP 클라이언트를 정리합니다."""
+        for upstream in self.upstreams.values():
+            await upstream.close()
 
 
 # 싱글톤 패턴으로 프록시 서비스 인스턴스 생성
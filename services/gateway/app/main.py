@@ -2,7 +2,9 @@ import os
 import sys
 import logging
 from contextlib import asynccontextmanager
+import hmac
 import traceback
+from typing import Optional
 from fastapi.responses import JSONResponse
 
 from core.config import settings, PROFILE
@@ -12,9 +14,10 @@ if PROFILE == "local":
     sys.path.append(project_root)
 
 from core.proxy import proxy_service
+from core.auth_cache import auth_cache
 from core.middleware.auth import AuthMiddleware
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from api.auth_router import router as auth_router
 from api.connection_router import router as connection_router
@@ -22,6 +25,9 @@ from api.nl2sql_router import router as nl2sql_router
 from api.ddl_session_router import router as ddl_session_router
 from api.history_router import router as history_router
 from common.core.logger import Logger
+from common.core.config import session_config
+from common.core.session_token import session_token_signer, session_deny_list, validate_session_config
+from common.db.redis import close_shared_cache
 
 logger = Logger.getLogger(__name__)
 
@@ -35,12 +41,16 @@ async def lifespan(app: FastAPI):
     logger.info(f"NL2SQL service URL: {settings.get_nl2sql_service_url()}")
     logger.info(f"DDL Session service URL: {settings.get_ddl_session_service_url()}")
     logger.info(f"History service URL: {settings.get_history_service_url()}")
+    logger.info(f"Session mode: {session_config.SESSION_MODE}")
+    # signed 세션 모드 설정이 잘못되었으면 시작하지 않음
+    validate_session_config()
     
     yield
     
     # 종료 시 정리
     logger.info("Gateway shutting down...")
     await proxy_service.close()
+    await close_shared_cache()
 
 
 app = FastAPI(
@@ -119,6 +129,27 @@ async def health_check():
     }
 
 
+@app.get("/metrics")
+async def metrics(x_metrics_token: Optional[str] = Header(default=None)):
+    """
+    Gateway 내부 지표 조회 엔드포인트 (워커 프로세스 단위)
+    외부에 노출되는 포트이므로 운영자 토큰(X-Metrics-Token)이 일치할 때만 응답합니다.
+    """
+    if not settings.metrics_token or not x_metrics_token or not hmac.compare_digest(
+        x_metrics_token.encode("utf-8"), settings.metrics_token.encode("utf-8")
+    ):
+        raise HTTPException(status_code=403, detail="Forbidden")
+    return {
+        "pid": os.getpid(),
+        "auth_cache": auth_cache.stats(),
+        "session_mode": session_config.SESSION_MODE,
+        "session_token": session_token_signer.stats(),
+        "session_deny_list": session_deny_list.stats(),
+        "sse": proxy_service.sse_stats.to_dict(),
+        "upstreams": proxy_service.pool_stats()
+    }
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "main:app", 
@@ -0,0 +1,47 @@
+"""add history list indexes
+
+Revision ID: 4d9fc188a31e
+Revises: ecf578288a0b
+Create Date: 2026-10-18 10:41:27.905113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d9fc188a31e'
+down_revision: Union[str, Sequence[str], None] = 'ecf578288a0b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_database_query_history_user_connection_success_date',
+        'database_query_history',
+        ['reg_user_id', 'connection_id', 'success', 'reg_date'],
+        unique=False
+    )
+    op.create_index(
+        'ix_database_query_history_user_date',
+        'database_query_history',
+        ['reg_user_id', 'reg_date'],
+        unique=False
+    )
+    op.create_index(
+        'ix_ddl_query_history_user_date',
+        'ddl_query_history',
+        ['reg_user_id', 'reg_date'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_ddl_query_history_user_date', table_name='ddl_query_history')
+    op.drop_index('ix_database_query_history_user_date', table_name='database_query_history')
+    op.drop_index('ix_database_query_history_user_connection_success_date', table_name='database_query_history')
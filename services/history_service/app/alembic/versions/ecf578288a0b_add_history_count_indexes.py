@@ -0,0 +1,40 @@
+"""add history count indexes
+
+Revision ID: ecf578288a0b
+Revises: 169cfe7f2cf5
+Create Date: 2026-10-18 09:12:04.381502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ecf578288a0b'
+down_revision: Union[str, Sequence[str], None] = '169cfe7f2cf5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_database_query_history_user_connection_date',
+        'database_query_history',
+        ['reg_user_id', 'connection_id', 'reg_date'],
+        unique=False
+    )
+    op.create_index(
+        'ix_ddl_query_history_user_session_date',
+        'ddl_query_history',
+        ['reg_user_id', 'session_id', 'reg_date'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_ddl_query_history_user_session_date', table_name='ddl_query_history')
+    op.drop_index('ix_database_query_history_user_connection_date', table_name='database_query_history')
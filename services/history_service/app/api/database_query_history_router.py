@@ -1,16 +1,24 @@
-from typing import List
+from typing import List, Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from schemas.database_query_history_request import (
     DatabaseQueryHistoryCreateRequest,
     DatabaseQueryHistoryUpdateRequest,
-    DatabaseQueryHistoryDeleteRequest
+    DatabaseQueryHistoryDeleteRequest,
+    DatabaseQueryHistoryBulkRequest
+)
+from schemas.common_request import HistoryListRequest, HistoryCountRequest, HistoryTimelineRequest
+from schemas.database_query_history_response import DatabaseQueryHistoryResponse, DatabaseQueryHistorySummaryResponse
+from schemas.common_response import (
+    HistoryListResponse,
+    HistoryPageResponse,
+    HistoryTimelineResponse,
+    HistoryCountResponse,
+    HistoryBulkResponse
 )
-from schemas.common_request import HistoryListRequest
-from schemas.database_query_history_response import DatabaseQueryHistoryResponse
-from schemas.common_response import HistoryListResponse
 from services import database_query_history_service
 from common.schemas.http import SuccessResponse, ErrorResponse
 from common.util.http_util import get_current_user_id
+from utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
 
 router = APIRouter()
 
@@ -44,6 +52,34 @@ async def get_database_query_history_list(
     return SuccessResponse(data=response)
 
 
+@router.get(
+    "/page",
+    response_model=SuccessResponse[HistoryPageResponse[Union[DatabaseQueryHistorySummaryResponse, DatabaseQueryHistoryResponse]]]
+)
+async def get_database_query_history_page(
+    connection_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    summary: bool = False,
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    사용자의 데이터베이스 쿼리 히스토리 목록 페이지 조회 (최신순, 응답의 next_cursor로 다음 페이지 조회)
+    summary=true면 질문 미리보기와 상태/시간 정보만 반환하고, 본문은 /{history_id}로 조회합니다.
+    """
+    try:
+        response = await database_query_history_service.get_database_query_history_page_service(
+            user_id=user_id,
+            connection_id=connection_id,
+            cursor=cursor,
+            limit=limit,
+            summary=summary,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return SuccessResponse(data=response)
+
+
 @router.get(
     "/{history_id}",
     response_model=SuccessResponse[DatabaseQueryHistoryResponse]
@@ -83,6 +119,19 @@ async def delete_database_query_history(
     return SuccessResponse(data=response)
 
 
+@router.post(
+    "/bulk",
+    response_model=SuccessResponse[HistoryBulkResponse]
+)
+async def bulk_database_query_history(
+    request: DatabaseQueryHistoryBulkRequest,
+    user_id: int = Depends(get_current_user_id)
+):
+    """데이터베이스 쿼리 히스토리 일괄 생성/수정 (multi-row INSERT + executemany UPDATE, 단일 트랜잭션)"""
+    response = await database_query_history_service.bulk_database_query_history_service(request, user_id)
+    return SuccessResponse(data=response)
+
+
 # 통합 히스토리 엔드포인트 (여기에 위치)
 @router.post(
     "/all/list",
@@ -95,5 +144,42 @@ async def get_user_history_list(
     """사용자의 전체 히스토리 목록 조회 (데이터베이스 + DDL)"""
     # request의 user_id를 토큰에서 가져온 user_id로 덮어쓰기
     request.user_id = user_id
-    response = await database_query_history_service.get_user_history_list_service(request)
+    try:
+        response = await database_query_history_service.get_user_history_list_service(request)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return SuccessResponse(data=response)
+
+
+@router.post(
+    "/all/count",
+    response_model=SuccessResponse[HistoryCountResponse]
+)
+async def get_user_history_count(
+    request: HistoryCountRequest,
+    user_id: int = Depends(get_current_user_id)
+):
+    """사용자의 히스토리 유형별 개수 조회 (연결/세션, 기간 필터 선택)"""
+    request.user_id = user_id
+    response = await database_query_history_service.get_user_history_count_service(request)
+    return SuccessResponse(data=response)
+
+
+@router.post(
+    "/all/timeline",
+    response_model=SuccessResponse[HistoryTimelineResponse]
+)
+async def get_user_history_timeline(
+    request: HistoryTimelineRequest,
+    user_id: int = Depends(get_current_user_id)
+):
+    """
+    사용자의 통합 히스토리 타임라인 조회 (데이터베이스 + DDL 최신순, history_type으로 구분)
+    다음 페이지는 응답의 next_cursor로 조회하며, 전체 개수는 /all/count로 조회합니다.
+    """
+    request.user_id = user_id
+    try:
+        response = await database_query_history_service.get_user_history_timeline_service(request)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     return SuccessResponse(data=response)
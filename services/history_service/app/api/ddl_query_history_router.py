@@ -1,14 +1,17 @@
-from typing import List
+from typing import List, Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from schemas.ddl_query_history_request import (
     DDLQueryHistoryCreateRequest,
     DDLQueryHistoryUpdateRequest,
-    DDLQueryHistoryDeleteRequest
+    DDLQueryHistoryDeleteRequest,
+    DDLQueryHistoryBulkRequest
 )
-from schemas.ddl_query_history_response import DDLQueryHistoryResponse
+from schemas.ddl_query_history_response import DDLQueryHistoryResponse, DDLQueryHistorySummaryResponse
+from schemas.common_response import HistoryPageResponse, HistoryBulkResponse
 from services import ddl_query_history_service
 from common.schemas.http import SuccessResponse, ErrorResponse
 from common.util.http_util import get_current_user_id
+from utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
 
 router = APIRouter()
 
@@ -40,6 +43,32 @@ async def get_ddl_query_history_list(
     )
     return SuccessResponse(data=response)
 
+@router.get(
+    "/page",
+    response_model=SuccessResponse[HistoryPageResponse[Union[DDLQueryHistorySummaryResponse, DDLQueryHistoryResponse]]]
+)
+async def get_ddl_query_history_page(
+    ddl_session_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    summary: bool = False,
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    사용자의 DDL 쿼리 히스토리 목록 페이지 조회 (최신순, 응답의 next_cursor로 다음 페이지 조회)
+    summary=true면 질문 미리보기와 상태/시간 정보만 반환하고, 본문은 /{history_id}로 조회합니다.
+    """
+    try:
+        response = await ddl_query_history_service.get_ddl_query_history_page_service(
+            user_id=user_id,
+            ddl_session_id=ddl_session_id,
+            cursor=cursor,
+            limit=limit,
+            summary=summary,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return SuccessResponse(data=response)
 
 @router.get(
     "/{history_id}",
@@ -76,3 +105,15 @@ async def delete_ddl_query_history(
     """DDL 쿼리 히스토리 삭제"""
     response = await ddl_query_history_service.delete_ddl_query_history_service(request)
     return SuccessResponse(data=response)
+
+@router.post(
+    "/bulk",
+    response_model=SuccessResponse[HistoryBulkResponse]
+)
+async def bulk_ddl_query_history(
+    request: DDLQueryHistoryBulkRequest,
+    user_id: int = Depends(get_current_user_id)
+):
+    """DDL 쿼리 히스토리 일괄 생성/수정 (multi-row INSERT + executemany UPDATE, 단일 트랜잭션)"""
+    response = await ddl_query_history_service.bulk_ddl_query_history_service(request, user_id)
+    return SuccessResponse(data=response)
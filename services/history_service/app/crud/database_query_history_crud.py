@@ -1,14 +1,18 @@
 from datetime import datetime
-from sqlalchemy import select, desc
+from sqlalchemy import Select, select, desc, func, insert, update, literal, union_all, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 
 from schemas.database_query_history_request import (
     DatabaseQueryHistoryCreateRequest,
     DatabaseQueryHistoryUpdateRequest
 )
 from models.database_query_history import DatabaseQueryHistory
+from models.ddl_query_history import DDLQueryHistory
+from models.base_history import QUESTION_PREVIEW_LENGTH
 from db.maria import async_transactional
+from utils.pagination import HistoryCursor, TimelineCursor, apply_keyset
+from crud import ddl_query_history_crud
 from icecream import ic
 
 
@@ -109,13 +113,255 @@ async def get_database_query_history_list(
     return histories
 
 
+@async_transactional
+async def get_database_query_history_page(
+    user_id: int,
+    connection_id: Optional[str] = None,
+    success: Optional[bool] = None,
+    cursor: Optional[HistoryCursor] = None,
+    limit: int = 20,
+    summary: bool = False,
+    session: AsyncSession = None
+) -> List[DatabaseQueryHistory]:
+    """
+    사용자의 데이터베이스 쿼리 히스토리를 (reg_date, id) 내림차순 keyset 방식으로 조회
+    다음 페이지 존재 여부 판단을 위해 최대 limit + 1개를 반환합니다.
+    summary면 요약 컬럼만 조회한 Row 목록을 반환합니다.
+    """
+    columns = [*DatabaseQueryHistory.summary_columns(), DatabaseQueryHistory.connection_id] if summary else [DatabaseQueryHistory]
+    query = select(*columns).where(DatabaseQueryHistory.reg_user_id == user_id)
+    if connection_id is not None:
+        query = query.where(DatabaseQueryHistory.connection_id == connection_id)
+    if success is not None:
+        query = query.where(DatabaseQueryHistory.success == success)
+    result = await session.execute(apply_keyset(query, DatabaseQueryHistory, cursor, limit))
+    return result.all() if summary else result.scalars().all()
+
+
+def build_database_query_history_count_query(
+    user_id: int,
+    connection_id: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> Select:
+    """
+    데이터베이스 쿼리 히스토리 COUNT(*) 쿼리 구성
+    (reg_user_id, connection_id, reg_date) 인덱스만으로 처리되도록 본문 컬럼은 읽지 않습니다.
+    """
+    query = (
+        select(func.count())
+        .select_from(DatabaseQueryHistory)
+        .where(DatabaseQueryHistory.reg_user_id == user_id)
+    )
+    if connection_id is not None:
+        query = query.where(DatabaseQueryHistory.connection_id == connection_id)
+    if start_date is not None:
+        query = query.where(DatabaseQueryHistory.reg_date >= start_date)
+    if end_date is not None:
+        query = query.where(DatabaseQueryHistory.reg_date < end_date)
+    return query
+
+
 @async_transactional
 async def get_database_query_history_count(
     user_id: int,
+    connection_id: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
     session: AsyncSession = None
 ) -> int:
     """사용자의 데이터베이스 쿼리 히스토리 개수 조회"""
     result = await session.execute(
-        select(DatabaseQueryHistory).where(DatabaseQueryHistory.reg_user_id == user_id)
+        build_database_query_history_count_query(user_id, connection_id, start_date, end_date)
+    )
+    return result.scalar_one()
+
+
+# 통합 히스토리 CRUD (여기에 위치)
+@async_transactional
+async def get_user_history_counts(
+    user_id: int,
+    connection_id: Optional[str] = None,
+    ddl_session_id: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    session: AsyncSession = None
+) -> Tuple[int, int]:
+    """
+    사용자의 히스토리 개수를 유형별로 한 번의 쿼리로 조회
+    connection_id는 데이터베이스 쿼리 히스토리에만, ddl_session_id는 DDL 쿼리 히스토리에만 적용됩니다.
+    (데이터베이스 쿼리 개수, DDL 쿼리 개수)를 반환합니다.
+    """
+    database_query_count = build_database_query_history_count_query(
+        user_id, connection_id, start_date, end_date
+    ).scalar_subquery()
+    ddl_query_count = ddl_query_history_crud.build_ddl_query_history_count_query(
+        user_id, ddl_session_id, start_date, end_date
+    ).scalar_subquery()
+    result = await session.execute(select(database_query_count, ddl_query_count))
+    return tuple(result.one())
+
+
+def build_user_history_timeline_query(
+    user_id: int,
+    limit: int,
+    cursor: Optional[TimelineCursor] = None,
+    history_type: Optional[str] = None
+) -> Select:
+    """
+    사용자의 데이터베이스/DDL 히스토리를 하나의 타임라인으로 조회하는 쿼리 구성
+    (reg_date, id, history_type) 내림차순(history_type만 오름차순) keyset 방식이며, has_more 판단을 위해 limit + 1개를 조회합니다.
+    - 안쪽: 유형별로 cursor 이후의 (유형, id, reg_date)를 최신순 limit + 1개만 조회한 뒤 UNION ALL 하고 정렬/페이지 적용
+      (reg_user_id, reg_date) 인덱스만으로 처리되어 본문 컬럼은 읽지 않고, 페이지가 뒤로 가도 건너뛸 행을 읽지 않음
+    - 바깥: 페이지에 포함된 행만 원래 테이블과 조인해 요약 컬럼(질문 미리보기 등)을 채움
+    """
+    selects = []
+    for name, model in (("database", DatabaseQueryHistory), ("ddl", DDLQueryHistory)):
+        if history_type not in (None, name):
+            continue
+        query = select(
+            literal(name).label("history_type"),
+            model.id,
+            model.reg_date
+        ).where(model.reg_user_id == user_id)
+        if cursor is not None:
+            # 같은 (reg_date, id)면 history_type 오름차순이므로 cursor 유형보다 뒤 유형은 같은 id도 포함
+            same_id = name > cursor.history_type
+            query = query.where(
+                or_(
+                    model.reg_date < cursor.reg_date,
+                    and_(
+                        model.reg_date == cursor.reg_date,
+                        model.id <= cursor.id if same_id else model.id < cursor.id
+                    )
+                )
+            )
+        branch = query.order_by(model.reg_date.desc(), model.id.desc()).limit(limit + 1).subquery(f"{name}_timeline")
+        selects.append(select(branch.c.history_type, branch.c.id, branch.c.reg_date))
+    timeline = (union_all(*selects) if len(selects) > 1 else selects[0]).subquery("timeline")
+
+    page = (
+        select(timeline.c.history_type, timeline.c.id, timeline.c.reg_date)
+        .order_by(timeline.c.reg_date.desc(), timeline.c.id.desc(), timeline.c.history_type)
+        .limit(limit + 1)
+        .subquery("page")
+    )
+
+    return (
+        select(
+            page.c.history_type,
+            page.c.id,
+            page.c.reg_date,
+            func.coalesce(DatabaseQueryHistory.connection_id, DDLQueryHistory.session_id).label("scope_id"),
+            func.substr(
+                func.coalesce(DatabaseQueryHistory.question, DDLQueryHistory.question), 1, QUESTION_PREVIEW_LENGTH
+            ).label("question_preview"),
+            func.coalesce(DatabaseQueryHistory.success, DDLQueryHistory.success).label("success"),
+            func.coalesce(DatabaseQueryHistory.end_date, DDLQueryHistory.end_date).label("end_date"),
+            func.coalesce(DatabaseQueryHistory.duration, DDLQueryHistory.duration).label("duration")
+        )
+        .select_from(page)
+        .outerjoin(
+            DatabaseQueryHistory,
+            and_(page.c.history_type == "database", DatabaseQueryHistory.id == page.c.id)
+        )
+        .outerjoin(
+            DDLQueryHistory,
+            and_(page.c.history_type == "ddl", DDLQueryHistory.id == page.c.id)
+        )
+        .order_by(page.c.reg_date.desc(), page.c.id.desc(), page.c.history_type)
+    )
+
+
+@async_transactional
+async def get_user_history_timeline(
+    user_id: int,
+    limit: int,
+    cursor: Optional[TimelineCursor] = None,
+    history_type: Optional[str] = None,
+    session: AsyncSession = None
+) -> list:
+    """
+    사용자의 통합 히스토리 타임라인 한 페이지 조회 (한 번의 쿼리, 최대 limit + 1개)
+    각 행은 history_type, id, reg_date, scope_id, question_preview, success, end_date, duration을 가집니다.
+    """
+    result = await session.execute(
+        build_user_history_timeline_query(user_id, limit, cursor, history_type)
+    )
+    return result.all()
+
+
+@async_transactional
+async def bulk_create_database_query_history(
+    requests: List[DatabaseQueryHistoryCreateRequest],
+    user_id: int,
+    session: AsyncSession = None
+) -> List[int]:
+    """데이터베이스 쿼리 히스토리 일괄 생성 (multi-row INSERT), 등록자는 요청한 사용자로 기록하고 요청 순서대로 생성된 id 반환"""
+    if not requests:
+        return []
+
+    reg_date = datetime.now()
+    rows = [{**request.model_dump(), "reg_user_id": user_id, "reg_date": reg_date} for request in requests]
+    # 첫 쿼리 전에는 서버 버전 확인이 끝나지 않았을 수 있으므로 커넥션을 먼저 확보
+    connection = await session.connection()
+    if connection.dialect.insert_returning:
+        result = await session.execute(
+            insert(DatabaseQueryHistory).returning(DatabaseQueryHistory.id, sort_by_parameter_order=True),
+            rows
+        )
+        return list(result.scalars())
+
+    # RETURNING을 지원하지 않는 서버는 ORM 배치 flush로 생성
+    histories = [DatabaseQueryHistory(**row) for row in rows]
+    session.add_all(histories)
+    await session.flush()
+    return [history.id for history in histories]
+
+
+@async_transactional
+async def bulk_update_database_query_history(
+    requests: List[DatabaseQueryHistoryUpdateRequest],
+    user_id: int,
+    session: AsyncSession = None
+) -> Set[int]:
+    """
+    데이터베이스 쿼리 히스토리 일괄 수정 (기본키 기준 executemany UPDATE)
+    요청한 사용자가 등록한 히스토리만 수정하며, 단건 수정과 같이 None인 필드는 변경하지 않습니다.
+    수정 대상으로 확인된 id 집합을 반환합니다.
+    """
+    if not requests:
+        return set()
+
+    result = await session.execute(
+        select(DatabaseQueryHistory.id)
+        .where(DatabaseQueryHistory.id.in_({request.id for request in requests}))
+        .where(DatabaseQueryHistory.reg_user_id == user_id)
     )
-    return len(result.scalars().all()) 
\ No newline at end of file
+    existing_ids = set(result.scalars())
+    rows = [
+        row for row in (request.model_dump(exclude_none=True) for request in requests)
+        if row["id"] in existing_ids and len(row) > 1
+    ]
+    if rows:
+        await session.execute(
+            update(DatabaseQueryHistory)
+            .where(DatabaseQueryHistory.reg_user_id == user_id)
+            # 세션에 적재된 객체가 없으므로 동기화 생략 (추가 WHERE 조건과 함께 쓰려면 필요)
+            .execution_options(synchronize_session=None),
+            rows
+        )
+    return existing_ids
+
+
+@async_transactional
+async def bulk_write_database_query_history(
+    creates: List[DatabaseQueryHistoryCreateRequest],
+    updates: List[DatabaseQueryHistoryUpdateRequest],
+    user_id: int,
+    session: AsyncSession = None
+) -> Tuple[List[int], Set[int]]:
+    """데이터베이스 쿼리 히스토리 일괄 생성/수정을 하나의 트랜잭션으로 처리 (요청한 사용자 소유 히스토리만 대상)"""
+    created_ids = await bulk_create_database_query_history(creates, user_id, session=session)
+    updated_ids = await bulk_update_database_query_history(updates, user_id, session=session)
+    return created_ids, updated_ids
@@ -1,7 +1,7 @@
 from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy import Select, select, func, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 
 from schemas.ddl_query_history_request import (
     DDLQueryHistoryCreateRequest,
@@ -9,6 +9,7 @@ from schemas.ddl_query_history_request import (
 )
 from models.ddl_query_history import DDLQueryHistory
 from db.maria import async_transactional
+from utils.pagination import HistoryCursor, apply_keyset
 
 
 # DDLQueryHistory CRUD
@@ -108,13 +109,138 @@ async def get_ddl_query_history_list(
     return result.scalars().all()
 
 
+@async_transactional
+async def get_ddl_query_history_page(
+    user_id: int,
+    ddl_session_id: Optional[str] = None,
+    cursor: Optional[HistoryCursor] = None,
+    limit: int = 20,
+    summary: bool = False,
+    session: AsyncSession = None
+) -> List[DDLQueryHistory]:
+    """
+    사용자의 DDL 쿼리 히스토리를 (reg_date, id) 내림차순 keyset 방식으로 조회
+    다음 페이지 존재 여부 판단을 위해 최대 limit + 1개를 반환합니다.
+    summary면 요약 컬럼만 조회한 Row 목록을 반환합니다.
+    """
+    columns = [*DDLQueryHistory.summary_columns(), DDLQueryHistory.session_id] if summary else [DDLQueryHistory]
+    query = select(*columns).where(DDLQueryHistory.reg_user_id == user_id)
+    if ddl_session_id is not None:
+        query = query.where(DDLQueryHistory.session_id == ddl_session_id)
+    result = await session.execute(apply_keyset(query, DDLQueryHistory, cursor, limit))
+    return result.all() if summary else result.scalars().all()
+
+
+def build_ddl_query_history_count_query(
+    user_id: int,
+    ddl_session_id: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> Select:
+    """
+    DDL 쿼리 히스토리 COUNT(*) 쿼리 구성
+    (reg_user_id, session_id, reg_date) 인덱스만으로 처리되도록 본문 컬럼은 읽지 않습니다.
+    """
+    query = (
+        select(func.count())
+        .select_from(DDLQueryHistory)
+        .where(DDLQueryHistory.reg_user_id == user_id)
+    )
+    if ddl_session_id is not None:
+        query = query.where(DDLQueryHistory.session_id == ddl_session_id)
+    if start_date is not None:
+        query = query.where(DDLQueryHistory.reg_date >= start_date)
+    if end_date is not None:
+        query = query.where(DDLQueryHistory.reg_date < end_date)
+    return query
+
+
 @async_transactional
 async def get_ddl_query_history_count(
     user_id: int,
+    ddl_session_id: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
     session: AsyncSession = None
 ) -> int:
     """사용자의 DDL 쿼리 히스토리 개수 조회"""
     result = await session.execute(
-        select(DDLQueryHistory).where(DDLQueryHistory.reg_user_id == user_id)
+        build_ddl_query_history_count_query(user_id, ddl_session_id, start_date, end_date)
     )
-    return len(result.scalars().all()) 
\ No newline at end of file
+    return result.scalar_one()
+
+
+@async_transactional
+async def bulk_create_ddl_query_history(
+    requests: List[DDLQueryHistoryCreateRequest],
+    user_id: int,
+    session: AsyncSession = None
+) -> List[int]:
+    """DDL 쿼리 히스토리 일괄 생성 (multi-row INSERT), 등록자는 요청한 사용자로 기록하고 요청 순서대로 생성된 id 반환"""
+    if not requests:
+        return []
+
+    reg_date = datetime.now()
+    rows = [{**request.model_dump(), "reg_user_id": user_id, "reg_date": reg_date} for request in requests]
+    # 첫 쿼리 전에는 서버 버전 확인이 끝나지 않았을 수 있으므로 커넥션을 먼저 확보
+    connection = await session.connection()
+    if connection.dialect.insert_returning:
+        result = await session.execute(
+            insert(DDLQueryHistory).returning(DDLQueryHistory.id, sort_by_parameter_order=True),
+            rows
+        )
+        return list(result.scalars())
+
+    # RETURNING을 지원하지 않는 서버는 ORM 배치 flush로 생성
+    histories = [DDLQueryHistory(**row) for row in rows]
+    session.add_all(histories)
+    await session.flush()
+    return [history.id for history in histories]
+
+
+@async_transactional
+async def bulk_update_ddl_query_history(
+    requests: List[DDLQueryHistoryUpdateRequest],
+    user_id: int,
+    session: AsyncSession = None
+) -> Set[int]:
+    """
+    DDL 쿼리 히스토리 일괄 수정 (기본키 기준 executemany UPDATE)
+    요청한 사용자가 등록한 히스토리만 수정하며, 단건 수정과 같이 None인 필드는 변경하지 않습니다.
+    수정 대상으로 확인된 id 집합을 반환합니다.
+    """
+    if not requests:
+        return set()
+
+    result = await session.execute(
+        select(DDLQueryHistory.id)
+        .where(DDLQueryHistory.id.in_({request.id for request in requests}))
+        .where(DDLQueryHistory.reg_user_id == user_id)
+    )
+    existing_ids = set(result.scalars())
+    rows = [
+        row for row in (request.model_dump(exclude_none=True) for request in requests)
+        if row["id"] in existing_ids and len(row) > 1
+    ]
+    if rows:
+        await session.execute(
+            update(DDLQueryHistory)
+            .where(DDLQueryHistory.reg_user_id == user_id)
+            # 세션에 적재된 객체가 없으므로 동기화 생략 (추가 WHERE 조건과 함께 쓰려면 필요)
+            .execution_options(synchronize_session=None),
+            rows
+        )
+    return existing_ids
+
+
+@async_transactional
+async def bulk_write_ddl_query_history(
+    creates: List[DDLQueryHistoryCreateRequest],
+    updates: List[DDLQueryHistoryUpdateRequest],
+    user_id: int,
+    session: AsyncSession = None
+) -> Tuple[List[int], Set[int]]:
+    """DDL 쿼리 히스토리 일괄 생성/수정을 하나의 트랜잭션으로 처리 (요청한 사용자 소유 히스토리만 대상)"""
+    created_ids = await bulk_create_ddl_query_history(creates, user_id, session=session)
+    updated_ids = await bulk_update_ddl_query_history(updates, user_id, session=session)
+    return created_ids, updated_ids
@@ -1,9 +1,12 @@
 from datetime import datetime
-from sqlalchemy import Integer, DateTime, Boolean
+from sqlalchemy import Integer, DateTime, Boolean, func
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.mysql import LONGTEXT
 from db.maria import Base
 
+# 목록 요약 응답의 질문 미리보기 길이 (문자 수)
+QUESTION_PREVIEW_LENGTH = 100
+
 
 class BaseHistory(Base):
     """히스토리 공통 필드를 포함한 추상 베이스 클래스"""
@@ -17,4 +20,16 @@ class BaseHistory(Base):
     reg_date: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False)
     reg_user_id: Mapped[int] = mapped_column(Integer, nullable=False)
     end_date: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    duration: Mapped[int] = mapped_column(Integer, nullable=True)
\ No newline at end of file
+    duration: Mapped[int] = mapped_column(Integer, nullable=True)
+
+    @classmethod
+    def summary_columns(cls) -> list:
+        """목록 요약에 필요한 컬럼 (LONGTEXT 본문은 읽지 않고 질문은 DB에서 앞부분만 잘라 가져옴)"""
+        return [
+            cls.id,
+            func.substr(cls.question, 1, QUESTION_PREVIEW_LENGTH).label("question_preview"),
+            cls.success,
+            cls.reg_date,
+            cls.end_date,
+            cls.duration
+        ]
@@ -1,4 +1,4 @@
-from sqlalchemy import String
+from sqlalchemy import String, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from models.base_history import BaseHistory
 
@@ -6,6 +6,14 @@ from models.base_history import BaseHistory
 class DatabaseQueryHistory(BaseHistory):
     """데이터베이스 쿼리 히스토리 테이블"""
     __tablename__ = "database_query_history"
+    __table_args__ = (
+        # 사용자/연결별 개수 집계(COUNT)를 인덱스만으로 처리하기 위한 커버링 인덱스
+        Index("ix_database_query_history_user_connection_date", "reg_user_id", "connection_id", "reg_date"),
+        # 연결별 목록(/list, /page): reg_user_id + connection_id + success 조건, reg_date 내림차순 (id는 InnoDB가 뒤에 붙임)
+        Index("ix_database_query_history_user_connection_success_date", "reg_user_id", "connection_id", "success", "reg_date"),
+        # 사용자 전체 목록(/all/list): reg_user_id 조건, reg_date 내림차순
+        Index("ix_database_query_history_user_date", "reg_user_id", "reg_date"),
+    )
     
     connection_id: Mapped[str] = mapped_column(String(36), nullable=False)
     
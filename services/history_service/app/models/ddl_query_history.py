@@ -1,4 +1,4 @@
-from sqlalchemy import String
+from sqlalchemy import String, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.mysql import LONGTEXT
 from models.base_history import BaseHistory
@@ -7,6 +7,12 @@ from models.base_history import BaseHistory
 class DDLQueryHistory(BaseHistory):
     """DDL 쿼리 히스토리 테이블"""
     __tablename__ = "ddl_query_history"
+    __table_args__ = (
+        # 세션별 목록(/list, /page)과 개수 집계: reg_user_id + session_id 조건, reg_date 내림차순
+        Index("ix_ddl_query_history_user_session_date", "reg_user_id", "session_id", "reg_date"),
+        # 사용자 전체 목록(/all/list): reg_user_id 조건, reg_date 내림차순
+        Index("ix_ddl_query_history_user_date", "reg_user_id", "reg_date"),
+    )
     
     session_id: Mapped[str] = mapped_column(String(255), nullable=False)
     ddl: Mapped[str] = mapped_column(LONGTEXT, nullable=False)
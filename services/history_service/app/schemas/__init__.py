@@ -1,37 +1,71 @@
 # Database Query History schemas
 from schemas.database_query_history_request import (
     DatabaseQueryHistoryCreateRequest,
-    DatabaseQueryHistoryUpdateRequest
+    DatabaseQueryHistoryUpdateRequest,
+    DatabaseQueryHistoryBulkRequest
+)
+from schemas.database_query_history_response import (
+    DatabaseQueryHistoryResponse,
+    DatabaseQueryHistorySummaryResponse
 )
-from schemas.database_query_history_response import DatabaseQueryHistoryResponse
 
 # DDL Query History schemas
 from schemas.ddl_query_history_request import (
     DDLQueryHistoryCreateRequest,
-    DDLQueryHistoryUpdateRequest
+    DDLQueryHistoryUpdateRequest,
+    DDLQueryHistoryBulkRequest
+)
+from schemas.ddl_query_history_response import (
+    DDLQueryHistoryResponse,
+    DDLQueryHistorySummaryResponse
 )
-from schemas.ddl_query_history_response import DDLQueryHistoryResponse
 
 # Common schemas
 from schemas.common_request import (
     HistoryDeleteRequest,
-    HistoryListRequest
+    HistoryListRequest,
+    HistoryCountRequest,
+    HistoryTimelineRequest
+)
+from schemas.common_response import (
+    HistoryListResponse,
+    HistoryPageResponse,
+    HistoryTimelineResponse,
+    HistoryTimelineItem,
+    DatabaseQueryTimelineItem,
+    DDLQueryTimelineItem,
+    HistoryCountResponse,
+    HistoryBulkItemResult,
+    HistoryBulkResponse
 )
-from schemas.common_response import HistoryListResponse
 
 __all__ = [
     # Database Query History
     "DatabaseQueryHistoryCreateRequest",
     "DatabaseQueryHistoryUpdateRequest",
+    "DatabaseQueryHistoryBulkRequest",
     "DatabaseQueryHistoryResponse",
+    "DatabaseQueryHistorySummaryResponse",
     
     # DDL Query History
     "DDLQueryHistoryCreateRequest",
     "DDLQueryHistoryUpdateRequest",
+    "DDLQueryHistoryBulkRequest",
     "DDLQueryHistoryResponse",
+    "DDLQueryHistorySummaryResponse",
     
     # Common
     "HistoryDeleteRequest",
     "HistoryListRequest",
+    "HistoryCountRequest",
+    "HistoryTimelineRequest",
     "HistoryListResponse",
+    "HistoryPageResponse",
+    "HistoryTimelineResponse",
+    "HistoryTimelineItem",
+    "DatabaseQueryTimelineItem",
+    "DDLQueryTimelineItem",
+    "HistoryCountResponse",
+    "HistoryBulkItemResult",
+    "HistoryBulkResponse",
 ] 
\ No newline at end of file
@@ -1,5 +1,9 @@
 from pydantic import BaseModel
-from typing import Optional
+from datetime import datetime
+from typing import Literal, Optional
+
+# 일괄 생성/수정 요청 한 번에 받을 수 있는 작업 수 (creates, updates 각각)
+BULK_MAX_ITEMS = 500
 
 
 class HistoryDeleteRequest(BaseModel):
@@ -16,17 +20,70 @@ class HistoryDeleteRequest(BaseModel):
 
 
 class HistoryListRequest(BaseModel):
-    """히스토리 목록 조회 요청"""
+    """
+    히스토리 목록 조회 요청
+    유형별로 (reg_date, id) 내림차순 keyset 페이지네이션을 적용하며, 다음 페이지는 응답의 유형별 cursor로 조회합니다.
+    summary가 true면 본문(LONGTEXT) 없이 질문 미리보기와 상태/시간 정보만 반환합니다.
+    """
     user_id: int
     limit: Optional[int] = 50
-    offset: Optional[int] = 0
+    database_cursor: Optional[str] = None
+    ddl_cursor: Optional[str] = None
+    summary: bool = False
 
     model_config = {
         "json_schema_extra": {
             "example": {
                 "user_id": 1,
                 "limit": 50,
-                "offset": 0
+                "database_cursor": None,
+                "ddl_cursor": None,
+                "summary": True
+            }
+        }
+    }
+
+
+class HistoryCountRequest(BaseModel):
+    """
+    히스토리 개수 집계 요청
+    connection_id는 데이터베이스 쿼리 히스토리에만, ddl_session_id는 DDL 쿼리 히스토리에만 적용됩니다.
+    기간은 start_date 이상, end_date 미만입니다.
+    """
+    user_id: Optional[int] = None
+    connection_id: Optional[str] = None
+    ddl_session_id: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "connection_id": "123e4567-e89b-12d3-a456-426614174000",
+                "start_date": "2024-01-01T00:00:00",
+                "end_date": "2024-02-01T00:00:00"
             }
         }
-    } 
\ No newline at end of file
+    }
+
+
+class HistoryTimelineRequest(BaseModel):
+    """
+    통합 히스토리 타임라인 조회 요청 (데이터베이스 + DDL, 최신순)
+    (reg_date, id, history_type) keyset 페이지네이션을 적용하며, 다음 페이지는 응답의 next_cursor로 조회합니다.
+    history_type을 지정하면 해당 유형만 조회합니다. 전체 개수는 /all/count로 조회합니다.
+    """
+    user_id: Optional[int] = None
+    limit: Optional[int] = 20
+    cursor: Optional[str] = None
+    history_type: Optional[Literal["database", "ddl"]] = None
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "limit": 20,
+                "cursor": None,
+                "history_type": None
+            }
+        }
+    }
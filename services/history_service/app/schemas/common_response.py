@@ -1,14 +1,27 @@
-from pydantic import BaseModel
-from typing import List
-from schemas.database_query_history_response import DatabaseQueryHistoryResponse
-from schemas.ddl_query_history_response import DDLQueryHistoryResponse
+from pydantic import BaseModel, Field
+from typing import Annotated, Generic, Iterable, List, Literal, Optional, Set, TypeVar, Union
+from datetime import datetime
+from schemas.database_query_history_response import (
+    DatabaseQueryHistoryResponse,
+    DatabaseQueryHistorySummaryResponse
+)
+from schemas.ddl_query_history_response import DDLQueryHistoryResponse, DDLQueryHistorySummaryResponse
+
+ItemT = TypeVar("ItemT")
 
 
 class HistoryListResponse(BaseModel):
     """히스토리 목록 응답"""
     total_count: int
-    database_query_histories: List[DatabaseQueryHistoryResponse]
-    ddl_query_histories: List[DDLQueryHistoryResponse]
+    # summary 요청이면 요약 응답 목록
+    database_query_histories: List[Union[DatabaseQueryHistoryResponse, DatabaseQueryHistorySummaryResponse]]
+    ddl_query_histories: List[Union[DDLQueryHistoryResponse, DDLQueryHistorySummaryResponse]]
+    # 유형별 다음 페이지 위치 (더 이상 없으면 마지막 위치를 그대로 돌려주므로 다음 요청에서 빈 목록이 됨)
+    database_next_cursor: Optional[str] = None
+    ddl_next_cursor: Optional[str] = None
+    database_has_more: bool = False
+    ddl_has_more: bool = False
+    has_more: bool = False
 
     model_config = {
         "json_schema_extra": {
@@ -41,4 +54,161 @@ class HistoryListResponse(BaseModel):
                 ]
             }
         }
-    } 
\ No newline at end of file
+    }
+
+
+class HistoryPageResponse(BaseModel, Generic[ItemT]):
+    """keyset 페이지네이션 응답 (next_cursor를 다음 요청의 cursor로 전달)"""
+    items: List[ItemT]
+    next_cursor: Optional[str] = None
+    has_more: bool
+    limit: int
+
+
+class DatabaseQueryTimelineItem(BaseModel):
+    """타임라인의 데이터베이스 쿼리 히스토리 항목"""
+    history_type: Literal["database"] = "database"
+    id: int
+    connection_id: str
+    question_preview: str
+    success: bool
+    reg_date: datetime
+    end_date: Optional[datetime] = None
+    duration: Optional[int] = None
+
+
+class DDLQueryTimelineItem(BaseModel):
+    """타임라인의 DDL 쿼리 히스토리 항목"""
+    history_type: Literal["ddl"] = "ddl"
+    id: int
+    session_id: str
+    question_preview: str
+    success: bool
+    reg_date: datetime
+    end_date: Optional[datetime] = None
+    duration: Optional[int] = None
+
+
+# history_type으로 구분되는 타임라인 항목 (id는 유형 안에서만 고유)
+HistoryTimelineItem = Annotated[
+    Union[DatabaseQueryTimelineItem, DDLQueryTimelineItem],
+    Field(discriminator="history_type")
+]
+
+
+class HistoryTimelineResponse(BaseModel):
+    """통합 히스토리 타임라인 응답 (최신순, next_cursor를 다음 요청의 cursor로 전달)"""
+    items: List[HistoryTimelineItem]
+    next_cursor: Optional[str] = None
+    has_more: bool
+    limit: int
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "items": [
+                    {
+                        "history_type": "ddl",
+                        "id": 2,
+                        "session_id": "ddl_session_001",
+                        "question_preview": "사용자 테이블을 만들어주세요",
+                        "success": True,
+                        "reg_date": "2024-01-15T10:31:00",
+                        "end_date": "2024-01-15T10:31:04",
+                        "duration": 4000
+                    },
+                    {
+                        "history_type": "database",
+                        "id": 1,
+                        "connection_id": "123e4567-e89b-12d3-a456-426614174000",
+                        "question_preview": "나이가 25 이상인 사용자",
+                        "success": True,
+                        "reg_date": "2024-01-15T10:30:00",
+                        "end_date": "2024-01-15T10:30:05",
+                        "duration": 5000
+                    }
+                ],
+                "next_cursor": None,
+                "has_more": False,
+                "limit": 20
+            }
+        }
+    }
+
+
+class HistoryCountResponse(BaseModel):
+    """히스토리 유형별 개수 응답"""
+    total_count: int
+    database_query_count: int
+    ddl_query_count: int
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "total_count": 15,
+                "database_query_count": 10,
+                "ddl_query_count": 5
+            }
+        }
+    }
+
+
+class HistoryBulkItemResult(BaseModel):
+    """일괄 요청의 항목별 처리 결과 (index는 creates/updates 배열 안의 위치)"""
+    operation: Literal["create", "update"]
+    index: int
+    id: Optional[int] = None
+    success: bool
+    error_message: Optional[str] = None
+
+
+class HistoryBulkResponse(BaseModel):
+    """히스토리 일괄 생성/수정 응답"""
+    created: int
+    updated: int
+    failed: int
+    results: List[HistoryBulkItemResult]
+
+    @classmethod
+    def from_results(
+        cls,
+        created_ids: List[int],
+        update_ids: Iterable[int],
+        updated_ids: Set[int]
+    ) -> "HistoryBulkResponse":
+        """생성된 id 목록과 수정 요청 id/실제 존재한 id로 항목별 결과를 만듭니다."""
+        results = [
+            HistoryBulkItemResult(operation="create", index=index, id=history_id, success=True)
+            for index, history_id in enumerate(created_ids)
+        ]
+        for index, history_id in enumerate(update_ids):
+            found = history_id in updated_ids
+            results.append(HistoryBulkItemResult(
+                operation="update",
+                index=index,
+                id=history_id,
+                success=found,
+                error_message=None if found else "history not found"
+            ))
+        failed = sum(1 for result in results if not result.success)
+        return cls(
+            created=len(created_ids),
+            updated=len(results) - len(created_ids) - failed,
+            failed=failed,
+            results=results
+        )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "created": 1,
+                "updated": 1,
+                "failed": 1,
+                "results": [
+                    {"operation": "create", "index": 0, "id": 3, "success": True, "error_message": None},
+                    {"operation": "update", "index": 0, "id": 1, "success": True, "error_message": None},
+                    {"operation": "update", "index": 1, "id": 99, "success": False, "error_message": "history not found"}
+                ]
+            }
+        }
+    }
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+from schemas.common_request import BULK_MAX_ITEMS
 
 
 class DatabaseQueryHistoryCreateRequest(BaseModel):
@@ -59,4 +60,34 @@ class DatabaseQueryHistoryDeleteRequest(BaseModel):
                 "id": 1
             }
         }
-    }
\ No newline at end of file
+    }
+
+
+class DatabaseQueryHistoryBulkRequest(BaseModel):
+    """데이터베이스 쿼리 히스토리 일괄 생성/수정 요청 (하나의 트랜잭션으로 처리)"""
+    creates: List[DatabaseQueryHistoryCreateRequest] = Field(default_factory=list, max_length=BULK_MAX_ITEMS)
+    updates: List[DatabaseQueryHistoryUpdateRequest] = Field(default_factory=list, max_length=BULK_MAX_ITEMS)
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "creates": [
+                    {
+                        "connection_id": "123e4567-e89b-12d3-a456-426614174000",
+                        "question": "SELECT * FROM users WHERE age > 25",
+                        "success": False,
+                        "reg_user_id": 1
+                    }
+                ],
+                "updates": [
+                    {
+                        "id": 1,
+                        "response": "SELECT * FROM users WHERE age > 25;",
+                        "success": True,
+                        "end_date": "2024-01-15T10:30:05",
+                        "duration": 5000
+                    }
+                ]
+            }
+        }
+    }
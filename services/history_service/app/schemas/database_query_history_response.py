@@ -29,4 +29,29 @@ class DatabaseQueryHistoryResponse(BaseModel):
                 "reg_user_id": 1
             }
         }
-    } 
\ No newline at end of file
+    }
+
+
+class DatabaseQueryHistorySummaryResponse(BaseModel):
+    """데이터베이스 쿼리 히스토리 목록 요약 응답 (본문은 /{history_id} 상세 조회로 가져옴)"""
+    id: int
+    connection_id: str
+    question_preview: str
+    success: bool
+    reg_date: datetime
+    end_date: Optional[datetime] = None
+    duration: Optional[int] = None
+    model_config = {
+        "from_attributes": True,
+        "json_schema_extra": {
+            "example": {
+                "id": 1,
+                "connection_id": "123e4567-e89b-12d3-a456-426614174000",
+                "question_preview": "SELECT * FROM users WHERE age > 25",
+                "success": True,
+                "reg_date": "2024-01-15T10:30:00",
+                "end_date": "2024-01-15T10:30:05",
+                "duration": 5000
+            }
+        }
+    }
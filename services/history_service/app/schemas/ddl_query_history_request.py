@@ -1,6 +1,7 @@
 from datetime import datetime
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from schemas.common_request import BULK_MAX_ITEMS
 
 
 class DDLQueryHistoryCreateRequest(BaseModel):
@@ -59,4 +60,33 @@ class DDLQueryHistoryDeleteRequest(BaseModel):
                 "id": 1
             }
         }
-    }
\ No newline at end of file
+    }
+
+
+class DDLQueryHistoryBulkRequest(BaseModel):
+    """DDL 쿼리 히스토리 일괄 생성/수정 요청 (하나의 트랜잭션으로 처리)"""
+    creates: List[DDLQueryHistoryCreateRequest] = Field(default_factory=list, max_length=BULK_MAX_ITEMS)
+    updates: List[DDLQueryHistoryUpdateRequest] = Field(default_factory=list, max_length=BULK_MAX_ITEMS)
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "creates": [
+                    {
+                        "session_id": "ddl_session_001",
+                        "ddl": "CREATE TABLE users (id INT PRIMARY KEY, name VARCHAR(100))",
+                        "question": "사용자 테이블을 만들어주세요",
+                        "success": False,
+                        "reg_user_id": 1
+                    }
+                ],
+                "updates": [
+                    {
+                        "id": 1,
+                        "response": "테이블이 성공적으로 생성되었습니다",
+                        "success": True
+                    }
+                ]
+            }
+        }
+    }
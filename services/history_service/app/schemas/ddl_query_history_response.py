@@ -31,4 +31,29 @@ class DDLQueryHistoryResponse(BaseModel):
                 "reg_user_id": 1
             }
         }
-    } 
\ No newline at end of file
+    }
+
+
+class DDLQueryHistorySummaryResponse(BaseModel):
+    """DDL 쿼리 히스토리 목록 요약 응답 (본문은 /{history_id} 상세 조회로 가져옴)"""
+    id: int
+    session_id: str
+    question_preview: str
+    success: bool
+    reg_date: datetime
+    end_date: Optional[datetime] = None
+    duration: Optional[int] = None
+    model_config = {
+        "from_attributes": True,
+        "json_schema_extra": {
+            "example": {
+                "id": 1,
+                "session_id": "ddl_session_001",
+                "question_preview": "사용자 테이블을 만들어주세요",
+                "success": True,
+                "reg_date": "2024-01-15T10:30:00",
+                "end_date": "2024-01-15T10:30:05",
+                "duration": 5000
+            }
+        }
+    }
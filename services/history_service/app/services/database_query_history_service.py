@@ -1,14 +1,31 @@
-from typing import List
+from typing import List, Union
 from crud import database_query_history_crud, ddl_query_history_crud
 from schemas.database_query_history_request import (
     DatabaseQueryHistoryCreateRequest,
     DatabaseQueryHistoryUpdateRequest,
-    DatabaseQueryHistoryDeleteRequest
+    DatabaseQueryHistoryDeleteRequest,
+    DatabaseQueryHistoryBulkRequest
+)
+from schemas.common_request import HistoryListRequest, HistoryCountRequest, HistoryTimelineRequest
+from schemas.database_query_history_response import DatabaseQueryHistoryResponse, DatabaseQueryHistorySummaryResponse
+from schemas.ddl_query_history_response import DDLQueryHistoryResponse, DDLQueryHistorySummaryResponse
+from schemas.common_response import (
+    HistoryListResponse,
+    HistoryPageResponse,
+    HistoryTimelineResponse,
+    DatabaseQueryTimelineItem,
+    DDLQueryTimelineItem,
+    HistoryCountResponse,
+    HistoryBulkResponse
+)
+from utils.pagination import (
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+    split_page,
+    decode_timeline_cursor,
+    encode_timeline_cursor
 )
-from schemas.common_request import HistoryListRequest
-from schemas.database_query_history_response import DatabaseQueryHistoryResponse
-from schemas.ddl_query_history_response import DDLQueryHistoryResponse
-from schemas.common_response import HistoryListResponse
 
 
 # DatabaseQueryHistory Services
@@ -62,36 +79,167 @@ async def get_database_query_history_list_service(
     return [DatabaseQueryHistoryResponse.model_validate(history) for history in histories]
 
 
+async def get_database_query_history_page_service(
+    user_id: int,
+    connection_id: str,
+    cursor: str = None,
+    limit: int = None,
+    summary: bool = False,
+) -> HistoryPageResponse[Union[DatabaseQueryHistoryResponse, DatabaseQueryHistorySummaryResponse]]:
+    """사용자의 데이터베이스 쿼리 히스토리 목록 페이지 조회 서비스 (최신순 keyset 페이지네이션, summary면 요약 응답)"""
+    limit = clamp_page_size(limit)
+    histories = await database_query_history_crud.get_database_query_history_page(
+        user_id=user_id,
+        connection_id=connection_id,
+        success=True,
+        cursor=decode_cursor(cursor),
+        limit=limit,
+        summary=summary
+    )
+    histories, next_cursor, has_more = split_page(histories, limit)
+    item_schema = DatabaseQueryHistorySummaryResponse if summary else DatabaseQueryHistoryResponse
+    return HistoryPageResponse[item_schema](
+        items=[item_schema.model_validate(history) for history in histories],
+        next_cursor=next_cursor,
+        has_more=has_more,
+        limit=limit
+    )
+
+
+async def bulk_database_query_history_service(
+    request: DatabaseQueryHistoryBulkRequest,
+    user_id: int
+) -> HistoryBulkResponse:
+    """데이터베이스 쿼리 히스토리 일괄 생성/수정 서비스"""
+    created_ids, updated_ids = await database_query_history_crud.bulk_write_database_query_history(
+        request.creates,
+        request.updates,
+        user_id
+    )
+    return HistoryBulkResponse.from_results(
+        created_ids,
+        [update.id for update in request.updates],
+        updated_ids
+    )
+
+
 # 통합 히스토리 서비스 (이 파일에 위치)
 async def get_user_history_list_service(
     request: HistoryListRequest
 ) -> HistoryListResponse:
-    """사용자의 전체 히스토리 목록 조회 서비스"""
+    """
+    사용자의 전체 히스토리 목록 조회 서비스
+    유형별로 최신순 limit개씩 keyset 방식으로 조회하며, 다음 페이지는 유형별 cursor로 이어서 조회합니다.
+    """
+    limit = clamp_page_size(request.limit)
+    database_cursor = decode_cursor(request.database_cursor)
+    ddl_cursor = decode_cursor(request.ddl_cursor)
+
     # 각각의 히스토리 조회
-    db_histories = await database_query_history_crud.get_database_query_history_list(
+    db_histories = await database_query_history_crud.get_database_query_history_page(
         user_id=request.user_id,
+        cursor=database_cursor,
+        limit=limit,
+        summary=request.summary
     )
-    
-    ddl_histories = await ddl_query_history_crud.get_ddl_query_history_list(
+    ddl_histories = await ddl_query_history_crud.get_ddl_query_history_page(
         user_id=request.user_id,
+        cursor=ddl_cursor,
+        limit=limit,
+        summary=request.summary
     )
+    db_histories, _, db_has_more = split_page(db_histories, limit)
+    ddl_histories, _, ddl_has_more = split_page(ddl_histories, limit)
     
-    # 전체 개수 조회
-    db_count = await database_query_history_crud.get_database_query_history_count(request.user_id)
-    ddl_count = await ddl_query_history_crud.get_ddl_query_history_count(request.user_id)
+    # 전체 개수 조회 (유형별 COUNT를 한 번의 쿼리로)
+    db_count, ddl_count = await database_query_history_crud.get_user_history_counts(request.user_id)
     total_count = db_count + ddl_count
     
     # Response 객체로 변환
+    db_schema = DatabaseQueryHistorySummaryResponse if request.summary else DatabaseQueryHistoryResponse
+    ddl_schema = DDLQueryHistorySummaryResponse if request.summary else DDLQueryHistoryResponse
     db_history_responses = [
-        DatabaseQueryHistoryResponse.model_validate(history) for history in db_histories
+        db_schema.model_validate(history) for history in db_histories
     ]
     
     ddl_history_responses = [
-        DDLQueryHistoryResponse.model_validate(history) for history in ddl_histories
+        ddl_schema.model_validate(history) for history in ddl_histories
     ]
     
     return HistoryListResponse(
         total_count=total_count,
         database_query_histories=db_history_responses,
-        ddl_query_histories=ddl_history_responses
-    ) 
\ No newline at end of file
+        ddl_query_histories=ddl_history_responses,
+        # 한쪽 유형이 먼저 끝나도 다음 요청에서 처음부터 다시 조회되지 않도록 마지막 위치를 유지
+        database_next_cursor=last_cursor(db_histories, request.database_cursor),
+        ddl_next_cursor=last_cursor(ddl_histories, request.ddl_cursor),
+        database_has_more=db_has_more,
+        ddl_has_more=ddl_has_more,
+        has_more=db_has_more or ddl_has_more
+    )
+
+
+def last_cursor(histories: list, current_cursor: str = None) -> str:
+    """조회한 마지막 행의 cursor, 조회된 행이 없으면 요청한 cursor를 그대로 반환"""
+    if not histories:
+        return current_cursor
+    return encode_cursor(histories[-1].reg_date, histories[-1].id)
+
+
+async def get_user_history_count_service(
+    request: HistoryCountRequest
+) -> HistoryCountResponse:
+    """사용자의 히스토리 유형별 개수 조회 서비스"""
+    db_count, ddl_count = await database_query_history_crud.get_user_history_counts(
+        user_id=request.user_id,
+        connection_id=request.connection_id,
+        ddl_session_id=request.ddl_session_id,
+        start_date=request.start_date,
+        end_date=request.end_date
+    )
+    return HistoryCountResponse(
+        total_count=db_count + ddl_count,
+        database_query_count=db_count,
+        ddl_query_count=ddl_count
+    )
+
+
+async def get_user_history_timeline_service(
+    request: HistoryTimelineRequest
+) -> HistoryTimelineResponse:
+    """
+    사용자의 통합 히스토리 타임라인 조회 서비스 (UNION ALL 단일 쿼리, (reg_date, id, history_type) keyset 페이지네이션)
+    전체 개수는 인덱스만으로 집계하는 /all/count로 조회합니다.
+    """
+    limit = clamp_page_size(request.limit)
+    rows = await database_query_history_crud.get_user_history_timeline(
+        user_id=request.user_id,
+        limit=limit,
+        cursor=decode_timeline_cursor(request.cursor),
+        history_type=request.history_type
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_timeline_cursor(rows[-1].reg_date, rows[-1].id, rows[-1].history_type) if has_more else None
+
+    return HistoryTimelineResponse(
+        items=[to_timeline_item(row) for row in rows],
+        next_cursor=next_cursor,
+        has_more=has_more,
+        limit=limit
+    )
+
+
+def to_timeline_item(row) -> Union[DatabaseQueryTimelineItem, DDLQueryTimelineItem]:
+    """타임라인 쿼리 행을 유형별 항목으로 변환 (scope_id는 유형에 따라 connection_id/session_id)"""
+    fields = {
+        "id": row.id,
+        "question_preview": row.question_preview,
+        "success": row.success,
+        "reg_date": row.reg_date,
+        "end_date": row.end_date,
+        "duration": row.duration,
+    }
+    if row.history_type == "database":
+        return DatabaseQueryTimelineItem(connection_id=row.scope_id, **fields)
+    return DDLQueryTimelineItem(session_id=row.scope_id, **fields)
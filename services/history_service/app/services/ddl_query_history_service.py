@@ -1,11 +1,14 @@
-from typing import List
+from typing import List, Union
 from crud import ddl_query_history_crud
 from schemas.ddl_query_history_request import (
     DDLQueryHistoryCreateRequest,
     DDLQueryHistoryUpdateRequest,
-    DDLQueryHistoryDeleteRequest
+    DDLQueryHistoryDeleteRequest,
+    DDLQueryHistoryBulkRequest
 )
-from schemas.ddl_query_history_response import DDLQueryHistoryResponse
+from schemas.ddl_query_history_response import DDLQueryHistoryResponse, DDLQueryHistorySummaryResponse
+from schemas.common_response import HistoryPageResponse, HistoryBulkResponse
+from utils.pagination import clamp_page_size, decode_cursor, split_page
 
 
 # DDLQueryHistory Services
@@ -56,4 +59,47 @@ async def get_ddl_query_history_list_service(
         user_id=user_id,
         ddl_session_id=ddl_session_id,
     )
-    return [DDLQueryHistoryResponse.model_validate(history) for history in histories] 
\ No newline at end of file
+    return [DDLQueryHistoryResponse.model_validate(history) for history in histories]
+
+
+async def get_ddl_query_history_page_service(
+    user_id: int,
+    ddl_session_id: str,
+    cursor: str = None,
+    limit: int = None,
+    summary: bool = False,
+) -> HistoryPageResponse[Union[DDLQueryHistoryResponse, DDLQueryHistorySummaryResponse]]:
+    """사용자의 DDL 쿼리 히스토리 목록 페이지 조회 서비스 (최신순 keyset 페이지네이션, summary면 요약 응답)"""
+    limit = clamp_page_size(limit)
+    histories = await ddl_query_history_crud.get_ddl_query_history_page(
+        user_id=user_id,
+        ddl_session_id=ddl_session_id,
+        cursor=decode_cursor(cursor),
+        limit=limit,
+        summary=summary
+    )
+    histories, next_cursor, has_more = split_page(histories, limit)
+    item_schema = DDLQueryHistorySummaryResponse if summary else DDLQueryHistoryResponse
+    return HistoryPageResponse[item_schema](
+        items=[item_schema.model_validate(history) for history in histories],
+        next_cursor=next_cursor,
+        has_more=has_more,
+        limit=limit
+    )
+
+
+async def bulk_ddl_query_history_service(
+    request: DDLQueryHistoryBulkRequest,
+    user_id: int
+) -> HistoryBulkResponse:
+    """DDL 쿼리 히스토리 일괄 생성/수정 서비스"""
+    created_ids, updated_ids = await ddl_query_history_crud.bulk_write_ddl_query_history(
+        request.creates,
+        request.updates,
+        user_id
+    )
+    return HistoryBulkResponse.from_results(
+        created_ids,
+        [update.id for update in request.updates],
+        updated_ids
+    )
@@ -0,0 +1,94 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Tuple
+from sqlalchemy import Select, and_, or_
+
+# 페이지 크기 기본값/상한
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+class HistoryCursor(NamedTuple):
+    """keyset 페이지네이션 위치 (마지막으로 반환한 행의 reg_date, id)"""
+    reg_date: datetime
+    id: int
+
+
+def encode_cursor(reg_date: datetime, history_id: int) -> str:
+    raw = f"{reg_date.isoformat()}|{history_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[HistoryCursor]:
+    """클라이언트가 보낸 cursor를 해석합니다. 비어 있으면 첫 페이지(None)"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        reg_date, history_id = raw.rsplit("|", 1)
+        return HistoryCursor(datetime.fromisoformat(reg_date), int(history_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+class TimelineCursor(NamedTuple):
+    """통합 타임라인 keyset 위치 (마지막으로 반환한 행의 reg_date, id, history_type)"""
+    reg_date: datetime
+    id: int
+    history_type: str
+
+
+TIMELINE_HISTORY_TYPES = ("database", "ddl")
+
+
+def encode_timeline_cursor(reg_date: datetime, history_id: int, history_type: str) -> str:
+    raw = f"{reg_date.isoformat()}|{history_id}|{history_type}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_timeline_cursor(cursor: Optional[str]) -> Optional[TimelineCursor]:
+    """타임라인 cursor를 해석합니다. 비어 있으면 첫 페이지(None)"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        reg_date, history_id, history_type = raw.rsplit("|", 2)
+        if history_type not in TIMELINE_HISTORY_TYPES:
+            raise ValueError(f"unknown history_type: {history_type}")
+        return TimelineCursor(datetime.fromisoformat(reg_date), int(history_id), history_type)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+def clamp_page_size(limit: Optional[int]) -> int:
+    if not limit or limit < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def apply_keyset(query: Select, model, cursor: Optional[HistoryCursor], limit: int) -> Select:
+    """
+    (reg_date, id) 내림차순 keyset 조건을 적용합니다.
+    has_more 판단을 위해 limit보다 한 행 더 조회합니다.
+    """
+    if cursor is not None:
+        query = query.where(
+            or_(
+                model.reg_date < cursor.reg_date,
+                and_(model.reg_date == cursor.reg_date, model.id < cursor.id)
+            )
+        )
+    return query.order_by(model.reg_date.desc(), model.id.desc()).limit(limit + 1)
+
+
+def split_page(rows: list, limit: int) -> Tuple[List, Optional[str], bool]:
+    """limit + 1개로 조회한 결과를 (페이지 행, 다음 cursor, has_more)로 나눕니다."""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1].reg_date, rows[-1].id) if has_more else None
+    return rows, next_cursor, has_more
@@ -1,15 +1,28 @@
-from typing import List
+import hmac
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Header
 
 from fastapi.responses import JSONResponse, StreamingResponse
 from common.schemas.http import SuccessResponse, ErrorResponse
 from common.util.http_util import get_current_user_id, get_trace_info
-from schemas.request import NL2SQLRequest
+from schemas.request import NL2SQLRequest, EngineInvalidateRequest, SchemaRefreshRequest
 from services import nl2sql_service
+from db.engine_registry import engine_registry
+from utils.schema_cache import schema_cache
+from core.config import settings
 import asyncio
 
 router = APIRouter()
 
+
+def verify_internal_token(x_internal_token: Optional[str] = Header(default=None)):
+    """서비스 간 내부 API 호출 검증 (INTERNAL_API_TOKEN이 비어 있으면 모두 거부)"""
+    expected = settings.INTERNAL_API_TOKEN
+    if not expected or not x_internal_token or not hmac.compare_digest(
+        x_internal_token.encode("utf-8"), expected.encode("utf-8")
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+
 @router.post("query")
 async def nl2sql(
     request: NL2SQLRequest,
@@ -30,4 +43,26 @@ async def nl2sql_query_stream(
         request=request,
         user_id=user_id,
         trace_info=trace_info
-    )
\ No newline at end of file
+    )
+
+@router.post("/engine/invalidate", dependencies=[Depends(verify_internal_token)])
+async def invalidate_engine(request: EngineInvalidateRequest):
+    """연결 정보 수정/삭제 시 connection_service가 호출하여 캐시된 엔진을 정리"""
+    disposed = await engine_registry.invalidate(request.connection_id)
+    schema_cache.invalidate(request.connection_id)
+    return SuccessResponse(data={"connection_id": request.connection_id, "disposed": disposed})
+
+
+@router.post("/schema/refresh")
+async def refresh_schema(
+    request: SchemaRefreshRequest,
+    user_id: int = Depends(get_current_user_id),
+    trace_info: str = Depends(get_trace_info)
+):
+    """연결의 스키마 스냅샷 강제 갱신 (DDL 변경 직후 등)"""
+    response = await nl2sql_service.refresh_schema_service(
+        connection_id=request.connection_id,
+        user_id=user_id,
+        trace_info=trace_info
+    )
+    return SuccessResponse(data=response)
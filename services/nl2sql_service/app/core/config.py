@@ -27,5 +27,52 @@ class Settings(BaseSettings):
     DDL_SESSION_SERVICE_URL: str
     HISTORY_SERVICE_URL: str
 
+    # 서비스 간 내부 API(/engine/invalidate) 호출용 공유 토큰 (X-Internal-Token 헤더, 비어 있으면 내부 API 거부)
+    INTERNAL_API_TOKEN: str = ""
+
+    # 내부 서비스 호출용 공유 HTTP 커넥션 풀 설정
+    HTTP_POOL_LIMIT: int = 100
+    HTTP_POOL_LIMIT_PER_HOST: int = 30
+    HTTP_KEEPALIVE_TIMEOUT: float = 30.0
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_READ_TIMEOUT: float = 30.0
+
+    # Gemini 스트리밍 호출 설정 (read timeout은 청크 간 최대 대기 시간)
+    GEMINI_MODEL: str = "gemini-2.5-flash"
+    GEMINI_POOL_LIMIT: int = 50
+    GEMINI_READ_TIMEOUT: float = 120.0
+
+    # 대상 데이터베이스 엔진 레지스트리 설정
+    ENGINE_REGISTRY_MAX_ENGINES: int = 50
+    ENGINE_POOL_SIZE: int = 2
+    ENGINE_MAX_OVERFLOW: int = 3
+    ENGINE_POOL_RECYCLE: int = 1800
+    ENGINE_IDLE_TIMEOUT: float = 600.0
+
+    # 스키마 스냅샷 캐시 설정 (fresh 이내는 그대로 사용, stale 이내는 사용 후 백그라운드 재검증)
+    SCHEMA_CACHE_MAX_ENTRIES: int = 200
+    SCHEMA_CACHE_FRESH_SECONDS: float = 30.0
+    SCHEMA_CACHE_STALE_SECONDS: float = 600.0
+
+    # 프롬프트 스키마 축소 설정 (전체 스키마가 예산을 넘을 때만 관련 테이블만 사용)
+    SCHEMA_PRUNING_ENABLED: bool = True
+    SCHEMA_PROMPT_TOKEN_BUDGET: int = 8000
+
+    # 같은 질문/스키마에 대한 응답 캐시 설정 (0이면 비활성화)
+    ANSWER_CACHE_MAX_ENTRIES: int = 1000
+    ANSWER_CACHE_TTL_SECONDS: float = 3600.0
+
+    # 동일 요청 병합 시 생성 결과 replay 버퍼 상한 (넘치면 새 합류를 막고 뒤처진 구독자를 끊음)
+    SINGLEFLIGHT_MAX_BUFFER_BYTES: int = 1048576
+
+    # 스트림 종료 후 결과 저장(write-behind) 큐 설정
+    WRITE_BEHIND_MAX_QUEUE: int = 1000
+    WRITE_BEHIND_BATCH_SIZE: int = 20
+    WRITE_BEHIND_MAX_RETRIES: int = 3
+    WRITE_BEHIND_RETRY_BACKOFF: float = 0.5
+    WRITE_BEHIND_FLUSH_TIMEOUT: float = 10.0
+    # 일괄 처리 group 작업이 저장할 항목을 만드는 데(히스토리 생성 대기 등) 기다리는 최대 시간, 넘으면 재시도
+    WRITE_BEHIND_PREPARE_TIMEOUT: float = 5.0
+
 
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,218 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from core.config import settings
+from common.core.logger import Logger
+
+logger = Logger.getLogger(__name__)
+
+# 지원하는 데이터베이스 타입 -> SQLAlchemy 드라이버
+DRIVERS = {
+    "mysql": "mysql+asyncmy",
+}
+
+
+class EngineEntry:
+    def __init__(self, connection_id: str, fingerprint: str, engine: AsyncEngine):
+        self.connection_id = connection_id
+        self.fingerprint = fingerprint
+        self.engine = engine
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+
+
+class EngineRegistry:
+    """
+    대상 데이터베이스별 AsyncEngine 레지스트리
+    - 키는 (connection_id, 접속 정보 fingerprint)이므로 접속 정보가 바뀌면 새 엔진을 사용
+    - 최대 엔진 수를 넘으면 가장 오래 사용되지 않은 엔진부터 dispose (LRU)
+    - idle_timeout 동안 사용되지 않은 엔진은 백그라운드 태스크가 dispose
+    - 워커 프로세스 단위 레지스트리이므로 invalidate는 호출을 받은 워커에만 즉시 반영되고,
+      다른 워커의 이전 엔진은 fingerprint 불일치로 더 이상 사용되지 않다가 idle 정리됨
+    """
+
+    def __init__(
+        self,
+        max_engines: int,
+        pool_size: int,
+        max_overflow: int,
+        pool_recycle: int,
+        idle_timeout: float
+    ):
+        self.max_engines = max_engines
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_recycle = pool_recycle
+        self.idle_timeout = idle_timeout
+        self._entries: OrderedDict[tuple[str, str], EngineEntry] = OrderedDict()
+        self._sweeper: Optional[asyncio.Task] = None
+        self._disposals: set[asyncio.Task] = set()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.idle_disposals = 0
+        self.invalidations = 0
+
+    def get_engine(self, connection_info: dict) -> AsyncEngine:
+        """
+        접속 정보에 해당하는 엔진을 반환합니다. 없으면 생성합니다.
+
+        Args:
+            connection_info: connection_service /get 응답의 data
+        """
+        connection_id = str(connection_info["id"])
+        fingerprint = self.credential_fingerprint(connection_info)
+        key = (connection_id, fingerprint)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.last_used_at = time.monotonic()
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.engine
+
+        self.misses += 1
+        # 같은 연결의 이전 접속 정보로 만든 엔진은 더 이상 사용하지 않음
+        self._discard(lambda e: e.connection_id == connection_id)
+
+        engine = create_async_engine(
+            self._build_url(connection_info),
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_recycle=self.pool_recycle,
+            pool_pre_ping=True
+        )
+        self._entries[key] = EngineEntry(connection_id, fingerprint, engine)
+        logger.info(f"Engine created for connection_id={connection_id} (engines={len(self._entries)})")
+
+        while len(self._entries) > self.max_engines:
+            _, oldest = self._entries.popitem(last=False)
+            self._dispose(oldest)
+            self.evictions += 1
+
+        return engine
+
+    async def invalidate(self, connection_id: str) -> int:
+        """연결 정보 수정/삭제 시 해당 연결의 엔진을 모두 dispose합니다."""
+        disposed = self._discard(lambda e: e.connection_id == str(connection_id))
+        self.invalidations += disposed
+        if disposed:
+            logger.info(f"Engine invalidated for connection_id={connection_id}")
+        return disposed
+
+    async def dispose_idle(self) -> int:
+        now = time.monotonic()
+        disposed = self._discard(lambda e: now - e.last_used_at >= self.idle_timeout)
+        self.idle_disposals += disposed
+        return disposed
+
+    async def start(self):
+        if self._sweeper is None and self.idle_timeout > 0:
+            self._sweeper = asyncio.create_task(self._sweep_idle())
+
+    async def close(self):
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+        entries = list(self._entries.values())
+        self._entries.clear()
+        for entry in entries:
+            await entry.engine.dispose()
+        # 교체/제거되며 백그라운드에서 진행 중인 dispose도 끝날 때까지 대기
+        if self._disposals:
+            await asyncio.gather(*self._disposals, return_exceptions=True)
+
+    def stats(self) -> dict:
+        """엔진 수와 엔진별 커넥션 사용 현황을 반환합니다."""
+        lookups = self.hits + self.misses
+        engines = {}
+        checked_out = 0
+        for entry in self._entries.values():
+            pool = entry.engine.pool
+            engines[entry.connection_id] = {
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "idle_seconds": round(time.monotonic() - entry.last_used_at, 1),
+            }
+            checked_out += pool.checkedout()
+        return {
+            "open_engines": len(self._entries),
+            "max_engines": self.max_engines,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "checked_out": checked_out,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "idle_disposals": self.idle_disposals,
+            "invalidations": self.invalidations,
+            "pending_disposals": len(self._disposals),
+            "engines": engines,
+        }
+
+    async def _sweep_idle(self):
+        interval = max(1.0, self.idle_timeout / 4)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.dispose_idle()
+            except Exception as e:
+                logger.error(f"Idle engine disposal failed: {e}")
+
+    def _discard(self, predicate) -> int:
+        keys = [key for key, entry in self._entries.items() if predicate(entry)]
+        for key in keys:
+            self._dispose(self._entries.pop(key))
+        return len(keys)
+
+    def _dispose(self, entry: EngineEntry):
+        # 사용 중인 커넥션은 반환될 때 닫히고, 풀에 남은 커넥션은 백그라운드에서 정리
+        # 태스크가 GC로 사라지지 않도록 참조를 들고 있다가 끝나면 제거
+        task = asyncio.create_task(entry.engine.dispose())
+        self._disposals.add(task)
+        task.add_done_callback(lambda done: self._on_disposed(entry, done))
+
+    def _on_disposed(self, entry: EngineEntry, task: asyncio.Task):
+        self._disposals.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Engine disposal failed: connection_id={entry.connection_id}, error={task.exception()}")
+
+    @staticmethod
+    def _build_url(connection_info: dict) -> URL:
+        database_type = connection_info["database_type"].lower()
+        driver = DRIVERS.get(database_type)
+        if driver is None:
+            raise ValueError(f"지원하지 않는 데이터베이스 타입: {connection_info['database_type']}")
+        return URL.create(
+            driver,
+            username=connection_info["database_username"],
+            password=connection_info["database_password"],
+            host=connection_info["database_host"],
+            port=connection_info["database_port"],
+            database=connection_info["database_name"]
+        )
+
+    @staticmethod
+    def credential_fingerprint(connection_info: dict) -> str:
+        fields = (
+            "database_type", "database_host", "database_port",
+            "database_username", "database_password", "database_name"
+        )
+        raw = "\x1f".join(str(connection_info.get(field)) for field in fields)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# 싱글톤 패턴으로 엔진 레지스트리 인스턴스 생성
+engine_registry = EngineRegistry(
+    max_engines=settings.ENGINE_REGISTRY_MAX_ENGINES,
+    pool_size=settings.ENGINE_POOL_SIZE,
+    max_overflow=settings.ENGINE_MAX_OVERFLOW,
+    pool_recycle=settings.ENGINE_POOL_RECYCLE,
+    idle_timeout=settings.ENGINE_IDLE_TIMEOUT
+)
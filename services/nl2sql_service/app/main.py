@@ -8,6 +8,12 @@ if PROFILE == "local":
 
 from common.core.middleware.tracer import Tracer
 from api.nl2sql_router import router as nl2sql_router
+from utils.http_client.base import http_session_pool, gemini_session_pool
+from db.engine_registry import engine_registry
+from utils.schema_cache import schema_cache
+from utils.answer_cache import answer_cache
+from utils.singleflight import generation_flight
+from utils.write_behind import write_behind_queue
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -17,7 +23,16 @@ ic.configureOutput(includeContext=True)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    await http_session_pool.start()
+    await gemini_session_pool.start()
+    await engine_registry.start()
+    await write_behind_queue.start()
     yield
+    # 남은 결과 저장 작업은 HTTP 세션 풀을 닫기 전에 처리
+    await write_behind_queue.close()
+    await http_session_pool.close()
+    await gemini_session_pool.close()
+    await engine_registry.close()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -36,5 +51,21 @@ app.add_middleware(Tracer)
 async def health_check():
     return {"status": "ok"}
 
+@app.get("/metrics")
+async def metrics():
+    """내부 지표 조회 엔드포인트 (워커 프로세스 단위)"""
+    return {
+        "pid": os.getpid(),
+        "http_pools": {
+            http_session_pool.name: http_session_pool.stats(),
+            gemini_session_pool.name: gemini_session_pool.stats()
+        },
+        "engines": engine_registry.stats(),
+        "schema_cache": schema_cache.stats(),
+        "answer_cache": answer_cache.stats(),
+        "singleflight": generation_flight.stats(),
+        "write_behind": write_behind_queue.stats()
+    }
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8083, reload=True)
\ No newline at end of file
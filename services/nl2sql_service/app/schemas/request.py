@@ -8,6 +8,10 @@ class NL2SQLRequest(BaseModel):
     ddl_schema: str | None = None
     ddl_session_id: str | None = None
     is_streaming: bool = True
+    # True면 스키마 축소 없이 전체 스키마를 프롬프트에 사용
+    full_schema: bool = False
+    # True면 응답 캐시를 사용하지 않고 새로 생성 (생성 결과는 캐시에 저장)
+    bypass_cache: bool = False
 
     @model_validator(mode='after')
     def validate_query_mode(self) -> 'NL2SQLRequest':
@@ -26,3 +30,12 @@ class NL2SQLRequest(BaseModel):
             raise ValueError("connection_id가 없는 경우 ddl_schema가 필요합니다.")
         
         return self
+
+
+
+class EngineInvalidateRequest(BaseModel):
+    connection_id: str
+
+
+class SchemaRefreshRequest(BaseModel):
+    connection_id: str
@@ -1,18 +1,23 @@
+import asyncio
 from datetime import datetime
 from common.core.logger import Logger
 from schemas.request import NL2SQLRequest
-import aiohttp
 import json
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from core.config import settings
 from utils.http_client.connection_api import ConnectionClient
 from utils.http_client.ddl_session_api import DDLSessionClient
 from utils.http_client.history_api import HistoryClient
+from utils.http_client.base import gemini_session_pool
 from icecream import ic
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import text
-from utils.nl2sql_utils import get_nl2sql_prompt, RequestType
+from utils.schema_cache import schema_cache, SchemaSnapshot
+from utils.schema_pruning import prune_schema, estimate_tokens
+from utils.answer_cache import answer_cache, build_answer_key
+from utils.singleflight import generation_flight
+from utils.stage_timer import StageTimer
+from utils.write_behind import write_behind_queue
+from utils.nl2sql_utils import get_nl2sql_prompt, RequestType, PROMPT_VERSION
 logger = Logger.getLogger(__name__)
 
 
@@ -23,91 +28,132 @@ async def get_connection_info(connection_id: int, user_id: int, trace_info: str)
         return connection_info
 
 
-async def get_database_schema(connection_info: dict):
+async def get_database_schema(connection_info: dict, refresh: bool = False) -> SchemaSnapshot:
     """
-    Connection info를 기반으로 데이터베이스 스키마를 조회합니다.
+    Connection info를 기반으로 데이터베이스 스키마 스냅샷을 조회합니다.
     database_table 값이 있으면 해당 테이블의 스키마만, 없으면 전체 데이터베이스 스키마를 조회합니다.
+    스키마가 바뀌지 않았으면 캐시된 스냅샷을 재사용합니다.
     """
     try:
-        data = connection_info['data']
-        
-        # 데이터베이스 연결 URL 생성
-        if data['database_type'].lower() == 'mysql':
-            db_url = (
-                f"mysql+asyncmy://"
-                f"{data['database_username']}:"
-                f"{data['database_password']}@"
-                f"{data['database_host']}:"
-                f"{data['database_port']}/"
-                f"{data['database_name']}"
-            )
-        else:
-            raise ValueError(f"지원하지 않는 데이터베이스 타입: {data['database_type']}")
-        
-        # 비동기 엔진 생성
-        engine = create_async_engine(db_url, pool_pre_ping=True)
-        SessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-        
-        async with SessionLocal() as session:
-            schema_info = {}
-            
-            # database_table 값이 있는지 확인
-            database_table = data.get('database_table')
-            
-            if database_table and database_table.strip():
-                # 특정 테이블의 스키마만 조회
-                # ic(f"특정 테이블 '{database_table}' 스키마 조회")
-                schema_info[database_table] = await get_table_schema(session, database_table)
-            else:
-                # 전체 데이터베이스의 모든 테이블 스키마 조회
-                # ic("전체 데이터베이스 스키마 조회")
-                
-                # 모든 테이블 목록 조회
-                result = await session.execute(text("SHOW TABLES"))
-                tables = [row[0] for row in result.fetchall()]
-                
-                # 각 테이블의 스키마 조회
-                for table_name in tables:
-                    schema_info[table_name] = await get_table_schema(session, table_name)
-        
-        await engine.dispose()
-        return schema_info
-        
+        return await schema_cache.get(connection_info['data'], refresh=refresh)
     except Exception as e:
         logger.error(f"데이터베이스 스키마 조회 중 오류 발생: {str(e)}")
         raise
 
 
-async def get_table_schema(session: AsyncSession, table_name: str):
+async def stream_gemini(prompt: str):
     """
-    특정 테이블의 스키마 정보를 조회합니다.
+    Gemini 스트리밍 응답의 텍스트 조각을 순서대로 반환합니다.
+    SSE 프레이밍을 유지하기 위해 줄바꿈은 <NL>로 치환합니다.
     """
+    # 요청마다 세션을 만들지 않고 Gemini 전용 공유 세션 풀 사용
+    session = gemini_session_pool.get_session()
+    url = f"https://generativelanguage.googleapis.com/v1beta/models/{settings.GEMINI_MODEL}:streamGenerateContent?alt=sse"
+    headers = {
+        "x-goog-api-key": settings.GOOGLE_GEMINI_API_KEY,
+        "Content-Type": "application/json"
+    }
+    data = {
+        "contents": [
+            {
+                "parts": [
+                    {
+                        "text": prompt
+                    }
+                ]
+            }
+        ]
+    }
+    async with session.post(url, headers=headers, json=data) as response:
+        async for line in response.content:
+            decoded_line = line.decode('utf-8')
+            if decoded_line.startswith('data: '):
+                try:
+                    data = json.loads(decoded_line[6:])
+                    raw_text = data['candidates'][0]['content']['parts'][0]['text']
+                except (ValueError, KeyError, IndexError, TypeError):
+                    continue
+                text = raw_text.replace('\n', '<NL>')
+                logger.debug(f"text: {text}")
+                # 소비자 종료(GeneratorExit)를 삼키지 않도록 yield는 try 밖에서 실행
+                yield text
+
+
+def get_prompt_schema(schema_snapshot: SchemaSnapshot, request: NL2SQLRequest) -> str:
+    """
+    프롬프트에 넣을 스키마 텍스트를 반환합니다.
+    스키마 축소가 켜져 있고 full_schema 요청이 아니면 질문과 관련된 테이블만 토큰 예산 안에서 남깁니다.
+    """
+    if not settings.SCHEMA_PRUNING_ENABLED or request.full_schema:
+        return schema_snapshot.schema_text
+
+    schema_text = prune_schema(
+        schema_snapshot.schema_info,
+        request.query,
+        settings.SCHEMA_PROMPT_TOKEN_BUDGET,
+        index=schema_snapshot.index,
+        schema_text=schema_snapshot.schema_text
+    )
+    if schema_text is not schema_snapshot.schema_text:
+        logger.info(
+            f"스키마 축소: {estimate_tokens(schema_snapshot.schema_text)} -> {estimate_tokens(schema_text)} tokens "
+            f"(tables={len(schema_snapshot.schema_info)})"
+        )
+    return schema_text
+
+
+async def create_database_history(request: NL2SQLRequest, user_id: int, trace_info: str):
+    async with HistoryClient(user_id, trace_info) as history_client:
+        return await history_client.create_database_query_history(
+            connection_id=request.connection_id, 
+            question=request.query
+        )
+
+
+async def create_ddl_history(request: NL2SQLRequest, user_id: int, trace_info: str):
+    """DDL 세션을 확인(없으면 생성)한 뒤 DDL 쿼리 히스토리를 생성합니다."""
+    async with DDLSessionClient(user_id, trace_info) as ddl_client:
+        # 세션이 존재하는지 확인
+        ddl_session = await ddl_client.get_session(request.ddl_session_id)
+        ic(ddl_session)
+        if not ddl_session['data']:
+            # 세션이 없으면 새로 생성
+            ddl_session = await ddl_client.create_session("새로운 DDL 세션", request.ddl_session_id)
+            if ddl_session:
+                ic(f"새 DDL 세션 생성: {ddl_session['data']['id']}")
+            else:
+                logger.warning(f"DDL 세션 생성 실패: session_id={request.ddl_session_id}")
+        else:
+            ic(f"기존 DDL 세션 사용: {ddl_session['data']['id']}")
+
+    async with HistoryClient(user_id, trace_info) as history_client:
+        return await history_client.create_ddl_query_history(
+            session_id=ddl_session['data']['id'], 
+            ddl=request.ddl_schema, 
+            question=request.query
+        )
+
+
+async def get_history_id(history_task: asyncio.Task):
+    """사전 작업으로 실행한 히스토리 생성 결과에서 history_id를 꺼냅니다. 실패하면 None"""
     try:
-        # 테이블 컬럼 정보 조회
-        result = await session.execute(text(f"DESCRIBE `{table_name}`"))
-        columns = result.fetchall()
-        
-        schema = []
-        for column in columns:
-            schema.append({
-                'field': column[0],      # Field
-                'type': column[1],       # Type
-                'null': column[2],       # Null
-                'key': column[3],        # Key
-                'default': column[4],    # Default
-                'extra': column[5]       # Extra
-            })
-        
-        return schema
-        
+        # 기다리는 쪽이 취소되어도(write-behind 항목 준비 시간 초과 등) 히스토리 생성은 계속 진행
+        history_response = await asyncio.shield(history_task)
     except Exception as e:
-        logger.error(f"테이블 '{table_name}' 스키마 조회 중 오류 발생: {str(e)}")
-        return []
+        logger.error(f"히스토리 생성 실패: {e}")
+        return None
+    return history_response['data']['id'] if history_response else None
 
 
 async def nl2sql_service(request: NL2SQLRequest, user_id: int, trace_info: str):
-
-    history_response = None
+    """
+    NL2SQL 스트리밍 응답을 생성합니다.
+    첫 토큰 전에 필요한 작업만 순서대로 기다리고, 서로 의존하지 않는 작업은 동시에 실행합니다.
+    - DB: 연결 조회 -> (스키마 조회 || 히스토리 생성), 스키마 -> 프롬프트 -> LLM 호출
+    - DDL: (세션 확인/생성 -> 히스토리 생성) || 프롬프트 -> LLM 호출
+    히스토리 ID는 스트림이 끝난 뒤 결과를 저장할 때만 필요하므로 첫 토큰을 기다리게 하지 않습니다.
+    """
+    timer = StageTimer(f"nl2sql trace={trace_info.get('x-trace-id')}")
 
     if request.connection_id:
         request_type = RequestType.DATABASE
@@ -119,105 +165,209 @@ async def nl2sql_service(request: NL2SQLRequest, user_id: int, trace_info: str):
     # 스키마 정보 가져오기
     if request_type == RequestType.DATABASE:
         # 데이터베이스 연결 기반 쿼리
-        connection_info = await get_connection_info(connection_id=request.connection_id, user_id=user_id, trace_info=trace_info)
-        schema_info = await get_database_schema(connection_info)
-
-        async with HistoryClient(user_id, trace_info) as history_client:
-            history_response = await history_client.create_database_query_history(
-                connection_id=request.connection_id, 
-                question=request.query
+        connection_info = await timer.measure(
+            "connection",
+            get_connection_info(connection_id=request.connection_id, user_id=user_id, trace_info=trace_info)
+        )
+        history_task = asyncio.create_task(
+            timer.measure("history_create", create_database_history(request, user_id, trace_info))
+        )
+        try:
+            schema_snapshot = await timer.measure("schema", get_database_schema(connection_info))
+        except Exception as e:
+            error_message = str(e)
+            submit_history_result(
+                request_type, history_task, user_id, trace_info,
+                success=False, error_message=error_message, end_date=datetime.now().isoformat()
             )
+            raise
+        schema_info = get_prompt_schema(schema_snapshot, request)
         # ic("데이터베이스 스키마:", schema_info)
     else:
-        # DDL 스키마 기반 쿼리ㄴ
+        # DDL 스키마 기반 쿼리
         schema_info = request.ddl_schema
-        # ic("DDL 스키마:", schema_info)
-        
-        # DDL 기반 쿼리일 때 세션 처리
-        async with DDLSessionClient(user_id, trace_info) as ddl_client:
-            # 세션이 존재하는지 확인
-            ddl_session = await ddl_client.get_session(request.ddl_session_id)
-            ic(ddl_session)
-            if not ddl_session['data']:
-                # 세션이 없으면 새로 생성
-                ddl_session = await ddl_client.create_session("새로운 DDL 세션", request.ddl_session_id)
-                if ddl_session:
-                    ic(f"새 DDL 세션 생성: {ddl_session['data']['id']}")
-                else:
-                    logger.warning(f"DDL 세션 생성 실패: session_id={request.ddl_session_id}")
-            else:
-                ic(f"기존 DDL 세션 사용: {ddl_session['data']['id']}")
-
-        async with HistoryClient(user_id, trace_info) as history_client:
-            history_response = await history_client.create_ddl_query_history(
-                session_id=ddl_session['data']['id'], 
-                ddl=request.ddl_schema, 
-                question=request.query
-            )
+        history_task = asyncio.create_task(
+            timer.measure("ddl_session_history_create", create_ddl_history(request, user_id, trace_info))
+        )
 
-    history_id = history_response['data']['id'] if history_response else None
     prompt = get_nl2sql_prompt(schema_info, request.query)
     # ic(prompt)
+    answer_key = build_answer_key(request.query, schema_info, settings.GEMINI_MODEL, PROMPT_VERSION)
+
+    cached_chunks = None
+    if request.bypass_cache:
+        answer_cache.record_bypass()
+    else:
+        cached_chunks = answer_cache.get(answer_key)
+    timer.mark("preflight")
+
+    result_submitted = False
+
+    def submit_result(**fields):
+        """히스토리 결과 저장은 요청당 한 번만 응답 경로 밖(write-behind 큐)에 넣음"""
+        nonlocal result_submitted
+        if result_submitted:
+            return
+        result_submitted = True
+        submit_history_result(request_type, history_task, user_id, trace_info, **fields)
+
+    async def abort_history_result():
+        """응답 본문이 끝까지 전송되지 않았으면 실패로 기록 (스트림을 한 번도 읽지 않은 경우 포함)"""
+        submit_result(success=False, error_message="응답 스트림이 중단되었습니다.", end_date=datetime.now().isoformat())
+
     async def nl2sql_streamer():
-        async with aiohttp.ClientSession() as session:
-            url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:streamGenerateContent?alt=sse"
-            headers = {
-                "x-goog-api-key": settings.GOOGLE_GEMINI_API_KEY,
-                "Content-Type": "application/json"
-            }
-            data = {
-                "contents": [
-                    {
-                        "parts": [
-                            {
-                                "text": prompt
-                            }
-                        ]
-                    }
-                ]
-            }
-            total_text = ""
-            start_time = datetime.now()
-            duration = 0
-            async with session.post(url, headers=headers, json=data) as response:
-                async for line in response.content:
-                    decoded_line = line.decode('utf-8')
-                    if decoded_line.startswith('data: '):
-                        try:
-                            data = json.loads(decoded_line[6:])
-                            raw_text = data['candidates'][0]['content']['parts'][0]['text']
-                            text = raw_text.replace('\n', '<NL>')
-                            total_text += text
-                            print(f"text: {text}")
-                            yield f"data: {text}\n\n"
-                        except:
-                            pass
-                duration = int((datetime.now() - start_time).total_seconds() * 1000)  # 밀리초 단위로 변환
-            
-            total_text = total_text.replace('<NL>', '\n')
-                
-            if request_type == RequestType.DDL:
-                async with DDLSessionClient(user_id, trace_info) as ddl_client:
-                    await ddl_client.update_session_title(request.ddl_session_id, request.query)
-            
-            if history_id:
-                if request_type == RequestType.DATABASE:
-                    async with HistoryClient(user_id, trace_info) as history_client:
-                        await history_client.update_database_query_history(
-                            history_id=history_id,
-                            response=total_text,
-                            success=True,
-                            end_date=datetime.now().isoformat(),
-                            duration=duration
-                        )
-                else:
-                    async with HistoryClient(user_id, trace_info) as history_client:
-                        await history_client.update_ddl_query_history(
-                            history_id=history_id,
-                            response=total_text,
-                            success=True,
-                            end_date=datetime.now().isoformat(),
-                            duration=duration
-                        )
-
-    return StreamingResponse(content=nl2sql_streamer(), media_type="text/event-stream")
\ No newline at end of file
+        chunks = []
+        start_time = datetime.now()
+        try:
+            if cached_chunks is not None:
+                # 같은 질문/스키마의 이전 응답을 같은 SSE 프레이밍으로 바로 재생
+                logger.info("응답 캐시 적중")
+                source = iter_chunks(cached_chunks)
+            else:
+                # 같은 질문/스키마로 진행 중인 생성이 있으면 합류하여 결과를 공유
+                # 본문을 읽기 시작할 때 구독하므로 응답이 전송되지 않으면 구독도 남지 않음
+                source = generation_flight.consume(generation_flight.acquire(answer_key, lambda: stream_gemini(prompt)))
+
+            async for text in source:
+                if not chunks:
+                    timer.mark("first_token")
+                    timer.log()
+                chunks.append(text)
+                yield f"data: {text}\n\n"
+        except Exception as e:
+            submit_result(success=False, error_message=str(e), end_date=datetime.now().isoformat())
+            raise
+        finally:
+            if not chunks:
+                timer.log()
+        if cached_chunks is None:
+            answer_cache.set(answer_key, chunks)
+        duration = int((datetime.now() - start_time).total_seconds() * 1000)  # 밀리초 단위로 변환
+        
+        total_text = "".join(chunks)
+        total_text = total_text.replace('<NL>', '\n')
+        end_date = datetime.now().isoformat()
+
+        # 결과 저장은 응답 경로 밖(write-behind 큐)에서 처리
+        if request_type == RequestType.DDL:
+            write_behind_queue.submit(
+                "ddl_session_title",
+                lambda: update_ddl_session_title(request.ddl_session_id, request.query, user_id, trace_info)
+            )
+        submit_result(response=total_text, success=True, end_date=end_date, duration=duration)
+
+    return StreamingResponse(
+        content=nl2sql_streamer(),
+        media_type="text/event-stream",
+        background=BackgroundTask(abort_history_result)
+    )
+
+
+async def iter_chunks(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def update_ddl_session_title(ddl_session_id: str, title: str, user_id: int, trace_info: str):
+    """DDL 세션 제목을 마지막 질문으로 갱신합니다. 실패하면 예외를 던져 재시도하게 합니다."""
+    async with DDLSessionClient(user_id, trace_info) as ddl_client:
+        result = await ddl_client.update_session_title(ddl_session_id, title)
+    if result is None:
+        raise RuntimeError(f"DDL 세션 제목 업데이트 실패: session_id={ddl_session_id}")
+
+
+async def prepare_history_result(
+    history_task: asyncio.Task,
+    user_id: int,
+    trace_info: str,
+    **fields
+):
+    """
+    사전 작업으로 생성한 히스토리에 기록할 결과 항목을 만듭니다.
+    히스토리 생성이 실패했으면 기록할 대상이 없으므로 None을 반환해 건너뜁니다.
+    """
+    history_id = await get_history_id(history_task)
+    if not history_id:
+        return None
+    return {"user_id": user_id, "trace_info": trace_info, "update": {"id": history_id, **fields}}
+
+
+async def save_history_results(request_type: RequestType, items: list[dict]) -> list:
+    """
+    write-behind 배치에 모인 히스토리 결과를 사용자별 bulk API 호출로 기록하고 항목별 성공 여부를 원래 순서대로 반환합니다.
+    history 서비스는 요청 헤더 사용자의 히스토리만 수정하므로 배치를 사용자별로 나눠 동시에 호출하고,
+    한 사용자의 호출이 실패하면 그 사용자의 항목만 예외로 표시해 재시도합니다.
+    """
+    indexes_by_user: dict[int, list[int]] = {}
+    for index, item in enumerate(items):
+        indexes_by_user.setdefault(item["user_id"], []).append(index)
+
+    outcomes = await asyncio.gather(
+        *(_save_user_history_results(request_type, [items[index] for index in indexes])
+          for indexes in indexes_by_user.values()),
+        return_exceptions=True
+    )
+    results: list = [False] * len(items)
+    for indexes, outcome in zip(indexes_by_user.values(), outcomes):
+        if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+            raise outcome
+        for position, index in enumerate(indexes):
+            results[index] = outcome if isinstance(outcome, Exception) else outcome[position]
+    return results
+
+
+async def _save_user_history_results(request_type: RequestType, items: list[dict]) -> list[bool]:
+    """한 사용자의 히스토리 결과를 bulk API 한 번으로 기록합니다."""
+    async with HistoryClient(items[0]["user_id"], items[0]["trace_info"]) as history_client:
+        updates = [item["update"] for item in items]
+        if request_type == RequestType.DATABASE:
+            result = await history_client.bulk_database_query_history(updates=updates)
+        else:
+            result = await history_client.bulk_ddl_query_history(updates=updates)
+    if result is None:
+        raise RuntimeError(
+            f"히스토리 결과 일괄 저장 실패: type={request_type.value}, user_id={items[0]['user_id']}, count={len(items)}"
+        )
+    succeeded = {
+        item_result["index"] for item_result in result["data"]["results"]
+        if item_result["operation"] == "update" and item_result["success"]
+    }
+    return [index in succeeded for index in range(len(items))]
+
+
+def submit_history_result(
+    request_type: RequestType,
+    history_task: asyncio.Task,
+    user_id: int,
+    trace_info: str,
+    **fields
+):
+    """히스토리 결과 저장을 write-behind 큐에 넣습니다. 같은 배치의 결과는 유형별로 모아 한 번에 저장됩니다."""
+    group = f"{request_type.value}_history_result"
+    write_behind_queue.submit(
+        group,
+        lambda: prepare_history_result(history_task, user_id, trace_info, **fields),
+        group=group
+    )
+
+
+async def refresh_schema_service(connection_id: str, user_id: int, trace_info: str):
+    """연결의 스키마 스냅샷을 강제로 다시 조회합니다."""
+    connection_info = await get_connection_info(connection_id=connection_id, user_id=user_id, trace_info=trace_info)
+    schema_snapshot = await get_database_schema(connection_info, refresh=True)
+    return {
+        "connection_id": connection_id,
+        "fingerprint": schema_snapshot.fingerprint,
+        "tables": len(schema_snapshot.schema_info)
+    }
+
+
+# 히스토리 결과는 write-behind 배치마다 유형별 bulk API 한 번으로 저장
+write_behind_queue.register_batch_handler(
+    f"{RequestType.DATABASE.value}_history_result",
+    lambda items: save_history_results(RequestType.DATABASE, items)
+)
+write_behind_queue.register_batch_handler(
+    f"{RequestType.DDL.value}_history_result",
+    lambda items: save_history_results(RequestType.DDL, items)
+)
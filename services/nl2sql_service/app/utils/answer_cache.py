@@ -0,0 +1,108 @@
+import hashlib
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Optional
+from core.config import settings
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """
+    캐시 키용 질문 정규화
+    공백을 하나로 합치고 끝의 문장부호를 제거합니다. 값 비교에 영향을 줄 수 있어 대소문자는 유지합니다.
+    """
+    question = unicodedata.normalize("NFKC", question)
+    question = WHITESPACE_PATTERN.sub(" ", question).strip()
+    return question.rstrip("?.!;。？！ ")
+
+
+def schema_fingerprint(schema_text: str) -> str:
+    """프롬프트에 실제로 들어가는 스키마 텍스트의 fingerprint"""
+    return hashlib.sha256(schema_text.encode("utf-8")).hexdigest()
+
+
+def build_answer_key(question: str, schema_text: str, model: str, prompt_version: str) -> str:
+    raw = "\x1f".join((normalize_question(question), schema_fingerprint(schema_text), model, prompt_version))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class AnswerCache:
+    """
+    NL2SQL 응답 캐시 (TTL + LRU)
+    키는 (정규화된 질문, 스키마 fingerprint, 모델, 프롬프트 버전)의 해시이고,
+    값은 스트리밍 때 전송한 청크 목록이므로 같은 SSE 프레이밍으로 재생할 수 있습니다.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (chunks, expire_at(monotonic))
+        self._entries: OrderedDict[str, tuple[tuple[str, ...], float]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: str) -> Optional[tuple[str, ...]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        chunks, expire_at = entry
+        if expire_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return chunks
+
+    def set(self, key: str, chunks: list[str]):
+        if not self.enabled or not chunks:
+            return
+
+        self._entries[key] = (tuple(chunks), time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def record_bypass(self):
+        self.bypasses += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+# 싱글톤 패턴으로 응답 캐시 인스턴스 생성
+answer_cache = AnswerCache(
+    max_entries=settings.ANSWER_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.ANSWER_CACHE_TTL_SECONDS
+)
@@ -1,19 +1,207 @@
+import time
 import aiohttp
+from typing import Optional
+from yarl import URL
+from core.config import settings
+from common.core.logger import Logger
+
+logger = Logger.getLogger(__name__)
+
+
+class TargetStats:
+    """대상(host:port)별 요청 지표"""
 
-class AsyncHTTPClient:
     def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "avg_latency_ms": round(self.total_latency / self.requests * 1000, 2) if self.requests else 0.0,
+            "max_latency_ms": round(self.max_latency * 1000, 2),
+        }
+
+
+class HTTPSessionPool:
+    """
+    프로세스 수명 동안 재사용하는 aiohttp ClientSession
+    - lifespan에서 start/close하며, 시작 전에 사용되면 지연 생성
+    - 커넥터 단위 전체/호스트별 커넥션 수 제한과 keep-alive 적용
+    - 커넥션 생성/재사용/풀 대기 시간은 TraceConfig로 수집
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limit: int,
+        limit_per_host: int,
+        keepalive_timeout: float,
+        timeout: aiohttp.ClientTimeout
+    ):
+        self.name = name
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.session: Optional[aiohttp.ClientSession] = None
+
+        self.targets: dict[str, TargetStats] = {}
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.pool_waits = 0
+        self.total_pool_wait = 0.0
+        self.max_pool_wait = 0.0
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(self._on_queued_start)
+        trace_config.on_connection_queued_end.append(self._on_queued_end)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout,
+            trace_configs=[trace_config]
+        )
+
+    async def start(self):
+        if self.session is None or self.session.closed:
+            self.session = self._create_session()
+            logger.info(
+                f"HTTP session pool started: {self.name} "
+                f"(limit={self.limit}, limit_per_host={self.limit_per_host}, keepalive={self.keepalive_timeout}s)"
+            )
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+            logger.info(f"HTTP session pool closed: {self.name}")
+        self.session = None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """공유 세션을 반환합니다. lifespan 밖(스크립트 등)에서 호출되면 지연 생성합니다."""
+        if self.session is None or self.session.closed:
+            self.session = self._create_session()
+        return self.session
+
+    def get_target_stats(self, url) -> TargetStats:
+        target = URL(str(url))
+        key = f"{target.host}:{target.port}"
+        stats = self.targets.get(key)
+        if stats is None:
+            stats = self.targets[key] = TargetStats()
+        return stats
+
+    def stats(self) -> dict:
+        connector = self.session.connector if self.session is not None and not self.session.closed else None
+        return {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "keepalive_timeout": self.keepalive_timeout,
+            "open": connector is not None,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "pool_waits": self.pool_waits,
+            "avg_pool_wait_ms": round(self.total_pool_wait / self.pool_waits * 1000, 2) if self.pool_waits else 0.0,
+            "max_pool_wait_ms": round(self.max_pool_wait * 1000, 2),
+            "targets": {key: stats.to_dict() for key, stats in self.targets.items()},
+        }
+
+    async def _on_queued_start(self, session, context, params):
+        context.queued_at = time.perf_counter()
+
+    async def _on_queued_end(self, session, context, params):
+        pool_wait = time.perf_counter() - context.queued_at
+        self.pool_waits += 1
+        self.total_pool_wait += pool_wait
+        self.max_pool_wait = max(self.max_pool_wait, pool_wait)
+
+    async def _on_connection_create_end(self, session, context, params):
+        self.connections_created += 1
+
+    async def _on_connection_reuseconn(self, session, context, params):
+        self.connections_reused += 1
+
+
+# 싱글톤 패턴으로 내부 서비스(connection/ddl_session/history) 호출용 세션 풀 생성
+http_session_pool = HTTPSessionPool(
+    name="internal",
+    limit=settings.HTTP_POOL_LIMIT,
+    limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+    keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+    timeout=aiohttp.ClientTimeout(
+        total=None,
+        connect=settings.HTTP_CONNECT_TIMEOUT,
+        sock_read=settings.HTTP_READ_TIMEOUT
+    )
+)
+
+# LLM 스트리밍 호출용 세션 풀 (청크 간 대기가 길 수 있어 read timeout을 별도로 둠)
+gemini_session_pool = HTTPSessionPool(
+    name="gemini",
+    limit=settings.GEMINI_POOL_LIMIT,
+    limit_per_host=settings.GEMINI_POOL_LIMIT,
+    keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+    timeout=aiohttp.ClientTimeout(
+        total=None,
+        connect=settings.HTTP_CONNECT_TIMEOUT,
+        sock_read=settings.GEMINI_READ_TIMEOUT
+    )
+)
+
+
+class AsyncHTTPClient:
+    """
+    내부 서비스 호출 클라이언트 기반 클래스
+    공유 세션 풀을 사용하므로 async with 블록을 벗어나도 세션/커넥션은 닫지 않습니다.
+    """
+
+    def __init__(self, pool: HTTPSessionPool = http_session_pool):
+        self.pool = pool
         self.session = None
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=None))
+        self.session = self.pool.get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        self.session = None
+
+    async def _request(self, method: str, url, headers=None, **kwargs) -> aiohttp.ClientResponse:
+        """
+        요청을 보내고 본문을 모두 읽은 뒤 응답을 반환합니다.
+        본문을 읽으면 커넥션이 즉시 풀로 반환되고, 반환된 응답의 json()/text()는 읽어 둔 본문을 사용합니다.
+        """
+        stats = self.pool.get_target_stats(url)
+        stats.requests += 1
+        stats.in_flight += 1
+        started_at = time.perf_counter()
+        try:
+            async with self.session.request(method, url, headers=headers, **kwargs) as response:
+                await response.read()
+                return response
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            latency = time.perf_counter() - started_at
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
 
     async def _get(self, url, headers=None, **kwargs):
-        return await self.session.get(url, headers=headers, **kwargs)
+        return await self._request("GET", url, headers=headers, **kwargs)
 
     async def _post(self, url, headers=None, **kwargs):
-        return await self.session.post(url, headers=headers, **kwargs)
\ No newline at end of file
+        return await self._request("POST", url, headers=headers, **kwargs)
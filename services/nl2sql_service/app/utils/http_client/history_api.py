@@ -53,6 +53,23 @@ class HistoryClient(AsyncHTTPClient):
             return await response.json()
         return None
 
+    async def get_database_query_history_page(self, connection_id: str, cursor: str = None, limit: int = None, summary: bool = False):
+        """데이터베이스 쿼리 히스토리 목록 페이지 조회 (최신순, 응답의 next_cursor를 다음 호출의 cursor로 전달, summary면 본문 제외)"""
+        headers = {
+            "x-user-id": str(self.user_id),
+            **self.trace_info
+        }
+        params = {"connection_id": connection_id, "summary": str(summary).lower()}
+        if cursor:
+            params["cursor"] = cursor
+        if limit:
+            params["limit"] = limit
+        url = f"{self.history_url}/database-query/page"
+        response = await self._get(url, headers=headers, params=params)
+        if response.status == 200:
+            return await response.json()
+        return None
+
     async def get_database_query_history(self, history_id: int):
         """데이터베이스 쿼리 히스토리 조회"""
         headers = {
@@ -157,6 +174,23 @@ class HistoryClient(AsyncHTTPClient):
             return await response.json()
         return None
 
+    async def get_ddl_query_history_page(self, ddl_session_id: str, cursor: str = None, limit: int = None, summary: bool = False):
+        """DDL 쿼리 히스토리 목록 페이지 조회 (최신순, 응답의 next_cursor를 다음 호출의 cursor로 전달, summary면 본문 제외)"""
+        headers = {
+            "x-user-id": str(self.user_id),
+            **self.trace_info
+        }
+        params = {"ddl_session_id": ddl_session_id, "summary": str(summary).lower()}
+        if cursor:
+            params["cursor"] = cursor
+        if limit:
+            params["limit"] = limit
+        url = f"{self.history_url}/ddl-query/page"
+        response = await self._get(url, headers=headers, params=params)
+        if response.status == 200:
+            return await response.json()
+        return None
+
     async def get_ddl_query_history(self, history_id: int):
         """DDL 쿼리 히스토리 조회"""
         headers = {
@@ -220,9 +254,50 @@ class HistoryClient(AsyncHTTPClient):
             return await response.json()
         return None
 
+    # 일괄 처리 메서드 (생성/수정을 한 번의 요청, 하나의 트랜잭션으로 처리)
+    async def bulk_database_query_history(self, creates: list[dict] = None, updates: list[dict] = None):
+        """
+        데이터베이스 쿼리 히스토리 일괄 생성/수정
+        creates 항목은 create_database_query_history, updates 항목은 update_database_query_history의 본문과 같은 형식입니다.
+        응답의 results에 항목별 성공 여부와 id가 담깁니다.
+        """
+        return await self._bulk("database-query", creates, updates)
+
+    async def bulk_ddl_query_history(self, creates: list[dict] = None, updates: list[dict] = None):
+        """DDL 쿼리 히스토리 일괄 생성/수정 (항목 형식은 단건 create/update와 동일)"""
+        return await self._bulk("ddl-query", creates, updates)
+
+    async def _bulk(self, history_path: str, creates: list[dict] = None, updates: list[dict] = None):
+        headers = {
+            "x-user-id": str(self.user_id),
+            "Content-Type": "application/json",
+            **self.trace_info
+        }
+        data = {
+            "creates": [{"reg_user_id": self.user_id, **item} for item in creates or []],
+            "updates": updates or []
+        }
+        url = f"{self.history_url}/{history_path}/bulk"
+        response = await self._post(url, headers=headers, json=data)
+        if response.status == 200:
+            return await response.json()
+        ic(await response.text())
+        return None
+
     # 통합 히스토리 메서드
-    async def get_user_history_list(self, page: int = 1, size: int = 10, history_type: str = None):
-        """사용자의 전체 히스토리 목록 조회 (데이터베이스 + DDL)"""
+    async def get_user_history_list(
+        self,
+        page: int = 1,
+        size: int = 10,
+        history_type: str = None,
+        database_cursor: str = None,
+        ddl_cursor: str = None,
+        summary: bool = False
+    ):
+        """
+        사용자의 전체 히스토리 목록 조회 (데이터베이스 + DDL)
+        유형별로 최대 size개씩 반환하며, 다음 페이지는 응답의 database_next_cursor/ddl_next_cursor를 전달해 조회합니다.
+        """
         headers = {
             "x-user-id": str(self.user_id),
             "Content-Type": "application/json",
@@ -232,10 +307,39 @@ class HistoryClient(AsyncHTTPClient):
             "user_id": self.user_id,
             "page": page,
             "size": size,
-            "history_type": history_type
+            "limit": size,
+            "history_type": history_type,
+            "database_cursor": database_cursor,
+            "ddl_cursor": ddl_cursor,
+            "summary": summary
         }
         url = f"{self.history_url}/database-query/all/list"
         response = await self._post(url, headers=headers, json=data)
         if response.status == 200:
             return await response.json()
-        return None 
\ No newline at end of file
+        return None
+
+    async def get_user_history_count(
+        self,
+        connection_id: str = None,
+        ddl_session_id: str = None,
+        start_date: str = None,
+        end_date: str = None
+    ):
+        """사용자의 히스토리 유형별 개수 조회 (connection_id는 데이터베이스, ddl_session_id는 DDL 히스토리에만 적용)"""
+        headers = {
+            "x-user-id": str(self.user_id),
+            "Content-Type": "application/json",
+            **self.trace_info
+        }
+        data = {
+            "connection_id": connection_id,
+            "ddl_session_id": ddl_session_id,
+            "start_date": start_date,
+            "end_date": end_date
+        }
+        url = f"{self.history_url}/database-query/all/count"
+        response = await self._post(url, headers=headers, json=data)
+        if response.status == 200:
+            return await response.json()
+        return None
@@ -1,6 +1,9 @@
 from typing import Union, Dict, Any
 from enum import Enum
 
+# 프롬프트 템플릿을 바꾸면 올려서 이전 응답 캐시를 사용하지 않도록 함
+PROMPT_VERSION = "v1"
+
 class RequestType(Enum):
     DATABASE = "database"
     DDL = "ddl"
@@ -40,6 +43,10 @@ def format_schema_info(schema_info: Union[str, Dict[str, Any]]) -> str:
                 if column['extra']:
                     column_def += f" {column['extra']}"
                 
+                if column.get('references'):
+                    ref_table, ref_column = column['references'].split('.', 1)
+                    column_def += f" REFERENCES {ref_table}({ref_column})"
+                
                 column_definitions.append(column_def)
             
             schema_text += ",\n".join(column_definitions)
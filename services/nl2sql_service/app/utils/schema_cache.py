@@ -0,0 +1,198 @@
+import asyncio
+import time
+from collections import OrderedDict
+from functools import cached_property
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.config import settings
+from db.engine_registry import engine_registry
+from utils.nl2sql_utils import format_schema_info
+from utils.schema_introspection import introspect_schema, get_schema_fingerprint
+from utils.schema_pruning import SchemaIndex
+from common.core.logger import Logger
+
+logger = Logger.getLogger(__name__)
+
+
+class SchemaSnapshot:
+    """연결 하나의 스키마 조회 결과와 프롬프트용 텍스트"""
+
+    def __init__(self, source: str, fingerprint: str, schema_info: dict):
+        self.source = source
+        self.fingerprint = fingerprint
+        self.schema_info = schema_info
+        self.schema_text = format_schema_info(schema_info)
+        self.created_at = time.monotonic()
+        self.checked_at = self.created_at
+
+    @cached_property
+    def index(self) -> SchemaIndex:
+        """스키마 축소용 검색 인덱스 (스냅샷당 한 번만 생성)"""
+        return SchemaIndex(self.schema_info)
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+    @property
+    def since_checked(self) -> float:
+        return time.monotonic() - self.checked_at
+
+
+class SchemaSnapshotCache:
+    """
+    connection_id별 스키마 스냅샷 캐시
+    - 마지막 확인 후 fresh_seconds 이내: 그대로 사용
+    - stale_seconds 이내: 기존 스냅샷을 바로 반환하고 백그라운드에서 재검증 (stale-while-revalidate)
+    - 그 이후: fingerprint 쿼리로 변경 여부를 확인한 뒤 변경된 경우에만 스키마를 다시 조회
+    - 같은 연결의 재검증/조회는 하나의 태스크로 합쳐서 실행
+    """
+
+    def __init__(self, max_entries: int, fresh_seconds: float, stale_seconds: float):
+        self.max_entries = max_entries
+        self.fresh_seconds = fresh_seconds
+        self.stale_seconds = stale_seconds
+        self._entries: OrderedDict[str, SchemaSnapshot] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._background: set[asyncio.Task] = set()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.refreshes = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    async def get(self, connection_info: dict, refresh: bool = False) -> SchemaSnapshot:
+        """
+        접속 정보에 해당하는 스키마 스냅샷을 반환합니다.
+
+        Args:
+            connection_info: connection_service /get 응답의 data
+            refresh: True면 fingerprint와 관계없이 스키마를 다시 조회
+        """
+        connection_id = str(connection_info["id"])
+        source = self._source(connection_info)
+        snapshot = self._entries.get(connection_id)
+        if snapshot is not None and snapshot.source != source:
+            # 접속 정보나 대상 테이블이 바뀐 경우
+            self._entries.pop(connection_id, None)
+            snapshot = None
+
+        if snapshot is not None and not refresh:
+            self._entries.move_to_end(connection_id)
+            if snapshot.since_checked < self.fresh_seconds:
+                self.hits += 1
+                return snapshot
+            if snapshot.since_checked < self.stale_seconds:
+                self.stale_hits += 1
+                self._load_in_background(connection_id, connection_info, snapshot)
+                return snapshot
+
+        if refresh:
+            return await self._fetch(connection_info, None)
+
+        if snapshot is None:
+            self.misses += 1
+        return await self._load(connection_id, connection_info, snapshot)
+
+    def invalidate(self, connection_id: str) -> bool:
+        return self._entries.pop(str(connection_id), None) is not None
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "fresh_seconds": self.fresh_seconds,
+            "stale_seconds": self.stale_seconds,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+            "revalidations": self.revalidations,
+            "refreshes": self.refreshes,
+            "evictions": self.evictions,
+            "snapshots": {
+                connection_id: {
+                    "age_seconds": round(snapshot.age, 1),
+                    "checked_seconds_ago": round(snapshot.since_checked, 1),
+                    "tables": len(snapshot.schema_info),
+                }
+                for connection_id, snapshot in self._entries.items()
+            },
+        }
+
+    def _load_in_background(self, connection_id: str, connection_info: dict, snapshot: SchemaSnapshot):
+        if connection_id in self._inflight:
+            return
+
+        async def revalidate():
+            try:
+                await self._load(connection_id, connection_info, snapshot)
+            except Exception as e:
+                logger.warning(f"스키마 스냅샷 재검증 실패: connection_id={connection_id}, error={e}")
+
+        task = asyncio.create_task(revalidate())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _load(self, connection_id: str, connection_info: dict, snapshot: Optional[SchemaSnapshot]) -> SchemaSnapshot:
+        task = self._inflight.get(connection_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch(connection_info, snapshot))
+            self._inflight[connection_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(connection_id, None))
+        return await asyncio.shield(task)
+
+    async def _fetch(self, connection_info: dict, snapshot: Optional[SchemaSnapshot]) -> SchemaSnapshot:
+        connection_id = str(connection_info["id"])
+        table_name = self._table_name(connection_info)
+        engine = engine_registry.get_engine(connection_info)
+
+        async with AsyncSession(engine) as session:
+            fingerprint = await get_schema_fingerprint(session, table_name)
+            if snapshot is not None and snapshot.fingerprint == fingerprint:
+                snapshot.checked_at = time.monotonic()
+                self.revalidations += 1
+                return snapshot
+
+            schema_info = await introspect_schema(session, table_name)
+
+        new_snapshot = SchemaSnapshot(self._source(connection_info), fingerprint, schema_info)
+        if snapshot is not None:
+            self.refreshes += 1
+            logger.info(f"스키마 변경 감지: connection_id={connection_id}")
+        self._store(connection_id, new_snapshot)
+        return new_snapshot
+
+    def _store(self, connection_id: str, snapshot: SchemaSnapshot):
+        if not self.enabled:
+            return
+        self._entries[connection_id] = snapshot
+        self._entries.move_to_end(connection_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @staticmethod
+    def _table_name(connection_info: dict) -> Optional[str]:
+        database_table = connection_info.get("database_table")
+        return database_table.strip() if database_table and database_table.strip() else None
+
+    @classmethod
+    def _source(cls, connection_info: dict) -> str:
+        return f"{engine_registry.credential_fingerprint(connection_info)}:{cls._table_name(connection_info)}"
+
+
+# 싱글톤 패턴으로 스키마 스냅샷 캐시 인스턴스 생성
+schema_cache = SchemaSnapshotCache(
+    max_entries=settings.SCHEMA_CACHE_MAX_ENTRIES,
+    fresh_seconds=settings.SCHEMA_CACHE_FRESH_SECONDS,
+    stale_seconds=settings.SCHEMA_CACHE_STALE_SECONDS
+)
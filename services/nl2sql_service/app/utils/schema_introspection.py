@@ -0,0 +1,106 @@
+from collections import defaultdict
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# DESCRIBE 결과(Field/Type/Null/Key/Default/Extra)와 같은 값을 information_schema에서 한 번에 조회
+COLUMNS_QUERY = """
+SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY, COLUMN_DEFAULT, EXTRA
+FROM information_schema.COLUMNS
+WHERE TABLE_SCHEMA = DATABASE() {table_filter}
+ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+
+FOREIGN_KEYS_QUERY = """
+SELECT TABLE_NAME, COLUMN_NAME, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME
+FROM information_schema.KEY_COLUMN_USAGE
+WHERE TABLE_SCHEMA = DATABASE() AND REFERENCED_TABLE_NAME IS NOT NULL {table_filter}
+"""
+
+# 스키마 변경 감지용 체크섬 (컬럼 정의 + 외래 키). 데이터 변경에는 반응하지 않음
+FINGERPRINT_QUERY = """
+SELECT
+    (SELECT CONCAT(COUNT(*), ':', COALESCE(SUM(CRC32(CONCAT_WS('|',
+        TABLE_NAME, COLUMN_NAME, ORDINAL_POSITION, COLUMN_TYPE, IS_NULLABLE,
+        COLUMN_KEY, IFNULL(COLUMN_DEFAULT, '<null>'), EXTRA))), 0))
+     FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() {table_filter}),
+    (SELECT CONCAT(COUNT(*), ':', COALESCE(SUM(CRC32(CONCAT_WS('|',
+        TABLE_NAME, COLUMN_NAME, REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME))), 0))
+     FROM information_schema.KEY_COLUMN_USAGE
+     WHERE TABLE_SCHEMA = DATABASE() AND REFERENCED_TABLE_NAME IS NOT NULL {table_filter})
+"""
+
+
+def _table_filter(table_name: Optional[str]) -> tuple[str, dict]:
+    if table_name:
+        return "AND TABLE_NAME = :table_name", {"table_name": table_name}
+    return "", {}
+
+
+async def get_schema_fingerprint(session: AsyncSession, table_name: Optional[str] = None) -> str:
+    """
+    스키마 변경 여부 판단용 fingerprint를 쿼리 1번으로 계산합니다.
+    컬럼 정의/외래 키가 바뀌면 값이 달라지며, 행 데이터 변경에는 영향을 받지 않습니다.
+    """
+    table_filter, params = _table_filter(table_name)
+    result = await session.execute(text(FINGERPRINT_QUERY.format(table_filter=table_filter)), params)
+    columns_checksum, foreign_keys_checksum = result.one()
+    return f"{columns_checksum}/{foreign_keys_checksum}"
+
+
+async def introspect_schema(session: AsyncSession, table_name: Optional[str] = None) -> dict[str, list[dict]]:
+    """
+    대상 데이터베이스의 스키마를 information_schema 쿼리 2번으로 조회합니다.
+    SHOW TABLES + 테이블별 DESCRIBE 와 같은 {table: [column]} 구조를 반환하며,
+    외래 키 컬럼에는 'references' 항목("table.column")이 추가됩니다.
+
+    Args:
+        session: 대상 데이터베이스 세션
+        table_name: 지정하면 해당 테이블만 조회
+    """
+    table_filter, params = _table_filter(table_name)
+
+    columns_result = await session.execute(text(COLUMNS_QUERY.format(table_filter=table_filter)), params)
+    column_rows = columns_result.fetchall()
+
+    foreign_keys_result = await session.execute(text(FOREIGN_KEYS_QUERY.format(table_filter=table_filter)), params)
+    references = {
+        (row[0], row[1]): f"{row[2]}.{row[3]}"
+        for row in foreign_keys_result.fetchall()
+    }
+
+    is_mariadb = getattr(session.bind.dialect, "is_mariadb", False)
+    schema_info: dict[str, list[dict]] = defaultdict(list)
+    if table_name:
+        # 존재하지 않는 테이블도 기존처럼 빈 목록으로 반환
+        schema_info[table_name] = []
+
+    for table, field, column_type, nullable, key, default, extra in column_rows:
+        column = {
+            'field': field,
+            'type': column_type,
+            'null': nullable,
+            'key': key,
+            'default': normalize_column_default(default) if is_mariadb else default,
+            'extra': extra
+        }
+        if (table, field) in references:
+            column['references'] = references[(table, field)]
+        schema_info[table].append(column)
+
+    return dict(schema_info)
+
+
+def normalize_column_default(default: Optional[str]) -> Optional[str]:
+    """
+    MariaDB(10.2.7+)의 information_schema.COLUMNS.COLUMN_DEFAULT를 DESCRIBE 값 형식으로 맞춥니다.
+    - 기본값이 없는 nullable 컬럼은 문자열 'NULL'로 조회되므로 None으로 변환
+    - 문자열 리터럴은 따옴표로 감싸져 있으므로 따옴표 제거
+    - current_timestamp() 같은 표현식은 그대로 유지
+    """
+    if default is None or default == "NULL":
+        return None
+    if len(default) >= 2 and default.startswith("'") and default.endswith("'"):
+        return default[1:-1].replace("''", "'").replace("\\\\", "\\")
+    return default
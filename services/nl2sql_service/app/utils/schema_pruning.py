@@ -0,0 +1,144 @@
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+from utils.nl2sql_utils import format_schema_info
+
+TOKEN_PATTERN = re.compile(r"[A-Za-z]+|[0-9]+|[가-힣]+")
+CAMEL_CASE_PATTERN = re.compile(r"(?<=[a-z])(?=[A-Z])")
+
+# 테이블/컬럼 이름 중 어떤 부분에서 나온 단어인지에 따른 가중치 (단어 반복 횟수로 반영)
+TABLE_NAME_WEIGHT = 3
+COLUMN_NAME_WEIGHT = 1
+
+
+def estimate_tokens(text: str) -> int:
+    """프롬프트 토큰 수 근사치 (문자 4개당 1토큰)"""
+    return math.ceil(len(text) / 4)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    식별자/질문을 검색용 단어로 분리합니다.
+    snake_case, camelCase를 나누고 소문자로 변환하며, 끝의 복수형 s를 제거합니다.
+    """
+    tokens = []
+    for word in TOKEN_PATTERN.findall(CAMEL_CASE_PATTERN.sub(" ", text)):
+        word = word.lower()
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+class SchemaIndex:
+    """
+    스키마 스냅샷 하나에 대한 BM25 검색 인덱스
+    테이블 하나를 문서 하나로 보고 테이블 이름/컬럼 이름/참조 테이블 이름을 단어로 사용합니다.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, schema_info: Dict[str, List[dict]]):
+        self.schema_info = schema_info
+        self.documents: Dict[str, Counter] = {}
+        self.column_terms: Dict[str, Dict[str, set]] = {}
+        document_frequency: Counter = Counter()
+
+        for table_name, columns in schema_info.items():
+            terms = Counter({term: TABLE_NAME_WEIGHT for term in tokenize(table_name)})
+            self.column_terms[table_name] = {}
+            for column in columns:
+                column_terms = set(tokenize(column['field']))
+                if column.get('references'):
+                    column_terms.update(tokenize(column['references']))
+                self.column_terms[table_name][column['field']] = column_terms
+                for term in column_terms:
+                    terms[term] += COLUMN_NAME_WEIGHT
+            self.documents[table_name] = terms
+            document_frequency.update(terms.keys())
+
+        self.document_count = len(self.documents)
+        self.average_length = (
+            sum(sum(terms.values()) for terms in self.documents.values()) / self.document_count
+            if self.document_count else 0.0
+        )
+        self.idf = {
+            term: math.log(1 + (self.document_count - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequency.items()
+        }
+
+    def rank_tables(self, question: str) -> List[tuple[str, float]]:
+        """질문과 관련된 테이블을 점수 순으로 반환합니다. 점수가 0인 테이블은 제외합니다."""
+        query_terms = set(tokenize(question))
+        scores = []
+        for table_name, terms in self.documents.items():
+            length = sum(terms.values())
+            score = 0.0
+            for term in query_terms:
+                frequency = terms.get(term)
+                if not frequency:
+                    continue
+                norm = self.K1 * (1 - self.B + self.B * length / self.average_length)
+                score += self.idf[term] * frequency * (self.K1 + 1) / (frequency + norm)
+            if score > 0:
+                scores.append((table_name, score))
+        scores.sort(key=lambda item: item[1], reverse=True)
+        return scores
+
+    def relevant_columns(self, table_name: str, question: str) -> List[dict]:
+        """테이블에서 키 컬럼과 질문에 등장한 컬럼만 남깁니다."""
+        query_terms = set(tokenize(question))
+        return [
+            column for column in self.schema_info[table_name]
+            if column['key'] or column.get('references')
+            or self.column_terms[table_name][column['field']] & query_terms
+        ]
+
+
+def prune_schema(
+    schema_info: Dict[str, List[dict]],
+    question: str,
+    token_budget: int,
+    index: Optional[SchemaIndex] = None,
+    schema_text: Optional[str] = None
+) -> str:
+    """
+    질문과 관련된 테이블만 토큰 예산 안에서 골라 스키마 텍스트를 만듭니다.
+    - 전체 스키마가 예산 안에 들어가면 그대로 반환
+    - 관련 테이블 순으로 추가하고, 선택된 테이블이 참조하는 테이블을 바로 뒤에 추가 (조인 경로 유지)
+    - 테이블 전체가 예산을 넘으면 키 컬럼과 질문에 등장한 컬럼만 남겨 시도
+    - 질문과 일치하는 테이블이 없으면 전체 스키마를 반환 (기존 동작)
+    """
+    schema_text = schema_text if schema_text is not None else format_schema_info(schema_info)
+    if token_budget <= 0 or estimate_tokens(schema_text) <= token_budget:
+        return schema_text
+
+    index = index or SchemaIndex(schema_info)
+    ranked = index.rank_tables(question)
+    if not ranked:
+        return schema_text
+
+    candidates: List[str] = []
+    for table_name, _ in ranked:
+        for name in [table_name] + _referenced_tables(schema_info[table_name]):
+            if name in schema_info and name not in candidates:
+                candidates.append(name)
+
+    parts = []
+    used_tokens = 0
+    for table_name in candidates:
+        table_text = format_schema_info({table_name: schema_info[table_name]})
+        if used_tokens + estimate_tokens(table_text) > token_budget:
+            table_text = format_schema_info({table_name: index.relevant_columns(table_name, question)})
+            if used_tokens + estimate_tokens(table_text) > token_budget:
+                continue
+        parts.append(table_text)
+        used_tokens += estimate_tokens(table_text)
+
+    return "".join(parts) if parts else schema_text
+
+
+def _referenced_tables(columns: List[dict]) -> List[str]:
+    return [column['references'].split('.', 1)[0] for column in columns if column.get('references')]
@@ -0,0 +1,175 @@
+import asyncio
+from typing import AsyncIterator, Callable, Optional
+from core.config import settings
+from common.core.logger import Logger
+
+logger = Logger.getLogger(__name__)
+
+
+class SlowSubscriberError(Exception):
+    """버퍼 상한을 넘도록 뒤처져 공유 생성에서 끊긴 구독자"""
+
+
+class SharedGeneration:
+    """
+    하나의 업스트림 생성 결과를 여러 구독자에게 나눠 주는 공유 버퍼
+    - 생성은 별도 태스크에서 진행되므로 먼저 요청한 클라이언트가 끊겨도 다른 구독자는 계속 받음
+    - 구독자마다 자기 읽기 위치를 가지므로 느린 구독자가 생성이나 다른 구독자를 막지 않음
+    - 중간에 합류한 구독자도 처음 청크부터 받음 (replay 버퍼)
+
+    버퍼는 max_buffer_bytes로 제한합니다. LLM 응답은 보통 수 KB라 대부분 생성이 끝날 때까지 replay가 유지되고,
+    상한을 넘으면 다음과 같이 처리합니다.
+    - 더 이상 처음부터 replay할 수 없으므로 새 요청은 합류시키지 않음 (replayable = False)
+    - 모든 구독자가 이미 읽은 앞부분 청크는 버림
+    - 그래도 상한을 넘으면 가장 뒤처진 구독자부터 끊음 (SlowSubscriberError), 생성은 멈추지 않음
+    """
+
+    def __init__(self, key: str, max_buffer_bytes: int):
+        self.key = key
+        self.max_buffer_bytes = max_buffer_bytes
+        self.chunks: list[str] = []
+        # chunks[0]의 절대 위치 (앞부분을 버린 만큼 증가)
+        self.offset = 0
+        self.buffered_bytes = 0
+        self.replayable = True
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.subscribers = 0
+        self.dropped_subscribers = 0
+        self.condition = asyncio.Condition()
+        self.task: Optional[asyncio.Task] = None
+        self._positions: dict[int, int] = {}
+        self._dropped: set[int] = set()
+        self._next_subscriber = 0
+
+    async def produce(self, source: AsyncIterator[str]):
+        try:
+            async for chunk in source:
+                async with self.condition:
+                    self.chunks.append(chunk)
+                    self.buffered_bytes += len(chunk.encode("utf-8"))
+                    if self.buffered_bytes > self.max_buffer_bytes:
+                        self._shrink()
+                    self.condition.notify_all()
+        except BaseException as e:
+            self.error = e
+            if isinstance(e, asyncio.CancelledError):
+                raise
+        finally:
+            async with self.condition:
+                self.done = True
+                self.condition.notify_all()
+
+    async def subscribe(self) -> AsyncIterator[str]:
+        subscriber = self._next_subscriber
+        self._next_subscriber += 1
+        self._positions[subscriber] = 0
+        try:
+            while True:
+                position = self._positions[subscriber]
+                if subscriber in self._dropped or position < self.offset:
+                    raise SlowSubscriberError(f"구독자가 공유 생성 버퍼 상한({self.max_buffer_bytes} bytes)을 넘도록 뒤처졌습니다.")
+                if position < self.offset + len(self.chunks):
+                    self._positions[subscriber] = position + 1
+                    yield self.chunks[position - self.offset]
+                    continue
+                if self.done:
+                    if self.error is not None:
+                        raise self.error
+                    return
+                async with self.condition:
+                    await self.condition.wait_for(
+                        lambda: subscriber in self._dropped or self._positions[subscriber] < self.offset + len(self.chunks) or self.done
+                    )
+        finally:
+            self._positions.pop(subscriber, None)
+            self._dropped.discard(subscriber)
+
+    def _shrink(self):
+        """버퍼 상한 초과 시 replay를 끄고, 모두 읽은 청크를 버린 뒤에도 넘치면 가장 느린 구독자를 끊음"""
+        self.replayable = False
+        self._trim()
+        end = self.offset + len(self.chunks)
+        while self.buffered_bytes > self.max_buffer_bytes:
+            # 마지막 청크 하나는 모두가 받을 수 있도록 남김
+            active = [(position, subscriber) for subscriber, position in self._positions.items() if subscriber not in self._dropped]
+            slowest = min(active, default=None)
+            if slowest is None or slowest[0] >= end - 1:
+                break
+            self._dropped.add(slowest[1])
+            self.dropped_subscribers += 1
+            logger.warning(f"느린 구독자를 공유 생성에서 끊음: key={self.key}, behind={end - slowest[0]} chunks")
+            self._trim()
+
+    def _trim(self):
+        active = [position for subscriber, position in self._positions.items() if subscriber not in self._dropped]
+        keep_from = min(active, default=self.offset + len(self.chunks))
+        while self.offset < keep_from and self.chunks:
+            self.buffered_bytes -= len(self.chunks.pop(0).encode("utf-8"))
+            self.offset += 1
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 요청을 하나의 업스트림 생성으로 합치는 레지스트리
+    키는 응답 캐시 키(정규화된 질문 + 스키마 fingerprint + 모델/프롬프트 버전)를 사용합니다.
+    모든 구독자가 떠나면 진행 중인 생성을 취소합니다.
+    """
+
+    def __init__(self, max_buffer_bytes: int):
+        self.max_buffer_bytes = max_buffer_bytes
+        self._inflight: dict[str, SharedGeneration] = {}
+        self.leaders = 0
+        self.followers = 0
+        self.dropped_subscribers = 0
+
+    def acquire(self, key: str, factory: Callable[[], AsyncIterator[str]]) -> SharedGeneration:
+        """
+        키에 해당하는 생성이 진행 중이면 합류하고, 없거나 replay할 수 없으면 factory로 새 생성을 바로 시작합니다.
+        반환된 생성은 반드시 consume으로 읽어야 구독이 해제되므로, 응답 본문을 읽기 시작하는 곳에서 호출합니다.
+        """
+        generation = self._inflight.get(key)
+        if generation is None or not generation.replayable:
+            generation = SharedGeneration(key, self.max_buffer_bytes)
+            generation.task = asyncio.create_task(generation.produce(factory()))
+            generation.task.add_done_callback(lambda _: self._remove(generation))
+            self._inflight[key] = generation
+            self.leaders += 1
+        else:
+            self.followers += 1
+            logger.info(f"진행 중인 동일 요청에 합류: subscribers={generation.subscribers + 1}")
+
+        generation.subscribers += 1
+        return generation
+
+    async def consume(self, generation: SharedGeneration) -> AsyncIterator[str]:
+        try:
+            async for chunk in generation.subscribe():
+                yield chunk
+        except SlowSubscriberError:
+            self.dropped_subscribers += 1
+            raise
+        finally:
+            generation.subscribers -= 1
+            if generation.subscribers == 0 and not generation.done:
+                generation.task.cancel()
+
+    def stats(self) -> dict:
+        requests = self.leaders + self.followers
+        return {
+            "inflight": len(self._inflight),
+            "subscribers": sum(generation.subscribers for generation in self._inflight.values()),
+            "generations": self.leaders,
+            "collapsed_requests": self.followers,
+            "collapse_ratio": round(self.followers / requests, 4) if requests else 0.0,
+            "buffered_bytes": sum(generation.buffered_bytes for generation in self._inflight.values()),
+            "dropped_subscribers": self.dropped_subscribers,
+        }
+
+    def _remove(self, generation: SharedGeneration):
+        if self._inflight.get(generation.key) is generation:
+            del self._inflight[generation.key]
+
+
+# 싱글톤 패턴으로 동일 요청 병합 레지스트리 인스턴스 생성
+generation_flight = SingleFlight(max_buffer_bytes=settings.SINGLEFLIGHT_MAX_BUFFER_BYTES)
@@ -0,0 +1,31 @@
+import time
+from typing import Awaitable, TypeVar
+from common.core.logger import Logger
+
+logger = Logger.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class StageTimer:
+    """요청 하나의 단계별 소요 시간 기록 (동시에 실행되는 단계도 각각 측정)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started_at = time.perf_counter()
+        self.stages: dict[str, float] = {}
+
+    async def measure(self, stage: str, awaitable: Awaitable[T]) -> T:
+        started_at = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.stages[stage] = time.perf_counter() - started_at
+
+    def mark(self, stage: str):
+        """요청 시작부터 현재까지의 시간을 기록"""
+        self.stages[stage] = time.perf_counter() - self.started_at
+
+    def log(self):
+        timings = ", ".join(f"{stage}={elapsed * 1000:.1f}ms" for stage, elapsed in self.stages.items())
+        logger.info(f"[{self.name}] stage timings: {timings}")
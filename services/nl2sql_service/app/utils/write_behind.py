@@ -0,0 +1,227 @@
+import asyncio
+from typing import Awaitable, Callable, Optional
+from core.config import settings
+from common.core.logger import Logger
+
+logger = Logger.getLogger(__name__)
+
+
+class WriteBehindJob:
+    def __init__(self, name: str, run: Callable[[], Awaitable], group: Optional[str] = None):
+        self.name = name
+        self.run = run
+        self.group = group
+        self.attempts = 0
+
+
+class WriteBehindQueue:
+    """
+    응답 스트림이 끝난 뒤의 저장 작업(히스토리 결과, DDL 세션 제목)을 응답 경로 밖에서 처리하는 큐
+    - 큐가 가득 차면 새 작업은 버리고 drop 카운터를 올림
+    - 워커는 최대 batch_size개씩 꺼내 동시에 실행
+    - 일괄 처리 핸들러가 등록된 group의 작업은 배치마다 모아 핸들러 한 번으로 저장 (예: 히스토리 bulk API)
+      항목 준비(run)는 prepare_timeout까지만 기다리므로 느린 작업 하나가 배치 전체를 붙잡지 않음
+    - 실패한 작업은 지수 백오프 후 max_retries까지 다시 넣음
+    - 종료 시(lifespan) 남은 작업과 재시도를 flush_timeout 동안 처리
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        batch_size: int,
+        max_retries: int,
+        retry_backoff: float,
+        flush_timeout: float,
+        prepare_timeout: float
+    ):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.flush_timeout = flush_timeout
+        self.prepare_timeout = prepare_timeout
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._retries: set[asyncio.Task] = set()
+        self._closing: Optional[asyncio.Event] = None
+        self._batch_handlers: dict[str, Callable[[list], Awaitable[list[bool]]]] = {}
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.retried = 0
+        self.dropped = 0
+        self.batch_calls = 0
+
+    def register_batch_handler(self, group: str, handler: Callable[[list], Awaitable[list[bool]]]):
+        """
+        group으로 제출한 작업을 배치마다 모아 handler 한 번으로 처리하도록 등록합니다.
+        이 group 작업의 run은 저장할 항목을 만들어 반환하고(저장할 것이 없으면 None, skipped로 집계),
+        prepare_timeout 안에 항목을 만들지 못하면 실패로 보고 재시도합니다.
+        handler는 항목 목록을 받아 같은 순서의 항목별 성공 여부(또는 실패 원인 예외)를 반환합니다. 실패한 항목만 개별로 재시도합니다.
+        """
+        self._batch_handlers[group] = handler
+
+    def submit(self, name: str, run: Callable[[], Awaitable], group: Optional[str] = None) -> bool:
+        """
+        작업을 큐에 넣습니다. 재시도할 수 있도록 코루틴이 아닌 코루틴을 만드는 함수를 받습니다.
+        group을 주면 등록된 일괄 처리 핸들러로 같은 배치의 작업과 함께 저장합니다.
+        큐가 가득 찼거나 종료 중이면 False
+        """
+        self._ensure_started()
+        if self._closing.is_set():
+            self.dropped += 1
+            logger.warning(f"Write-behind queue is closing, dropped job: {name}")
+            return False
+        try:
+            self._queue.put_nowait(WriteBehindJob(name, run, group))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"Write-behind queue is full ({self.max_size}), dropped job: {name}")
+            return False
+        self.submitted += 1
+        return True
+
+    async def start(self):
+        self._ensure_started()
+
+    async def close(self):
+        """새 작업을 받지 않고 남은 작업을 처리한 뒤 워커를 종료합니다."""
+        if self._worker is None:
+            return
+        self._closing.set()
+        try:
+            await asyncio.wait_for(self._drain(), timeout=self.flush_timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Write-behind flush timed out, remaining jobs: {self._queue.qsize()}")
+        self._worker.cancel()
+        self._worker = None
+
+    def stats(self) -> dict:
+        return {
+            "depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_size": self.max_size,
+            "pending_retries": len(self._retries),
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "retried": self.retried,
+            "dropped": self.dropped,
+            "batch_calls": self.batch_calls,
+        }
+
+    def _ensure_started(self):
+        if self._worker is None:
+            self._queue = asyncio.Queue(maxsize=self.max_size)
+            self._closing = asyncio.Event()
+            self._worker = asyncio.create_task(self._run())
+
+    async def _drain(self):
+        # 실행 중인 배치가 끝나야 재시도가 예약되므로 join과 재시도 대기를 번갈아 반복
+        await self._queue.join()
+        while self._retries:
+            await asyncio.gather(*self._retries, return_exceptions=True)
+            await self._queue.join()
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            singles = []
+            groups: dict[str, list[WriteBehindJob]] = {}
+            for job in batch:
+                if job.group in self._batch_handlers:
+                    groups.setdefault(job.group, []).append(job)
+                else:
+                    singles.append(job)
+            await asyncio.gather(
+                *(self._execute(job) for job in singles),
+                *(self._execute_group(group, jobs) for group, jobs in groups.items())
+            )
+            for _ in batch:
+                self._queue.task_done()
+
+    async def _execute(self, job: WriteBehindJob):
+        job.attempts += 1
+        try:
+            await job.run()
+            self.completed += 1
+        except Exception as e:
+            self._fail(job, e)
+
+    async def _execute_group(self, group: str, jobs: list[WriteBehindJob]):
+        """group 작업들의 항목을 만든 뒤 일괄 처리 핸들러를 한 번 호출하고, 실패한 항목만 재시도"""
+        for job in jobs:
+            job.attempts += 1
+        items = await asyncio.gather(*(self._prepare(job) for job in jobs), return_exceptions=True)
+        ready = []
+        for job, item in zip(jobs, items):
+            if isinstance(item, Exception):
+                self._fail(job, item)
+            elif isinstance(item, BaseException):
+                raise item
+            elif item is None:
+                # 저장할 대상이 없음 (예: 히스토리 생성 실패) - 재시도해도 달라지지 않으므로 건너뜀
+                self.skipped += 1
+                logger.warning(f"Write-behind job skipped, nothing to save: {job.name}")
+            else:
+                ready.append((job, item))
+        if not ready:
+            return
+
+        self.batch_calls += 1
+        try:
+            results = await self._batch_handlers[group]([item for _, item in ready])
+        except Exception as e:
+            results = [e] * len(ready)
+        for (job, _), result in zip(ready, results):
+            if result is True:
+                self.completed += 1
+            else:
+                self._fail(job, result if isinstance(result, Exception) else RuntimeError("일괄 처리 항목 실패"))
+
+    async def _prepare(self, job: WriteBehindJob):
+        if self.prepare_timeout <= 0:
+            return await job.run()
+        try:
+            return await asyncio.wait_for(job.run(), timeout=self.prepare_timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"항목 준비 시간 초과 ({self.prepare_timeout}s)")
+
+    def _fail(self, job: WriteBehindJob, e: Exception):
+        if job.attempts > self.max_retries:
+            self.failed += 1
+            logger.error(f"Write-behind job failed after {job.attempts} attempts: {job.name}, error={e}")
+            return
+        delay = self.retry_backoff * (2 ** (job.attempts - 1))
+        logger.warning(f"Write-behind job failed, retrying in {delay:.1f}s: {job.name}, error={e}")
+        task = asyncio.create_task(self._retry_later(job, delay))
+        self._retries.add(task)
+        task.add_done_callback(self._retries.discard)
+
+    async def _retry_later(self, job: WriteBehindJob, delay: float):
+        # 종료 중이면 기다리지 않고 바로 다시 넣음
+        try:
+            await asyncio.wait_for(self._closing.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+        try:
+            self._queue.put_nowait(job)
+            self.retried += 1
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"Write-behind queue is full, dropped retry: {job.name}")
+
+
+# 싱글톤 패턴으로 write-behind 큐 인스턴스 생성
+write_behind_queue = WriteBehindQueue(
+    max_size=settings.WRITE_BEHIND_MAX_QUEUE,
+    batch_size=settings.WRITE_BEHIND_BATCH_SIZE,
+    max_retries=settings.WRITE_BEHIND_MAX_RETRIES,
+    retry_backoff=settings.WRITE_BEHIND_RETRY_BACKOFF,
+    flush_timeout=settings.WRITE_BEHIND_FLUSH_TIMEOUT,
+    prepare_timeout=settings.WRITE_BEHIND_PREPARE_TIMEOUT
+)